@@ -0,0 +1,1109 @@
+"""Benchmarks."""
+
+# -- Imports --
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+
+from factory_package.item_factory import ItemFactory, WeaponFactory
+from generators_package.entity_generator import Player
+from managers_package.debug_manager import Debugger
+
+
+def create_context():
+    """Return a silent debugger and initilised weapon and item factories."""
+    debug = Debugger("benchmark")
+    debug.on = False
+    weapon_factory = WeaponFactory()
+    item_factory = ItemFactory()
+    weapon_factory.initilise_registry()
+    item_factory.initilise_registry()
+    return debug, weapon_factory, item_factory
+
+
+def create_player(debug, weapon_factory, item_factory) -> Player:
+    """Return a fresh player."""
+    return Player(
+        debugger=debug,
+        weapon=weapon_factory.create("fists"),
+        inventory=[item_factory.create("None") for _ in range(2)],
+        level=random.randint(0, 10),
+    )
+
+
+def create_room(debug, weapon_factory, item_factory, enemy_count: int = 4, map_size: int = 11):
+    """Return an activated dungeon room."""
+    from managers_package.room_manager import RoomManager
+
+    room = RoomManager(
+        player=create_player(debug, weapon_factory, item_factory),
+        dungeon_manager=None,
+        debugger=debug,
+        weapon_factory=weapon_factory,
+        item_factory=item_factory,
+        level=0,
+        max_level=2,
+        doors=4,
+        enemy_count=enemy_count,
+        map_size=map_size,
+    )
+    room.activate_room()
+    return room
+
+
+def create_agents(room, count: int) -> list:
+    """Return `count` agents standing on random floor tiles of a room (agents may share a tile)."""
+    from generators_package.entity_generator import Agent
+
+    floor = [
+        (y, x)
+        for y, row in enumerate(room.get_glyphs())
+        for x, tile in enumerate(row)
+        if tile == room.empty_char
+    ]
+    agents = []
+    for i in range(count):
+        agent = Agent(level=random.randint(0, 100), health=random.randint(1, 100), char=f" {i} ")
+        agent.pos = random.choice(floor)
+        agent.direction = random.choice([(-1, 0), (1, 0), (0, -1), (0, 1)])
+        agents.append(agent)
+    return agents
+
+
+def time_per_call(function, repeats: int) -> float:
+    """Return the mean time in seconds of calling `function`."""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        function()
+    return (time.perf_counter() - start) / repeats
+
+
+def print_report(title: str, rows: dict) -> None:
+    """Print a benchmark report."""
+    print(f"-- {title} --")
+    for key, value in rows.items():
+        if isinstance(value, float):
+            value = f"{value:.6f}"
+        print(f"{key}: {value}")
+
+
+# --- Benchmarks ---
+
+
+def benchmark_model_registry(rooms: int = 50):
+    """Report the model load cost and the time to create rooms that share the cached model."""
+    from managers_package.room_manager import RoomManager
+    from nn_package import model_registry
+
+    debug, weapon_factory, item_factory = create_context()
+    model_registry.clear()
+
+    def create_rooms():
+        start = time.perf_counter()
+        for _ in range(rooms):
+            room = RoomManager(
+                player=create_player(debug, weapon_factory, item_factory),
+                dungeon_manager=None,
+                debugger=debug,
+                weapon_factory=weapon_factory,
+                item_factory=item_factory,
+                level=0,
+                max_level=2,
+                doors=4,
+                enemy_count=random.randint(0, 4),
+            )
+            room.entity_manager.model  # Fetched when the first agent moves
+        return time.perf_counter() - start
+
+    first = create_rooms()  # Includes the single load from disk
+    cached = create_rooms()  # Every room reuses the shared model
+    rows = {"rooms": rooms, "first_batch_s": first, "cached_batch_s": cached}
+    for path, stats in model_registry.get_stats().items():
+        rows[f"{path} load_time_s"] = stats["load_time"]
+        rows[f"{path} memory_bytes"] = int(stats["memory"])
+    print_report("Model registry", rows)
+
+
+def benchmark_agent_inference(agent_counts=(1, 4, 16, 64), repeats: int = 200):
+    """Compare per-tick decision latency of the per-agent loop against the batched forward pass."""
+    import torch
+
+    from nn_package import encode_inputs
+
+    debug, weapon_factory, item_factory = create_context()
+    room = create_room(debug, weapon_factory, item_factory)
+    room.entity_manager.decision_cache.size = 0  # Every decision runs the policy, like the per agent loop
+    model = room.entity_manager.model
+
+    def per_agent(agents):  # The previous decision loop, one forward pass per agent
+        for agent in agents:
+            room.get_viewport(agent)
+            output = model(
+                encode_inputs(
+                    sound_grid=room.get_sound_window(agent),
+                    fov_dict=agent.vision,
+                    level_diff=room.entity_manager.player.level - agent.level,
+                    agent_health=agent.health,
+                    allied_agent_count=room.enemy_count,
+                )
+            )
+            int(torch.argmax(output, dim=1).item())
+
+    rows = {}
+    for count in agent_counts:
+        agents = create_agents(room, count)
+        looped = time_per_call(lambda: per_agent(agents), repeats)
+        batched = time_per_call(lambda: room.get_agent_decisions(agents), repeats)
+        rows[f"{count} agents per_agent_ms"] = looped * 1000
+        rows[f"{count} agents batched_ms"] = batched * 1000
+    print_report("Agent inference per tick", rows)
+
+
+def random_encoder_inputs(count: int) -> list[dict]:
+    """Return `count` random keyword argument sets for the feature encoders."""
+    inputs = []
+    for _ in range(count):
+        fov_dict = {(y, 0): random.choice([" _ ", " # ", " P "]) for y in range(random.randint(0, 6))}
+        inputs.append(
+            {
+                "sound_grid": [random.choice([-1, 0.0, random.random()]) for _ in range(9)],
+                "fov_dict": fov_dict,
+                "level_diff": random.randint(-100, 10),
+                "agent_health": random.uniform(-10, 100),
+                "allied_agent_count": random.randint(0, 5),
+            }
+        )
+    return inputs
+
+
+def benchmark_feature_encoder(batch_size: int = 16, batches: int = 500):
+    """Check FeatureSchema matches encode_inputs exactly and compare encodes per second."""
+    import torch
+
+    from nn_package import FeatureSchema, encode_inputs
+
+    inputs = random_encoder_inputs(batch_size)
+    schema = FeatureSchema(capacity=batch_size, backend="torch")
+    schema.reset()
+    for kwargs in inputs:
+        schema.write(**kwargs)
+    expected = torch.cat([encode_inputs(**kwargs) for kwargs in inputs], dim=0)
+    parity = torch.equal(schema.get_batch(), expected)
+
+    def tensors():
+        return torch.cat([encode_inputs(**kwargs) for kwargs in inputs], dim=0)
+
+    def buffer():
+        schema.reset()
+        for kwargs in inputs:
+            schema.write(**kwargs)
+        return schema.get_batch()
+
+    encodes = batch_size * batches
+    print_report(
+        "Feature encoder",
+        {
+            "parity_with_encode_inputs": parity,
+            "encode_inputs_per_s": encodes / (time_per_call(tensors, batches) * batches),
+            "feature_schema_per_s": encodes / (time_per_call(buffer, batches) * batches),
+        },
+    )
+    if not parity:
+        raise AssertionError("FeatureSchema output differs from encode_inputs")
+
+
+BACKEND_PROBE = """
+import json, random, resource, time
+start = time.perf_counter()
+from managers_package.room_manager import RoomManager
+from nn_package import model_registry
+model = model_registry.get("nn_package/enemy_controller.pth")
+startup = time.perf_counter() - start
+row = [[random.uniform(-1, 1) for _ in range(9)] + [1.0, 3.0, 80.0, 2.0]]
+for _ in range(100):
+    model.decide(row)
+start = time.perf_counter()
+for _ in range({repeats}):
+    model.decide(row)
+latency = (time.perf_counter() - start) / {repeats}
+print(json.dumps({{"startup": startup, "latency": latency, "max_rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}}))
+"""  # Run in a fresh interpreter per backend so import time and memory are not shared
+
+
+def benchmark_ai_backends(repeats: int = 5000):
+    """Report startup time, resident memory and per-decision latency of the torch and numpy backends."""
+    rows = {}
+    for backend in ["torch", "numpy"]:
+        result = subprocess.run(
+            [sys.executable, "-c", BACKEND_PROBE.format(repeats=repeats)],
+            env={**os.environ, "RETROGUE_AI_BACKEND": backend},
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            rows[f"{backend} error"] = result.stderr.strip().splitlines()[-1]
+            continue
+        probe = json.loads(result.stdout)
+        rows[f"{backend} startup_s"] = probe["startup"]
+        rows[f"{backend} max_rss_kb"] = probe["max_rss"]
+        rows[f"{backend} decision_us"] = probe["latency"] * 1_000_000
+    print_report("AI backends", rows)
+
+
+def benchmark_compact_policies(examples: int = 2000, repeats: int = 2000):
+    """Compare the full, int8 and distilled student policies on agreement with the full model and score, and decisions per second."""
+    from nn_package import model_registry
+    from nn_package.registry import weight_path
+    from nn_package.scenarios import generate_example
+
+    debug, weapon_factory, item_factory = create_context()
+    data = [generate_example(debug, weapon_factory, item_factory) for _ in range(examples)]
+    features = [row for row, _, _ in data]
+    labels = [label for _, label, _ in data]
+    full_moves = model_registry.get("nn_package/enemy_controller.pth", "numpy").decide(features)
+    variants = {
+        "full": "nn_package/enemy_controller.pth",
+        "student": "nn_package/enemy_student.pth",
+    }
+    rows = {"examples": examples}
+    for variant, path in variants.items():
+        for backend in ["torch", "numpy", "int8"]:
+            try:
+                model = model_registry.get(path, backend)
+            except ImportError:  # torch is optional
+                continue
+            name = f"{variant} {backend}"
+            moves = model.decide(features)
+            rows[f"{name} agreement_full"] = sum(m == f for m, f in zip(moves, full_moves)) / examples
+            rows[f"{name} agreement_score"] = sum(m == l for m, l in zip(moves, labels)) / examples
+            rows[f"{name} single_decisions_per_s"] = 1 / time_per_call(lambda: model.decide(features[:1]), repeats)
+            rows[f"{name} batched_decisions_per_s"] = examples / time_per_call(lambda: model.decide(features), 20)
+            rows[f"{name} memory_bytes"] = int(model_registry.get_stats()[weight_path(path, backend)]["memory"])
+    print_report("Compact policies", rows)
+
+
+def benchmark_decision_cache(ticks: int = 2000, enemy_count: int = 4):
+    """Compare agent tick time with the decision cache off and on, its counters and how often a cached decision matches the uncached policy."""
+    from nn_package.decision_cache import DecisionCache, decision_caches
+
+    debug, weapon_factory, item_factory = create_context()
+    rows = {}
+    for size in [0, 4096]:
+        decision_caches.clear()
+        random.seed(0)
+        room = create_room(debug, weapon_factory, item_factory, enemy_count=enemy_count)
+        room.LOD_DISTANCE = room.map_size  # Every agent on the network, far agents never reach the cache
+        room.entity_manager.decision_cache.size = size
+        room.entity_manager.model  # Load the model before timing
+
+        def tick():
+            for agent in room.entity_manager.Agents:  # Every agent decides every tick
+                agent.last_move_time = 0
+            room.get_agent_movement()
+
+        rows[f"size {size} tick_ms"] = time_per_call(tick, ticks) * 1000
+        for key, value in room.entity_manager.decision_cache.get_stats().items():
+            rows[f"size {size} {key}"] = value
+    uncached = DecisionCache(size=0)
+    cached = room.entity_manager.decision_cache
+    agents = [agent for agent in room.entity_manager.Agents if agent.health > 0]
+    player = room.entity_manager.player
+    glyphs = room.get_glyphs()
+    floor = [
+        (y, x)
+        for y in range(1, len(glyphs) - 1)
+        for x in range(1, len(glyphs[0]) - 1)
+        if glyphs[y][x] == room.empty_char
+    ]
+    agreed = 0
+    lookups = cached.hits, cached.misses
+    for tick_index in range(ticks):  # Agents follow the uncached policy, each decision is also looked up in the warm cache
+        if tick_index % 10 == 0:  # The player moves and makes a sound somewhere new
+            room.entity_manager.set_entity_pos(player, random.choice(floor))
+            room.generate_heat_map()
+        for agent in agents:
+            agent.health = random.uniform(1, 100)  # Spread over every health bucket
+        room.entity_manager.get_decision_cache = lambda archetype: uncached
+        exact = room.get_agent_decisions(agents)
+        room.entity_manager.get_decision_cache = lambda archetype: cached
+        agreed += sum(a == b for a, b in zip(room.get_agent_decisions(agents), exact))
+        room.apply_agent_moves(agents, exact, 0)
+    hits, misses = cached.hits - lookups[0], cached.misses - lookups[1]
+    rows["size 4096 varied hit_rate"] = hits / (hits + misses)
+    rows["size 4096 varied agreement"] = agreed / (hits + misses)
+    rows["size 4096 varied hit_agreement"] = (agreed - misses) / max(hits, 1)  # A miss runs the policy so it always agrees
+    print_report("Decision cache", rows)
+
+
+def benchmark_ai_worker(ticks: int = 500, enemy_counts=(4, 16)):
+    """Compare the main thread cost of an agent tick deciding moves inline against handing them to the AI worker."""
+    from managers_package.ai_worker import AIWorker
+    from nn_package.decision_cache import decision_caches
+
+    debug, weapon_factory, item_factory = create_context()
+    ai_worker = AIWorker()
+    rows = {}
+    for enemy_count in enemy_counts:
+        decision_caches.clear()
+        random.seed(0)
+        room = create_room(debug, weapon_factory, item_factory, enemy_count=enemy_count)
+        room.LOD_DISTANCE = room.map_size  # Every agent on the network
+        room.entity_manager.decision_cache.size = 0  # Every decision runs the policy
+        room.entity_manager.model  # Load the model before timing
+
+        def sync_tick():
+            for agent in room.entity_manager.Agents:
+                agent.last_move_time = 0
+            room.move_agents()
+
+        def async_tick():
+            for agent in room.entity_manager.Agents:
+                agent.last_move_time = 0
+            room.move_agents_async(ai_worker)
+
+        rows[f"{enemy_count} agents sync_ms"] = time_per_call(sync_tick, ticks) * 1000
+        rows[f"{enemy_count} agents async_ms"] = time_per_call(async_tick, ticks) * 1000
+        ai_worker.discard(room)
+    ai_worker.shutdown()
+    print_report("AI worker (main thread time per tick)", rows)
+
+
+def benchmark_dataset(rows: int = 4000, shard_rows: int = 500, worker_counts=(1, 2, 4)):
+    """Report dataset generation rows per second for several worker counts and check shards do not depend on the worker count."""
+    import tempfile
+
+    import numpy as np
+
+    from nn_package.dataset import ShardedDataset, generate_dataset
+
+    rows_report = {"cores": os.cpu_count()}
+    labels = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for workers in worker_counts:
+            path = os.path.join(directory, f"workers_{workers}")
+            manifest = generate_dataset(path, rows, shard_rows, workers=workers, seed=0)
+            rows_report[f"{workers} workers rows_per_second"] = manifest["rows_per_second"]
+            dataset = ShardedDataset(path)
+            labels[workers] = dataset.get_column("labels")
+            assert len(dataset) == rows and dataset[-1][0].shape == (13,)
+    reference = labels[worker_counts[0]]
+    for workers, worker_labels in labels.items():
+        if not np.array_equal(reference, worker_labels):
+            raise AssertionError(f"{workers} workers generated different rows")
+    print_report("Dataset generation", rows_report)
+
+
+def benchmark_trainer(rows: int = 4000, batch_sizes=(1, 256)):
+    """Compare training examples per second of single example steps against mini-batches."""
+    import tempfile
+
+    import torch
+
+    from nn_package.dataset import ShardedDataset, generate_dataset
+    from nn_package.model import MovementNet
+    from nn_package.trainer import train_policy
+
+    report = {}
+    with tempfile.TemporaryDirectory() as directory:
+        generate_dataset(directory, rows, shard_rows=rows, workers=1, seed=0)
+        dataset = ShardedDataset(directory)
+        holdout = (dataset.get_column("features"), dataset.get_column("labels").astype("int64"))
+        for batch_size in batch_sizes:
+            torch.manual_seed(0)
+            result = train_policy(
+                MovementNet(), dataset, holdout, batch_size=batch_size, epochs=1, log=lambda message: None
+            )
+            report[f"batch {batch_size} examples_per_second"] = result["examples_per_second"]
+            report[f"batch {batch_size} accuracy"] = result["history"][-1]["accuracy"]
+    print_report("Trainer (1 epoch)", report)
+
+
+def benchmark_heuristic(rooms: int = 2000, repeats: int = 50):
+    """Check score_batch and HeuristicPolicy match score exactly and compare labels per second."""
+    import numpy as np
+
+    from nn_package.heuristic import HeuristicPolicy, score_batch
+    from nn_package.scenarios import generate_room, get_example, score
+
+    debug, weapon_factory, item_factory = create_context()
+    random.seed(0)
+    games = [generate_room(debug, weapon_factory, item_factory) for _ in range(rooms)]
+    features, expected = [], []
+    for game in games:
+        row, label, points = get_example(game)
+        features.append(row)
+        expected.append((label, points))
+    inputs = np.asarray(features, dtype=np.float64)
+    columns = {
+        "agent_health": inputs[:, 11],
+        "enemy_count": inputs[:, 12],
+        "level_diff": inputs[:, 10],
+        "player_visible": inputs[:, 9] > 0,
+        "sound_grid": inputs[:, :9],
+    }
+    labels, points = score_batch(**columns)
+    if list(zip(labels.tolist(), points.tolist())) != expected:
+        raise AssertionError("score_batch does not match score")
+    if HeuristicPolicy().decide(np.asarray(features, dtype=np.float32)) != labels.tolist():
+        raise AssertionError("HeuristicPolicy does not match score on float32 features")
+    scalar = time_per_call(lambda: [score(game) for game in games], 1)
+    batch = time_per_call(lambda: score_batch(**columns), repeats)
+    print_report(
+        "Heuristic (exact match)",
+        {"scalar labels_per_second": rooms / scalar, "batch labels_per_second": rooms / batch},
+    )
+
+
+def benchmark_run_manager(steps: int = 20000, checkpoints: int = 20):
+    """Compare per-step metric cost of the ring buffer against formatting a log line, and blocking time of background against inline checkpoints."""
+    import tempfile
+    from datetime import datetime
+
+    import torch
+    from colorama import Fore
+
+    from nn_package.model import MovementNet
+    from nn_package.run_manager import MetricRing, RunManager
+
+    ring = MetricRing(1000)
+    report = {
+        "ring record_us": time_per_call(lambda: ring.add(1.5, 200, 256), steps) * 1e6,
+        "log line record_us": time_per_call(
+            lambda: f"[{datetime.now().strftime('%H:%M:%S.%f')[:-3]}] {Fore.GREEN}Loss: {round(1.5, 2)}{Fore.RESET}",
+            steps,
+        )
+        * 1e6,
+    }
+    model = MovementNet()
+    optimizer = torch.optim.Adam(model.parameters())
+    model(torch.zeros(1, 13)).sum().backward()
+    optimizer.step()  # Fill the optimizer state
+    with tempfile.TemporaryDirectory() as directory:
+        run = RunManager(directory)
+        path = os.path.join(directory, "inline.pth")
+        report["inline checkpoint_ms"] = time_per_call(
+            lambda: torch.save({"model": model.state_dict(), "optimizer": optimizer.state_dict()}, path),
+            checkpoints,
+        ) * 1000
+        report["background checkpoint_ms"] = time_per_call(
+            lambda: (run.checkpoint(0, 0, model, optimizer, []), time.sleep(0.01)), checkpoints
+        ) * 1000 - 10  # Training work between checkpoints
+        run.close()
+    print_report("Run manager (time on the training thread)", report)
+
+
+def benchmark_simulation(dungeons: int = 10):
+    """Report headless game logic throughput and the busiest manager methods."""
+    from managers_package.simulation_manager import SimulationManager
+
+    report = SimulationManager(seed=0).run(dungeons)
+    rows = {
+        key: report[key]
+        for key in ["ticks", "room_transitions", "ticks_per_second", "room_transitions_per_second"]
+    }
+    rows.update(report["outcomes"])
+    for name, timing in list(report["methods"].items())[:6]:
+        rows[f"{name} share"] = timing["share"]
+    print_report("Headless simulation", rows)
+
+
+def benchmark_timers(steps: int = 2000):
+    """Compare thread count and per-step cost of a threading.Timer per footstep against the timer scheduler."""
+    import threading
+
+    debug, weapon_factory, item_factory = create_context()
+    room = create_room(debug, weapon_factory, item_factory)
+    player = room.entity_manager.player
+
+    def thread_step():  # The footstep timer before the scheduler
+        if player.step_timer is not None and player.step_timer.is_alive():
+            player.step_timer.cancel()
+        player.step_timer = threading.Timer(room.FOOTSTEP_DURATION, room.zero_heat_map)
+        player.step_timer.start()
+
+    report = {}
+    for name, step in [("thread", thread_step), ("scheduler", lambda: room.start_footstep_timer(player))]:
+        player.step_timer = None
+        threads_before = threading.active_count()
+        peak = 0
+
+        def timed_step():
+            nonlocal peak
+            step()
+            room.scheduler.run_due()
+            peak = max(peak, threading.active_count() - threads_before)
+
+        report[f"{name} step_us"] = time_per_call(timed_step, steps) * 1e6
+        report[f"{name} peak_extra_threads"] = peak
+        if player.step_timer is not None:
+            player.step_timer.cancel()
+    print_report("Footstep timers", report)
+
+
+def benchmark_vector_env(room_counts=(1, 64, 256), steps: int = 50):
+    """Report room steps per second of the vectorized environment with one policy forward pass per step."""
+    from managers_package.vector_env import RoomVectorEnv
+    from nn_package import model_registry
+
+    model = model_registry.get("nn_package/enemy_controller.pth")
+    report = {}
+    for num_rooms in room_counts:
+        env = RoomVectorEnv(num_rooms=num_rooms, agents_per_room=2)
+        observations = env.reset(seed=0)
+        rewards = []
+
+        def step():
+            nonlocal observations
+            actions = model.decide(observations["features"].reshape(-1, 13))  # Every agent of every room at once
+            observations, reward, _, _ = env.step(actions)
+            rewards.append(reward.mean())
+
+        report[f"{num_rooms} rooms room_steps_per_second"] = num_rooms / time_per_call(step, steps)
+        report[f"{num_rooms} rooms heuristic_agreement"] = float(sum(rewards) / len(rewards))
+    print_report("Vectorized room environment", report)
+
+
+def benchmark_archetypes(agent_counts=(4, 16), repeats: int = 200):
+    """Compare a mixed controller and coward room decided one agent at a time against one forward pass per archetype."""
+    from nn_package.decision_cache import decision_caches
+
+    debug, weapon_factory, item_factory = create_context()
+    decision_caches.clear()
+    random.seed(0)
+    room = create_room(debug, weapon_factory, item_factory)
+    calls = {"count": 0}
+    for archetype in ["controller", "coward"]:
+        room.entity_manager.get_decision_cache(archetype).size = 0  # Every decision reaches the model
+        model = room.entity_manager.get_model(archetype)
+        decide = model.decide
+
+        def counted(rows, decide=decide):
+            calls["count"] += 1
+            return decide(rows)
+
+        model.decide = counted
+    rows = {}
+    try:
+        for count in agent_counts:
+            agents = create_agents(room, count)
+            for i, agent in enumerate(agents):
+                agent.archetype = ["controller", "coward"][i % 2]
+            room.feature_schema = None  # Sized for the new agent count
+            room.enemy_count = count
+            single = [room.get_agent_decisions([agent])[0] for agent in agents]
+            if single != room.get_agent_decisions(agents):
+                raise ValueError("grouped decisions differ from per agent decisions")
+            for label, function in [
+                ("per_agent", lambda: [room.get_agent_decisions([agent]) for agent in agents]),
+                ("grouped", lambda: room.get_agent_decisions(agents)),
+            ]:
+                calls["count"] = 0
+                rows[f"{count} agents {label}_ms"] = time_per_call(function, repeats) * 1000
+                rows[f"{count} agents {label}_model_calls"] = calls["count"] / repeats
+    finally:
+        for archetype in ["controller", "coward"]:
+            del room.entity_manager.get_model(archetype).decide  # Restore the class method
+    print_report("Archetype batching (2 archetypes)", rows)
+
+
+def benchmark_ai_lod(agent_count: int = 16, repeats: int = 200):
+    """Compare agent decision time with every agent on the NN against the level of detail tiers, with the player silent in a corner."""
+    from nn_package.decision_cache import decision_caches
+
+    debug, weapon_factory, item_factory = create_context()
+    decision_caches.clear()
+    random.seed(0)
+    room = create_room(debug, weapon_factory, item_factory)
+    room.entity_manager.decision_cache.size = 0  # Every NN decision reaches the model
+    room.entity_manager.model  # Load the model before timing
+    room.entity_manager.player.pos = (1, 1)
+    room.zero_heat_map()  # The player has not moved, nobody hears anything
+    agents = create_agents(room, agent_count)
+    room.feature_schema = None
+    room.enemy_count = agent_count
+    rows = {}
+    for label, distance, policy in [
+        ("all_network", room.map_size, "heuristic"),
+        ("lod_heuristic", 5, "heuristic"),
+        ("lod_idle", 5, "idle"),
+    ]:
+        room.LOD_DISTANCE = distance
+        room.LOD_POLICY = policy
+        room.lod_counters = dict.fromkeys(room.lod_counters, 0)
+        rows[f"{label} ms"] = time_per_call(lambda: room.get_lod_decisions(agents), repeats) * 1000
+        for tier, count in room.lod_counters.items():
+            rows[f"{label} {tier}_per_tick"] = count / repeats
+    print_report(f"AI level of detail ({agent_count} agents)", rows)
+
+
+def benchmark_ai_budget(agent_count: int = 32, frames: int = 400, budget_ms: float = 1.0):
+    """Compare frame times when every ready agent is decided at once against a per frame AI budget, on the main thread and with the AI worker.
+
+    Agents all become ready on the same frame, the budget should flatten those bursts without any agent moving before its delay.
+    With the AI worker only applying the decided moves and sending agents to it are on the main thread.
+    """
+    from managers_package.ai_budget import AIBudget
+    from managers_package.ai_worker import AIWorker
+    from managers_package.clock import SimulatedClock
+    from nn_package.decision_cache import decision_caches
+
+    debug, weapon_factory, item_factory = create_context()
+    ai_worker = AIWorker()
+    rows = {}
+    for label, budget, background in [
+        ("unbudgeted", None, False),
+        (f"budget {budget_ms}ms", AIBudget(budget_ms), False),
+        ("worker unbudgeted", None, True),
+        (f"worker budget {budget_ms}ms", AIBudget(budget_ms), True),
+    ]:
+        decision_caches.clear()
+        random.seed(0)
+        clock = SimulatedClock()
+        room = create_room(debug, weapon_factory, item_factory, enemy_count=agent_count)
+        room.clock = clock
+        room.ai_budget = budget
+        room.LOD_DISTANCE = room.map_size  # Every agent on the network
+        room.entity_manager.decision_cache.size = 0
+        room.entity_manager.model  # Load the model before timing
+        for agent in room.entity_manager.Agents:
+            agent.health = 100  # Nobody dies during the run
+            agent.last_move_time = clock.now()
+        last_moves = {id(agent): agent.last_move_time for agent in room.entity_manager.Agents}
+        early_moves = 0
+        frame_ms = []
+        for _ in range(frames):
+            clock.advance(0.05)
+            start = time.perf_counter()
+            if background:
+                room.move_agents_async(ai_worker)
+            else:
+                room.get_agent_movement()  # The decisions, without the entity map refresh
+            frame_ms.append((time.perf_counter() - start) * 1000)
+            if background:
+                time.sleep(0.002)  # The rest of the frame, when the worker gets the CPU
+            for agent in room.entity_manager.Agents:
+                if agent.last_move_time != last_moves[id(agent)]:
+                    if agent.last_move_time - last_moves[id(agent)] < agent.movement_delay:
+                        early_moves += 1
+                    last_moves[id(agent)] = agent.last_move_time
+        frame_ms.sort()
+        rows[f"{label} p50_frame_ms"] = frame_ms[len(frame_ms) // 2]
+        rows[f"{label} p95_frame_ms"] = frame_ms[int(len(frame_ms) * 0.95)]
+        rows[f"{label} max_frame_ms"] = frame_ms[-1]
+        rows[f"{label} early_moves"] = early_moves
+        if budget is not None:
+            for key, value in budget.get_stats().items():
+                rows[f"{label} {key}"] = value
+        ai_worker.discard(room)
+    ai_worker.shutdown()
+    print_report(f"AI frame budget ({agent_count} agents)", rows)
+
+
+def search_heat_map(room) -> list[list[float]]:
+    """Return the heat map of the previous generate_heat_map, a breadth first search of sound strengths from the player."""
+    from collections import deque
+
+    from generators_package.tiles import Tile
+
+    grid_height = room.tiles.height - 1
+    grid_width = room.tiles.width - 1
+    heat_map = [[0.0 for _ in range(grid_width)] for _ in range(grid_height)]
+    for y in range(grid_height):
+        for x in range(grid_width):
+            if room.tiles.get(y, x) == Tile.WALL:
+                heat_map[y][x] = -1.0
+    visited = {}
+    queue = deque([(*room.entity_manager.player.pos, 1.0)])
+    while queue:
+        y, x, strength = queue.popleft()
+        if strength < 0.05 or ((y, x) in visited and strength <= visited[(y, x)]):
+            continue
+        visited[(y, x)] = strength
+        heat_map[y][x] = max(heat_map[y][x], strength)
+        for dy, dx in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+            ny, nx = y + dy, x + dx
+            if not (0 <= ny < grid_height and 0 <= nx < grid_width) or room.tiles.get(ny, nx) == Tile.WALL:
+                continue
+            new_strength = strength * room.SOUND_DECAY_CONSTANT
+            if (ny, nx) not in visited or new_strength > visited[(ny, nx)]:
+                queue.append((ny, nx, new_strength))
+    return heat_map
+
+
+def benchmark_heat_map(rooms: int = 50, repeats: int = 20):
+    """Check the distance field heat maps match the breadth first search exactly and compare their cost per player move."""
+    from generators_package.tiles import Tile
+
+    debug, weapon_factory, item_factory = create_context()
+    random.seed(0)
+    searched = 0.0
+    cached = 0.0
+    first = 0.0
+    cells = 0
+    for _ in range(rooms):
+        room = create_room(debug, weapon_factory, item_factory)
+        floor = [
+            (y, x)
+            for y in range(room.tiles.height - 1)
+            for x in range(room.tiles.width - 1)
+            if room.tiles.get(y, x) != Tile.WALL
+        ]
+        for pos in floor:
+            room.entity_manager.player.pos = pos
+            start = time.perf_counter()
+            room.generate_heat_map()  # Searches the distance field
+            first += time.perf_counter() - start
+            if room.heat_map != search_heat_map(room):
+                raise ValueError(f"heat map differs from the search at {pos}")
+        cells += len(floor)
+        for _ in range(repeats):
+            for pos in floor:
+                room.entity_manager.player.pos = pos
+                start = time.perf_counter()
+                search_heat_map(room)
+                searched += time.perf_counter() - start
+                start = time.perf_counter()
+                room.generate_heat_map()
+                cached += time.perf_counter() - start
+    print_report(
+        "Heat map (exact match)",
+        {
+            "positions_checked": cells,
+            "search_us": searched / (cells * repeats) * 1e6,
+            "distance_field_first_visit_us": first / cells * 1e6,
+            "distance_field_us": cached / (cells * repeats) * 1e6,
+        },
+    )
+
+
+def scan_entity_at_pos(entity_manager, coordinates, ignore=None):
+    """Return the entity at a position the way the previous get_entity_at_pos did, a scan of every entity."""
+    from generators_package.entity_generator import DudEntity
+
+    entities = entity_manager.Agents + [entity_manager.player]
+    if ignore == "player":
+        entities.remove(entity_manager.player)
+    elif ignore == "agent":
+        entities = [entity_manager.player]
+    for entity in entities:
+        if entity.pos == coordinates:
+            return entity
+    return DudEntity()
+
+
+def benchmark_entity_index(ticks: int = 2000, repeats: int = 200):
+    """Check the position index and incremental entity map against full scans while playing, then compare their cost."""
+    from generators_package.entity_generator import DudEntity
+    from managers_package.chest_manager import Chest
+    from managers_package.clock import SimulatedClock
+    from managers_package.dungeon_manager import DungeonManager
+
+    debug, weapon_factory, item_factory = create_context()
+    random.seed(0)
+    clock = SimulatedClock()
+    player = create_player(debug, weapon_factory, item_factory)
+    dungeon = DungeonManager(
+        player, debug, weapon_factory, item_factory, size=3, background_ai=False, clock=clock, ai_budget_ms=0
+    )
+    checked = 0
+    for _ in range(ticks):
+        clock.advance(0.1)
+        result = dungeon.move_player(random.choice([(-1, 0), (1, 0), (0, -1), (0, 1)])) or {}
+        if result.get("action") == "room_transition":
+            dungeon.current_room.activate_room(result.get("player_pos"))
+        elif result.get("action") in ["exit", "death"]:
+            player = create_player(debug, weapon_factory, item_factory)
+            dungeon = DungeonManager(
+                player, debug, weapon_factory, item_factory, size=3, background_ai=False, clock=clock, ai_budget_ms=0
+            )
+        room = dungeon.current_room
+        room.update_entity_map()  # Agents refresh it before the player moves, catch up with the player's move
+        for row in range(len(room.entity_map) - 1):
+            for col in range(len(room.entity_map[0]) - 1):
+                cell = room.entity_map[row][col]
+                expected = scan_entity_at_pos(room.entity_manager, (row, col))
+                if isinstance(cell, Chest):
+                    continue
+                if cell is not expected and not (isinstance(cell, DudEntity) and isinstance(expected, DudEntity)):
+                    raise ValueError(f"entity map differs from a scan at {(row, col)}")
+                for ignore in ["player", "agent"]:
+                    found = room.entity_manager.get_entity_at_pos((row, col), ignore)
+                    expected = scan_entity_at_pos(room.entity_manager, (row, col), ignore)
+                    if found is not expected and not (isinstance(found, DudEntity) and isinstance(expected, DudEntity)):
+                        raise ValueError(f"get_entity_at_pos differs from a scan at {(row, col)}")
+                checked += 1
+    room = dungeon.current_room
+
+    def scan_update():  # The previous update_entity_map, a scan for every cell
+        for row in range(len(room.entity_map) - 1):
+            for col in range(len(room.entity_map[0]) - 1):
+                new = scan_entity_at_pos(room.entity_manager, (row, col))
+                if not isinstance(room.entity_map[row][col], Chest):
+                    room.entity_map[row][col] = new
+
+    def index_update():  # One agent moved since the last update
+        agent = room.entity_manager.Agents[0] if room.entity_manager.Agents else player
+        room.entity_manager.set_entity_pos(agent, agent.pos)
+        room.update_entity_map()
+
+    print_report(
+        "Entity index (exact match)",
+        {
+            "cells_checked": checked,
+            "scan_update_us": time_per_call(scan_update, repeats) * 1e6,
+            "index_update_us": time_per_call(index_update, repeats) * 1e6,
+        },
+    )
+    room.entity_manager.index_positions()
+    room.update_entity_map()
+
+
+def benchmark_tiles(sizes=(64, 256, 1024), repeats: int = 20):
+    """Compare the memory, wall scans and single cell checks of glyph rows against a TileGrid, after checking a room's grid draws back to its map."""
+    from generators_package.room_generator import RoomGenerator
+    from generators_package.tiles import Tile, TileGrid
+
+    random.seed(0)
+    glyphs = RoomGenerator(doors=3, start_door=(0, 5)).generate_dungeon()
+    if TileGrid.from_glyphs(glyphs).to_glyphs() != glyphs:
+        raise ValueError("tile grid does not draw back to the room map")
+    report = {}
+    for size in sizes:
+        rows = [
+            [random.choice([" _ ", " _ ", " # ", " / "]) for _ in range(size)] for _ in range(size)
+        ]
+        grid = TileGrid.from_glyphs(rows)
+        row_bytes = sys.getsizeof(rows) + sum(sys.getsizeof(row) for row in rows)  # The glyph strings are shared
+        cells = grid.cells
+        wall = Tile.WALL  # Enum attribute lookups cost more than the comparison
+
+        def scan_glyphs():
+            return sum(1 for row in rows for tile in row if tile == " # ")
+
+        def scan_cells():
+            return sum(1 for tile in cells if tile == wall)
+
+        def count_cells():
+            return cells.count(Tile.WALL)
+
+        points = [(random.randrange(size), random.randrange(size)) for _ in range(1000)]  # Cells checked like moves
+        width = grid.width
+
+        def check_glyphs():
+            return sum(1 for y, x in points if rows[y][x] == " # ")
+
+        def check_get():
+            return sum(1 for y, x in points if grid.get(y, x) == wall)
+
+        def check_cells():
+            return sum(1 for y, x in points if cells[y * width + x] == wall)
+
+        if scan_glyphs() != scan_cells() or scan_cells() != count_cells() or count_cells() != int((grid.as_array() == Tile.WALL).sum()):
+            raise ValueError(f"wall counts differ at size {size}")
+        if not check_glyphs() == check_get() == check_cells():
+            raise ValueError(f"cell checks differ at size {size}")
+        report[f"glyph_rows_{size}_bytes"] = row_bytes
+        report[f"tile_grid_{size}_bytes"] = grid.get_memory()
+        report[f"glyph_scan_{size}_ms"] = time_per_call(scan_glyphs, repeats) * 1e3
+        report[f"tile_scan_{size}_ms"] = time_per_call(scan_cells, repeats) * 1e3
+        report[f"tile_count_{size}_ms"] = time_per_call(count_cells, repeats) * 1e3
+        report[f"glyph_check_{size}_ns"] = time_per_call(check_glyphs, repeats) * 1e9 / len(points)
+        report[f"tile_get_check_{size}_ns"] = time_per_call(check_get, repeats) * 1e9 / len(points)
+        report[f"tile_index_check_{size}_ns"] = time_per_call(check_cells, repeats) * 1e9 / len(points)
+    print_report("Tile grids (exact match)", report)
+
+
+def benchmark_room_sizes(sizes=(11, 64, 128, 256), positions: int = 200, checked: int = 5):
+    """Report the cost of each per room algorithm as rooms grow, checking the heat maps against the breadth first search."""
+    debug, weapon_factory, item_factory = create_context()
+    report = {}
+    for size in sizes:
+        random.seed(0)
+        start = time.perf_counter()
+        room = create_room(debug, weapon_factory, item_factory, map_size=size)
+        report[f"activate_{size}_ms"] = (time.perf_counter() - start) * 1e3
+        glyphs = room.get_glyphs()
+        floor = [
+            (y, x)
+            for y in range(len(glyphs) - 1)
+            for x in range(len(glyphs[0]) - 1)
+            if glyphs[y][x] == room.empty_char
+        ]
+        sample = random.sample(floor, min(positions, len(floor)))
+        for pos in sample[:checked]:
+            room.entity_manager.player.pos = pos
+            room.generate_heat_map()
+            if room.heat_map != search_heat_map(room):
+                raise ValueError(f"heat map differs from the search at {pos} in a {size} room")
+        start = time.perf_counter()
+        for pos in sample[checked:]:  # Player positions the room has not heard from yet
+            room.entity_manager.player.pos = pos
+            room.generate_heat_map()
+        report[f"heat_map_{size}_us"] = (time.perf_counter() - start) / max(len(sample) - checked, 1) * 1e6
+        agents = create_agents(room, 16)
+        start = time.perf_counter()
+        for agent in agents:
+            room.get_viewport(agent)
+        report[f"viewport_{size}_us"] = (time.perf_counter() - start) / len(agents) * 1e6
+        agent = room.entity_manager.Agents[0]
+
+        def move_and_update():  # One agent moved since the last update
+            room.entity_manager.set_entity_pos(agent, agent.pos)
+            room.update_entity_map()
+
+        report[f"entity_map_{size}_us"] = time_per_call(move_and_update, 200) * 1e6
+    print_report("Room sizes (exact heat maps)", report)
+
+
+def benchmark_room_prefetch(transitions: int = 30, room_size: int = 64, think_ms: float = 30):
+    """Compare room transition latency with rooms generated on entry against rooms generated in the background while the player thinks."""
+    from managers_package.clock import SimulatedClock
+    from managers_package.dungeon_manager import DungeonManager
+    from managers_package.room_prefetcher import get_room_prefetcher
+    from managers_package.simulation_manager import DoorBot
+
+    debug, weapon_factory, item_factory = create_context()
+    prefetcher = get_room_prefetcher()
+    report = {}
+    for prefetch in [False, True]:
+        random.seed(0)
+        bot = DoorBot(random.Random(0))
+        clock = SimulatedClock()
+        counters = (prefetcher.hits, prefetcher.late, prefetcher.misses)
+
+        def new_dungeon():
+            return DungeonManager(
+                create_player(debug, weapon_factory, item_factory),
+                debug,
+                weapon_factory,
+                item_factory,
+                size=3,
+                background_ai=False,
+                clock=clock,
+                ai_budget_ms=0,
+                room_size=room_size,
+                prefetch_rooms=prefetch,
+            )
+
+        dungeon = new_dungeon()
+        latencies = []
+        while len(latencies) < transitions:
+            clock.advance(0.1)
+            start = time.perf_counter()
+            result = dungeon.move_player(bot.choose(dungeon.current_room)) or {}
+            if result.get("action") == "room_transition":
+                dungeon.current_room.activate_room(result.get("player_pos"))
+                latencies.append(time.perf_counter() - start)
+            elif result.get("action") in ["exit", "death"]:
+                dungeon = new_dungeon()
+            time.sleep(think_ms / 1000)  # The player reads the screen, the worker generates rooms
+        latencies.sort()
+        name = "prefetch" if prefetch else "on_entry"
+        report[f"{name}_p50_ms"] = latencies[len(latencies) // 2] * 1e3
+        report[f"{name}_p95_ms"] = latencies[int(len(latencies) * 0.95)] * 1e3
+        report[f"{name}_max_ms"] = latencies[-1] * 1e3
+        if prefetch:
+            hits, late, misses = (
+                now - before
+                for now, before in zip((prefetcher.hits, prefetcher.late, prefetcher.misses), counters)
+            )
+            report["hits"] = hits
+            report["late"] = late
+            report["misses"] = misses
+            report["hit_rate"] = hits / max(hits + late + misses, 1)
+    print_report(f"Room prefetch ({room_size}x{room_size} rooms)", report)
+
+
+def benchmark_room_generator(sizes=(11, 64, 128, 256), seconds: float = 3, checked: int = 5):
+    """Compare rooms generated per second and attempts per accepted room of the python and numpy cave generators, checking the numpy rules against convert and the numpy walls against valid_room."""
+    import numpy as np
+
+    from generators_package.room_generator import RoomGenerator, generation_stats
+
+    report = {}
+    for size in sizes:
+        for seed in range(checked):
+            generator = RoomGenerator(grid_size=size, doors=3, method="python", rng=random.Random(seed))
+            walls = np.random.default_rng(seed).integers(0, 101, (size, size)) < 30
+            generator.map = [[generator.wall_char if wall else generator.empty_char for wall in row] for row in walls]
+            for _ in range(3):
+                for y in range(size):
+                    for x in range(size):
+                        generator.convert((y, x))
+                walls = generator.apply_rules(walls)
+            if generator.map != [[generator.wall_char if wall else generator.empty_char for wall in row] for row in walls]:
+                raise ValueError(f"numpy rules differ from convert in a {size} room")
+            doors = generator.doors + [generator.start_door]
+            for y, x in doors: # Opened like generate_cave, so every door is usually reachable
+                walls[max(y - 1, 0) : y + 2, max(x - 1, 0) : x + 2] = False
+            walls[0, :] = walls[-1, :] = walls[:, 0] = walls[:, -1] = True
+            for y, x in doors:
+                walls[y, x] = False
+            generator.map = [[generator.wall_char if wall else generator.empty_char for wall in row] for row in walls]
+            for y, x in doors:
+                generator.map[y][x] = generator.door_char
+            reachable = generator.flood_fill(walls, generator.start_door)
+            valid = generator.valid_room() # Walls the squares its searches did not visit
+            if valid != all(reachable[y, x] for y, x in generator.doors):
+                raise ValueError(f"flood fill and valid_room disagree on the doors of a {size} room")
+            if valid:
+                walls[:-1, :-1] |= ~generator.search_doors(walls)[:-1, :-1]
+                if [[tile == generator.wall_char for tile in row] for row in generator.map] != walls.tolist():
+                    raise ValueError(f"numpy walls differ from valid_room in a {size} room")
+        for method in ["python", "numpy"]:
+            generation_stats.clear()
+            rng = random.Random(0)
+            rooms = 0
+            start = time.perf_counter()
+            while time.perf_counter() - start < seconds:
+                RoomGenerator(grid_size=size, doors=3, method=method, rng=random.Random(rng.getrandbits(64))).generate_dungeon()
+                rooms += 1
+            stats = generation_stats.get_stats()
+            report[f"{method}_{size}_rooms_per_s"] = rooms / (time.perf_counter() - start)
+            report[f"{method}_{size}_attempts_per_room"] = stats["attempts_per_room"]
+    print_report("Room generator (exact rules and walls)", report)
+
+
+BENCHMARKS = {
+    "model_registry": benchmark_model_registry,
+    "agent_inference": benchmark_agent_inference,
+    "ai_backends": benchmark_ai_backends,
+    "feature_encoder": benchmark_feature_encoder,
+    "compact_policies": benchmark_compact_policies,
+    "decision_cache": benchmark_decision_cache,
+    "ai_worker": benchmark_ai_worker,
+    "dataset": benchmark_dataset,
+    "trainer": benchmark_trainer,
+    "heuristic": benchmark_heuristic,
+    "run_manager": benchmark_run_manager,
+    "simulation": benchmark_simulation,
+    "timers": benchmark_timers,
+    "vector_env": benchmark_vector_env,
+    "archetypes": benchmark_archetypes,
+    "ai_lod": benchmark_ai_lod,
+    "ai_budget": benchmark_ai_budget,
+    "heat_map": benchmark_heat_map,
+    "entity_index": benchmark_entity_index,
+    "tiles": benchmark_tiles,
+    "room_sizes": benchmark_room_sizes,
+    "room_prefetch": benchmark_room_prefetch,
+    "room_generator": benchmark_room_generator,
+}  # Benchmark name: benchmark function
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Retrogue benchmarks")
+    parser.add_argument(
+        "benchmarks", nargs="*", help=f"Benchmarks to run, all by default ({', '.join(BENCHMARKS)})"
+    )
+    args = parser.parse_args()
+    for name in args.benchmarks:
+        if name not in BENCHMARKS:
+            parser.error(f"unknown benchmark {name}")
+    for name in args.benchmarks or BENCHMARKS:
+        BENCHMARKS[name]()
@@ -1,5 +1,17 @@
 """Factory package."""
 
-from factory_package.item_factory import WeaponFactory, ItemFactory
+import importlib
+
+MODULES = {
+    "WeaponFactory": ".item_factory",
+    "ItemFactory": ".item_factory",
+}  # Name: module that defines it, imported on first use
 
 __all__ = ["WeaponFactory", "ItemFactory"]
+
+
+def __getattr__(name):
+    """Import the module that defines `name` on first use so importing the package stays cheap."""
+    if name in MODULES:
+        return getattr(importlib.import_module(MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
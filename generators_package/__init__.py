@@ -1,17 +1,36 @@
 """Generator package."""
 
-from .entity_generator import Entity, Player, Agent
-from .room_generator import RoomGenerator
-from .item_generator import Weapon
-from .menu_generator import Menu
-from .overworld_generation import OverworldGeneration
+import importlib
+
+MODULES = {
+    "RoomGenerator": ".room_generator",
+    "generation_stats": ".room_generator",
+    "Entity": ".entity_generator",
+    "Player": ".entity_generator",
+    "Agent": ".entity_generator",
+    "Weapon": ".item_generator",
+    "Menu": ".menu_generator",
+    "OverworldGeneration": ".overworld_generation",
+    "Tile": ".tiles",
+    "TileGrid": ".tiles",
+}  # Name: module that defines it, imported on first use
 
 __all__ = [
     "RoomGenerator",
+    "generation_stats",
     "Entity",
     "Player",
     "Agent",
     "Weapon",
     "Menu",
     "OverworldGeneration",
+    "Tile",
+    "TileGrid",
 ]
+
+
+def __getattr__(name):
+    """Import the module that defines `name` on first use so importing the package stays cheap."""
+    if name in MODULES:
+        return getattr(importlib.import_module(MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -198,6 +198,7 @@ class Agent(Entity):
     self.is_making_noise: bool
     self.is_hit: bool
     self.hit_timer
+    self.archetype: str # Policy the agent is moved by ('controller' or 'coward')
     ```
     ## Methods
     ```
@@ -208,10 +209,13 @@ class Agent(Entity):
     get_char(self) -> str # Return the entity char
     """
 
-    def __init__(self, level: int = 0, health=100, char: str = " E ") -> None:
+    def __init__(
+        self, level: int = 0, health=100, char: str = " E ", archetype: str = "controller"
+    ) -> None:
         """Initialise the enemy."""
         super().__init__(char=char, level=level, health=health)
         self.movement_delay = 0.85
+        self.archetype = archetype  # Policy the agent is moved by
 
     def get_char(self) -> str:
         """Return the enemy character."""
@@ -0,0 +1,138 @@
+"""Tiles."""
+
+# -- Imports --
+
+import sys
+from enum import IntEnum
+
+
+class Tile(IntEnum):
+    """Tile type shared by rooms, buildings and the overworld, stored as one byte per cell in a TileGrid."""
+
+    EMPTY = 0
+    WALL = 1
+    DOOR = 2
+    CHEST = 3
+    PLAYER = 4
+    DEAD = 5
+    GRASS = 6
+    ROAD = 7
+    DUNGEON = 8
+    TOWN = 9
+    SHOP = 10
+    INN = 11
+    HOUSE = 12
+    BENCH = 13
+    NPC = 14
+
+
+GLYPHS = {
+    Tile.EMPTY: " _ ",
+    Tile.WALL: " # ",
+    Tile.DOOR: " / ",
+    Tile.CHEST: " C ",
+    Tile.PLAYER: " P ",
+    Tile.DEAD: " X ",
+    Tile.GRASS: " . ",
+    Tile.ROAD: " = ",
+    Tile.DUNGEON: " Δ ",
+    Tile.TOWN: " T ",
+    Tile.SHOP: " S ",
+    Tile.INN: " I ",
+    Tile.HOUSE: " H ",
+    Tile.BENCH: " $ ",
+    Tile.NPC: " X ",
+}  # Tile: glyph drawn for it
+COLOURS = {
+    Tile.EMPTY: 2,
+    Tile.WALL: 1,
+    Tile.DOOR: 5,
+    Tile.PLAYER: 4,
+    Tile.GRASS: 2,
+    Tile.ROAD: 1,
+}  # Tile: curses colour pair, every other tile uses pair 3
+TILES = {
+    glyph: tile for tile, glyph in reversed(GLYPHS.items())
+}  # Glyph: tile, the first tile wins so ' X ' reads as a dead agent
+GLYPH_TABLE = [GLYPHS[tile] for tile in Tile]  # Tile value: glyph, for render loops
+COLOUR_TABLE = [COLOURS.get(tile, 3) for tile in Tile]  # Tile value: colour pair
+
+
+def get_colour(glyph: str) -> int:
+    """Return the curses colour pair of a drawn glyph, pair 3 for glyphs that are not tiles (entities)."""
+    tile = TILES.get(glyph)
+    return 3 if tile is None else COLOUR_TABLE[tile]
+
+
+class TileGrid:
+    """Tile grid.
+
+    ## Description
+    Row major grid of tiles stored as a `bytearray`, one byte per cell instead of a pointer to a glyph string.
+    Glyphs only exist when a grid is drawn, `as_array` gives a NumPy uint8 view of the same memory for whole-grid work.
+    ## Attributes
+    ```
+    self.height: int # Rows
+    self.width: int # Columns
+    self.cells: bytearray # Tile values, row by row
+    ```
+    ## Methods
+    ```
+    from_glyphs(cls, rows: list[list[str]]) -> TileGrid # Return a grid read from rows of glyphs
+    get(self, y: int, x: int) -> int # Return the tile at a cell
+    set(self, y: int, x: int, tile: Tile) -> None # Set the tile at a cell
+    in_bounds(self, y: int, x: int) -> bool # Return True when the cell is on the grid
+    to_glyphs(self) -> list[list[str]] # Return the rows of glyphs to draw
+    as_array(self) -> np.ndarray # Return a (height, width) uint8 view of the cells
+    get_memory(self) -> int # Return the bytes the grid takes
+    ```
+    """
+
+    __slots__ = ["height", "width", "cells"]
+
+    def __init__(self, height: int, width: int, fill: Tile = Tile.EMPTY) -> None:
+        """Initialise tile grid."""
+        if height <= 0 or width <= 0:
+            raise ValueError("a tile grid needs at least one row and column")
+        self.height = height
+        self.width = width
+        self.cells = bytearray([fill]) * (height * width)
+
+    @classmethod
+    def from_glyphs(cls, rows: list[list[str]]) -> "TileGrid":
+        """Return a grid read from rows of glyphs."""
+        grid = cls(len(rows), len(rows[0]))
+        try:
+            grid.cells = bytearray(bytes(TILES[glyph] for row in rows for glyph in row))  # Sized exactly, a generator over-allocates
+        except KeyError as error:
+            raise ValueError(f"{error.args[0]!r} is not a tile glyph") from None
+        return grid
+
+    def get(self, y: int, x: int) -> int:
+        """Return the tile at a cell."""
+        return self.cells[y * self.width + x]
+
+    def set(self, y: int, x: int, tile: Tile) -> None:
+        """Set the tile at a cell."""
+        self.cells[y * self.width + x] = tile
+
+    def in_bounds(self, y: int, x: int) -> bool:
+        """Return True when the cell is on the grid."""
+        return 0 <= y < self.height and 0 <= x < self.width
+
+    def to_glyphs(self) -> list[list[str]]:
+        """Return the rows of glyphs to draw."""
+        return [
+            [GLYPH_TABLE[tile] for tile in self.cells[y * self.width : (y + 1) * self.width]]
+            for y in range(self.height)
+        ]
+
+    def as_array(self):
+        """Return a (height, width) uint8 view of the cells, writes go straight to the grid."""
+        import numpy as np
+
+        return np.frombuffer(self.cells, dtype=np.uint8).reshape(self.height, self.width)
+
+    def get_memory(self) -> int:
+        """Return the bytes the grid takes."""
+        return sys.getsizeof(self.cells)
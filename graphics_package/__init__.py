@@ -1,10 +1,21 @@
 """Graphics package."""
 
-from .building_scene import BuildingScene
-from .dungeon_scene import DungeonScene
-from .menu_scene import MenuScene
-from .overworld_scene import OverworldScene
-from .scene import Scene
+import importlib
+
+MODULES = {
+    "BuildingScene": ".building_scene",
+    "DungeonScene": ".dungeon_scene",
+    "MenuScene": ".menu_scene",
+    "OverworldScene": ".overworld_scene",
+    "Scene": ".scene",
+}  # Name: module that defines it, imported on first use
 
 # "Building_Scene"
 __all__ = ["DungeonScene", "MenuScene", "OverworldScene", "Scene", "BuildingScene"]
+
+
+def __getattr__(name):
+    """Import the module that defines `name` on first use so importing the package stays cheap."""
+    if name in MODULES:
+        return getattr(importlib.import_module(MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,6 +5,7 @@
 import curses
 import time
 
+from generators_package.tiles import get_colour
 from managers_package import DungeonManager
 from managers_package.chest_manager import Chest
 
@@ -29,6 +30,7 @@ class DungeonScene(Scene):
     extract_obj(self, obj: DungeonManager) # Extract the manager object.
     on_enter(self) # Run when entering a scene.
     draw(self) # Draw the current scene.
+    get_camera(self, size: int, rows: int, cols: int) -> tuple[int, int, int, int] # Return the part of the room that fits on the screen.
     draw_side_win(self) # Draw the side window.
     damage_colour(self, coordinates: tuple[int, int]) # Set the colour of a tile to red.
     on_exit(self) # Run when exiting a scene.
@@ -54,54 +56,52 @@ class DungeonScene(Scene):
     def draw(self):
         """Draw the current scene."""
         global last_draw
+        self.manager_obj.scheduler.run_due()  # Ends hit flashes and footsteps even when no key is pressed
         now = time.time()
         if now - last_draw < 1/30:   # 30 FPS cap
             return
         last_draw = now
         self.stdscr.clear()  # clears screen
-        room_map = self.manager_obj.current_room.map  # current map
-        entity_map = self.manager_obj.current_room.entity_map  # entity map
-        colour = curses.color_pair(3)
-        for y, row in enumerate(room_map):  # Applies colouring
-            x_pos = 0
-            for tile in row:
-                coloured = False
-                if not isinstance(entity_map[y][int(x_pos / len(tile))], Chest):  # type: ignore
-                    if entity_map[y][int(x_pos / len(tile))].is_hit:  # type: ignore
-                        colour = curses.color_pair(6)
-                        coloured = True
-                if tile == " _ ":
-                    colour = curses.color_pair(2)
-                    coloured = True
-                if tile == " P ":
-                    if self.manager_obj.player.is_hit:
-                        colour = curses.color_pair(6)
-                        coloured = True
-                    else:
-                        colour = curses.color_pair(4)
-                        coloured = True
-                    if not self.manager_obj.player.is_making_noise: # When the player is not making noise make the character dimmer
-                        colour |= curses.A_DIM
-                if tile == " # ":
-                    colour = curses.color_pair(1)
-                    coloured = True
-                if tile == " / ":
-                    colour = curses.color_pair(5)
-                    coloured = True
-                if not coloured:
-                    colour = curses.color_pair(3)
+        room = self.manager_obj.current_room  # current room
+        entity_map = room.entity_map  # entity map
+        height, width = self.stdscr.getmaxyx()
+        top, left, rows, cols = self.get_camera(
+            room.tiles.height, max(1, height - 1), max(1, width // 3)
+        )  # Rooms bigger than the screen scroll with the player, the bottom line holds the text
+        glyphs = room.get_glyphs(top, left, rows, cols)  # Only the part on the screen is drawn
+        for y in range(top, top + rows):  # Applies colouring
+            row = glyphs[y - top]
+            for x in range(left, left + cols):
+                tile = row[x - left]
+                pair = get_colour(tile)  # Terrain colour, pair 3 for entities
+                entity = entity_map[y][x]
+                if pair == 3 and not isinstance(entity, Chest) and entity.is_hit:  # type: ignore
+                    pair = 6
+                if tile == " P " and self.manager_obj.player.is_hit:
+                    pair = 6
+                colour = curses.color_pair(pair)
+                if tile == " P " and not self.manager_obj.player.is_making_noise: # When the player is not making noise make the character dimmer
+                    colour |= curses.A_DIM
 
                 try:
-                    self.stdscr.addstr(y, x_pos, str(tile), colour)
+                    self.stdscr.addstr(y - top, (x - left) * len(tile), str(tile), colour)
                 except curses.error:
                     pass
-                x_pos += len(tile)  # type: ignore
 
         self.add_text_bottom()  # Adds text to bottom
         self.draw_side_win()  # Draws side screen
         self.stdscr.noutrefresh()  # Queue screen refresh
         curses.doupdate()
 
+    def get_camera(self, size: int, rows: int, cols: int) -> tuple[int, int, int, int]:
+        """Return the top row, left column, rows and columns of the room to draw, centred on the player and kept inside the room."""
+        rows = min(rows, size)
+        cols = min(cols, size)
+        player_y, player_x = self.manager_obj.player.pos
+        top = min(max(player_y - rows // 2, 0), size - rows)
+        left = min(max(player_x - cols // 2, 0), size - cols)
+        return top, left, rows, cols
+
     def draw_side_win(self):
         """Draw the side window."""
         assert self.stat_win is not None
@@ -137,10 +137,16 @@ class DungeonScene(Scene):
 
     def damage_colour(self, coordinates: tuple[int, int]):
         """Set the colour of a tile to red."""
-        tile = self.manager_obj.current_room.map[coordinates[0]][coordinates[1]]
-        self.stdscr.addstr(
-            coordinates[0], coordinates[1] * 3, tile, curses.color_pair(6)
+        room = self.manager_obj.current_room
+        tile = room.get_glyphs(coordinates[0], coordinates[1], 1, 1)[0][0]
+        height, width = self.stdscr.getmaxyx()
+        top, left, rows, cols = self.get_camera(
+            room.tiles.height, max(1, height - 1), max(1, width // 3)
         )
+        if top <= coordinates[0] < top + rows and left <= coordinates[1] < left + cols:  # Only tiles on the screen
+            self.stdscr.addstr(
+                coordinates[0] - top, (coordinates[1] - left) * 3, tile, curses.color_pair(6)
+            )
 
     def on_exit(self):
         """Run when exiting a scene."""
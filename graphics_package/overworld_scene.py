@@ -4,6 +4,7 @@
 
 import curses
 
+from generators_package.tiles import get_colour
 from managers_package.overworld_manager import OverworldManager
 
 from .scene import Scene
@@ -60,15 +61,7 @@ class OverworldScene(Scene):
             ):  # Gets the visible window
                 x_pos = 0
                 for tile in row:  # Itterates through the map applying colours
-                    if tile == " . ":
-                        color = curses.color_pair(2)
-                    elif tile == " P ":
-                        color = curses.color_pair(4)
-                    elif tile == " = ":
-                        color = curses.color_pair(1)
-                    else:
-                        color = curses.color_pair(3)
-
+                    color = curses.color_pair(get_colour(tile))
                     self.stdscr.addstr(y, x_pos, tile, color)
                     x_pos += len(tile)
         self.stdscr.refresh()  # Refreshes the screen
@@ -2,19 +2,32 @@
 
 # -- Imports --
 
-from time import sleep, ctime
+from time import sleep, ctime, perf_counter
+
+PROCESS_START = perf_counter()  # Startup clock, read before anything else is imported
+
 from typing import Any
+import argparse
+import importlib
 import random
 import curses
 import os
-from art import text2art
-from factory_package.item_factory import WeaponFactory, ItemFactory
-from managers_package.overworld_manager import OverworldManager
-from managers_package.menu_manager import MenuManager
 from managers_package.debug_manager import Debugger
-from managers_package import load_game
-from managers_package.director import Director
-from generators_package.entity_generator import Player
+
+TITLE_LINE_DELAY = 0.01  # Seconds between each line of the title screen
+STARTUP_BUDGET = {
+    "first_prompt": 0.5,
+    "first_overworld_frame": 1.0,
+}  # Seconds from process start, checked by --startup-profile
+PROMPT_MODULES = ["art"]  # Imported before the first prompt
+GAME_MODULES = [
+    "factory_package.item_factory",
+    "generators_package.entity_generator",
+    "managers_package.save_manager",
+    "managers_package.overworld_manager",
+    "managers_package.menu_manager",
+    "managers_package.director",
+]  # Imported after the prompts, before the first overworld frame
 
 
 def clear():
@@ -27,8 +40,89 @@ def get_last_edited_times(path_to_file: str, file_name: str):
     return ctime(os.path.getmtime(f"{path_to_file}/{file_name}"))
 
 
+def print_title():
+    """Print the title screen a line at a time."""
+    from art import text2art
+
+    art = text2art("retrogue", font="Chiseled")  # Title screen
+    for line in art.splitlines(keepends=True):
+        print(line, end="", flush=True)
+        sleep(TITLE_LINE_DELAY)
+
+
+def create_overworld(player, overworld_coordinates, player_position):
+    """Create the overworld manager the game starts in."""
+    from managers_package.overworld_manager import OverworldManager
+
+    return OverworldManager(
+        player=player,
+        weapon_factory=weapon_factory,
+        item_factory=item_factory,
+        coordinates=overworld_coordinates,
+        player_pos=player_position,
+        debugger=debug_manager,
+    )
+
+
+def import_modules(modules: list[str]) -> dict[str, float]:
+    """Import each module in order and return the time in seconds each one added."""
+    import_times = {}
+    for module in modules:
+        start = perf_counter()
+        importlib.import_module(module)
+        import_times[module] = perf_counter() - start
+    return import_times
+
+
+def profile_startup() -> int:
+    """Print an import time breakdown and the time to the first prompt and first overworld frame, return 1 if over STARTUP_BUDGET."""
+    global weapon_factory, item_factory
+
+    import_times = import_modules(PROMPT_MODULES)
+    print_title()
+    first_prompt = perf_counter() - PROCESS_START  # The game would now wait for input
+
+    import_times.update(import_modules(GAME_MODULES))
+    from factory_package.item_factory import ItemFactory, WeaponFactory
+    from generators_package.entity_generator import Player
+
+    weapon_factory = WeaponFactory()
+    item_factory = ItemFactory()
+    weapon_factory.initilise_registry()
+    item_factory.initilise_registry()
+    player = Player(
+        debugger=debug_manager,
+        weapon=weapon_factory.create("fists"),
+        inventory=[item_factory.create("None"), item_factory.create("None")],
+    )
+    overworld = create_overworld(
+        player, (random.randint(0, 10000), random.randint(0, 10000)), None
+    )
+    overworld.get_visible_window()  # Everything the overworld scene draws
+    overworld.generate_minimap()
+    first_frame = perf_counter() - PROCESS_START
+
+    print("\n-- Import times --")
+    for module, seconds in import_times.items():
+        print(f"{module}: {seconds * 1000:.1f}ms")
+    print("-- Startup --")
+    over_budget = False
+    for name, seconds in [
+        ("first_prompt", first_prompt),
+        ("first_overworld_frame", first_frame),
+    ]:
+        budget = STARTUP_BUDGET[name]
+        over_budget = over_budget or seconds > budget
+        status = "OK" if seconds <= budget else "OVER BUDGET"
+        print(f"{name}: {seconds:.3f}s (budget {budget:.3f}s) {status}")
+    return 1 if over_budget else 0
+
+
 def launcher(stdscr, player, overworld_coordinates, player_position, file_name):
     """Launch the director which starts the game loop."""
+    from managers_package.director import Director
+    from managers_package.menu_manager import MenuManager
+
     curses.curs_set(0)
     curses.start_color()
     curses.use_default_colors()
@@ -40,14 +134,7 @@ def launcher(stdscr, player, overworld_coordinates, player_position, file_name):
     curses.init_pair(6, curses.COLOR_RED, -1)
     curses.curs_set(0)
 
-    overworld = OverworldManager(
-        player=player,
-        weapon_factory=weapon_factory,
-        item_factory=item_factory,
-        coordinates=overworld_coordinates,
-        player_pos=player_position,
-        debugger=debug_manager,
-    )
+    overworld = create_overworld(player, overworld_coordinates, player_position)
     menu = MenuManager(
         debugger=debug_manager,
         weapon_factory=weapon_factory,
@@ -70,19 +157,55 @@ def launcher(stdscr, player, overworld_coordinates, player_position, file_name):
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Retrogue")
+    parser.add_argument(
+        "--startup-profile",
+        action="store_true",
+        help="Print an import time breakdown and startup times then exit",
+    )
+    parser.add_argument(
+        "--ai-backend", choices=["torch", "numpy", "int8", "heuristic"], help="Enemy AI inference backend"
+    )
+    parser.add_argument(
+        "--ai-policy", choices=["full", "student"], help="Enemy AI policy network"
+    )
+    parser.add_argument(
+        "--ai-archetypes",
+        help="Enemy archetype weights, e.g. controller=3,coward=1",
+    )
+    parser.add_argument(
+        "--room-size", type=int, help="Side length of dungeon rooms, 7 to 256"
+    )
+    parser.add_argument(
+        "--room-generator", choices=["auto", "numpy", "python"], help="Dungeon room cellular automaton implementation"
+    )
+    args = parser.parse_args()
+    if args.room_size:
+        os.environ["RETROGUE_ROOM_SIZE"] = str(args.room_size)
+    if args.room_generator:
+        os.environ["RETROGUE_ROOM_GENERATOR"] = args.room_generator
+    if args.ai_archetypes:
+        os.environ["RETROGUE_AI_ARCHETYPES"] = args.ai_archetypes
+    if args.ai_backend:
+        os.environ["RETROGUE_AI_BACKEND"] = args.ai_backend
+    if args.ai_policy:
+        os.environ["RETROGUE_AI_POLICY"] = args.ai_policy
+
     debug_manager = Debugger("debug")
+    if args.startup_profile:
+        raise SystemExit(profile_startup())
     CURRENT_PATH = os.path.curdir  # Gets the current directory to load game save
 
     SAVE_PATH = f"{CURRENT_PATH}/game_data"  # Path to game saves
 
-    art = text2art("retrogue", font="Chiseled")  # Title screen
-    for row in art:
-        for letter in row:  # type: ignore
-            print(letter, end="")
-            sleep(0.001)
+    print_title()
 
     load_save = input("\n Would you like to load a save (y/n) \n-> ")
     clear()
+    from factory_package.item_factory import WeaponFactory, ItemFactory
+    from generators_package.entity_generator import Player
+    from managers_package import load_game
+
     weapon_factory = WeaponFactory()  # Weapon factory
     item_factory = ItemFactory()  # Item factory
 
@@ -1,12 +1,25 @@
 """Manager package."""
 
-from .debug_manager import Debugger
-from .dungeon_manager import DungeonManager
-from .entity_manager import EntityManager
-from .menu_manager import MenuManager
-from .overworld_manager import OverworldManager
-from .room_manager import RoomManager
-from .save_manager import load_game, save_game
+import importlib
+
+MODULES = {
+    "Debugger": ".debug_manager",
+    "EntityManager": ".entity_manager",
+    "RoomManager": ".room_manager",
+    "DungeonManager": ".dungeon_manager",
+    "OverworldManager": ".overworld_manager",
+    "save_game": ".save_manager",
+    "load_game": ".save_manager",
+    "MenuManager": ".menu_manager",
+    "AIWorker": ".ai_worker",
+    "get_ai_worker": ".ai_worker",
+    "AIBudget": ".ai_budget",
+    "RoomPrefetcher": ".room_prefetcher",
+    "get_room_prefetcher": ".room_prefetcher",
+    "SimulatedClock": ".clock",
+    "SimulationManager": ".simulation_manager",
+    "RoomVectorEnv": ".vector_env",
+}  # Name: module that defines it, imported on first use
 
 __all__ = [
     "Debugger",
@@ -17,4 +30,19 @@ __all__ = [
     "save_game",
     "load_game",
     "MenuManager",
+    "AIWorker",
+    "get_ai_worker",
+    "AIBudget",
+    "RoomPrefetcher",
+    "get_room_prefetcher",
+    "SimulatedClock",
+    "SimulationManager",
+    "RoomVectorEnv",
 ]
+
+
+def __getattr__(name):
+    """Import the module that defines `name` on first use so importing the package stays cheap."""
+    if name in MODULES:
+        return getattr(importlib.import_module(MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
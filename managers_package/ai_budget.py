@@ -0,0 +1,185 @@
+"""AI frame budget."""
+
+# -- Imports --
+
+import os
+import time
+
+
+def default_budget_ms() -> float:
+    """Return the budget set with RETROGUE_AI_BUDGET_MS, otherwise 4ms (0 turns the budget off)."""
+    budget_ms = float(os.environ.get("RETROGUE_AI_BUDGET_MS", 4.0))
+    if budget_ms < 0:
+        raise ValueError("RETROGUE_AI_BUDGET_MS must not be negative")
+    return budget_ms
+
+
+class AIBudget:
+    """AI budget.
+
+    ## Description
+    Per frame time budget for the agent decisions made on the main thread.
+    Ready agents are served in round robin order starting after the last agent served in the room, in batches sized from the
+    measured cost of a batch (a fixed cost per forward pass plus a cost per agent, fitted to a moving average of past batches)
+    so batching is kept. Once the budget is spent the remaining agents are deferred to the next frame,
+    they are still ready then and go first, so `movement_delay` stays the minimum time between an agent's moves.
+    At least one agent is decided every frame, a frame that runs past the budget is recorded as an overrun.
+    With the AI worker deciding moves in the background `run_async` spends the budget on the main thread's share instead,
+    applying the collected moves in the same round robin order (the rest wait in the room's queue for the next frame)
+    and submitting only as many ready agents as one frame can apply.
+    ## Attributes
+    ```
+    self.budget_ms: float # Milliseconds of agent decisions allowed per frame
+    self.agent_ms: float # Estimated cost of each agent in a batch
+    self.batch_ms: float # Estimated fixed cost of a batch
+    self.moments: list[float] | None # Moving averages of agents, cost, agents squared and agents times cost of past batches
+    self.frames: int # Frames that decided agents
+    self.decided: int # Agents decided
+    self.deferred: int # Agents pushed to a later frame
+    self.overruns: int # Frames that ran past the budget
+    self.overrun_ms: float # Total milliseconds past the budget
+    self.max_overrun_ms: float # Worst frame past the budget
+    ```
+    ## Methods
+    ```
+    run(self, room: RoomManager, agents: list[Agent], current_time: float) -> int # Decide and move as many ready agents as the budget allows, return how many moved
+    run_async(self, room: RoomManager, ai_worker: AIWorker, current_time: float) -> int # Apply as many queued moves as the budget allows and submit the next ready agents, return how many moved
+    add_frame(self, served: int, deferred: int, elapsed_ms: float) -> None # Count a frame that served agents
+    get_batch_size(self, remaining_ms: float, waiting: int) -> int # Return how many agents fit in the remaining budget
+    add_sample(self, agents: int, cost_ms: float) -> None # Refit the batch cost to a measured batch
+    get_order(self, room: RoomManager, agents: list[Agent]) -> list[Agent] # Return the ready agents in round robin order
+    get_stats(self) -> dict[str, float] # Return the frame, agent and overrun counters
+    ```
+    """
+
+    def __init__(self, budget_ms: float = 4.0) -> None:
+        """Initialise AI budget."""
+        if budget_ms <= 0:
+            raise ValueError("budget_ms must be positive")
+        self.budget_ms = budget_ms  # Milliseconds of agent decisions per frame
+        self.agent_ms = 0.0  # Estimated cost of each agent in a batch
+        self.batch_ms = 0.0  # Estimated fixed cost of a batch
+        self.moments: list[float] | None = None  # None until the first batch is measured
+        self.frames = 0
+        self.decided = 0
+        self.deferred = 0
+        self.overruns = 0
+        self.overrun_ms = 0.0
+        self.max_overrun_ms = 0.0
+
+    def run(self, room, agents: list, current_time: float) -> int:
+        """Decide and move as many ready agents as the budget allows, return how many moved."""
+        start = time.perf_counter()
+        order = self.get_order(room, agents)
+        served = 0
+        while served < len(order):
+            remaining_ms = self.budget_ms - (time.perf_counter() - start) * 1000
+            count = self.get_batch_size(remaining_ms, len(order) - served)
+            if served and not count:  # Nothing more fits, the rest wait for the next frame
+                break
+            batch = order[served : served + max(count, 1)]
+            batch_start = time.perf_counter()
+            room.apply_agent_moves(batch, room.get_lod_decisions(batch), current_time)
+            self.add_sample(len(batch), (time.perf_counter() - batch_start) * 1000)
+            served += len(batch)
+        room.agent_cursor = (room.entity_manager.Agents.index(order[served - 1]) + 1) % len(
+            room.entity_manager.Agents
+        )  # The next frame starts after the last agent served
+        self.add_frame(served, len(order) - served, (time.perf_counter() - start) * 1000)
+        return served
+
+    def run_async(self, room, ai_worker, current_time: float) -> int:
+        """Apply as many of the room's queued moves as the budget allows, then submit the next ready agents to the AI worker, return how many moved.
+
+        Ready agents are only submitted once the queue is empty, so an agent is never decided twice before it moves.
+        """
+        start = time.perf_counter()
+        queued = room.queued_moves
+        served = 0
+        while served < len(queued):
+            if served and (time.perf_counter() - start) * 1000 >= self.budget_ms:
+                break
+            agent, vector_key = queued[served]
+            room.apply_agent_moves([agent], [vector_key], current_time)
+            served += 1
+        if served:
+            self.add_sample(served, (time.perf_counter() - start) * 1000)
+            room.agent_cursor = (room.entity_manager.Agents.index(queued[served - 1][0]) + 1) % len(
+                room.entity_manager.Agents
+            )  # The next submission starts after the last agent served
+            del queued[:served]
+        deferred = len(queued)
+        submitted = 0
+        if not queued and not ai_worker.is_busy(room):  # One decision step in flight per room
+            order = self.get_order(room, room.get_ready_agents(current_time))
+            if order:
+                submitted = max(self.get_batch_size(self.budget_ms, len(order)), 1)  # Moves one frame can apply
+                ai_worker.submit(room, order[:submitted])
+                deferred += len(order) - submitted
+        if served or submitted:
+            self.add_frame(served, deferred, (time.perf_counter() - start) * 1000)
+        return served
+
+    def add_frame(self, served: int, deferred: int, elapsed_ms: float) -> None:
+        """Count a frame that served agents and record it as an overrun when it ran past the budget."""
+        self.frames += 1
+        self.decided += served
+        self.deferred += deferred
+        if elapsed_ms > self.budget_ms:
+            self.overruns += 1
+            self.overrun_ms += elapsed_ms - self.budget_ms
+            self.max_overrun_ms = max(self.max_overrun_ms, elapsed_ms - self.budget_ms)
+
+    def get_batch_size(self, remaining_ms: float, waiting: int) -> int:
+        """Return how many of the waiting agents fit in the remaining budget, one before any batch is measured."""
+        if self.moments is None:
+            return 1
+        if remaining_ms <= self.batch_ms:
+            return 0
+        return min(waiting, int((remaining_ms - self.batch_ms) / self.agent_ms))
+
+    def add_sample(self, agents: int, cost_ms: float) -> None:
+        """Refit the batch cost (batch_ms + agents * agent_ms) to a measured batch."""
+        if cost_ms > 10 * self.budget_ms:  # A one off stall such as the model loading, not the cost of deciding
+            return
+        sample = [agents, cost_ms, agents * agents, agents * cost_ms]
+        if self.moments is None:
+            self.moments = sample
+        else:
+            self.moments = [
+                0.8 * moment + 0.2 * value for moment, value in zip(self.moments, sample)
+            ]
+        mean_agents, mean_cost, mean_squares, mean_products = self.moments
+        variance = mean_squares - mean_agents * mean_agents
+        if variance > 1e-6:  # Least squares line through past batches
+            self.agent_ms = (mean_products - mean_agents * mean_cost) / variance
+            self.batch_ms = mean_cost - self.agent_ms * mean_agents
+        else:  # Every batch was the same size, the cost cannot be split yet
+            self.agent_ms = mean_cost / mean_agents
+            self.batch_ms = 0.0
+        if self.agent_ms <= 0 or self.batch_ms < 0:  # Noisy fit, fall back to a cost per agent
+            self.agent_ms = mean_cost / mean_agents
+            self.batch_ms = 0.0
+
+    def get_order(self, room, agents: list) -> list:
+        """Return the ready agents in round robin order, starting from the room's cursor."""
+        all_agents = room.entity_manager.Agents
+        cursor = room.agent_cursor
+        positions = {id(agent): index for index, agent in enumerate(all_agents)}
+        return sorted(
+            agents, key=lambda agent: (positions[id(agent)] - cursor) % len(all_agents)
+        )
+
+    def get_stats(self) -> dict[str, float]:
+        """Return the frame, agent and overrun counters."""
+        return {
+            "budget_ms": self.budget_ms,
+            "agent_ms": self.agent_ms,
+            "batch_ms": self.batch_ms,
+            "frames": self.frames,
+            "decided": self.decided,
+            "deferred": self.deferred,
+            "overruns": self.overruns,
+            "overrun_ms": self.overrun_ms,
+            "max_overrun_ms": self.max_overrun_ms,
+        }
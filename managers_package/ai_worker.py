@@ -0,0 +1,92 @@
+"""AI worker."""
+
+# -- Imports --
+
+from concurrent.futures import ThreadPoolExecutor
+
+from generators_package.entity_generator import Agent
+import nn_package
+
+
+class AIWorker:
+    """AI worker.
+
+    ## Description
+    Runs the enemy decision step (viewport, sound window, encoding and the policy) on a background thread
+    so slow inference never delays the player's move or the frame.
+    Each room sends a read-only view of itself with `submit`, the decided moves are collected and applied on the main thread on the next tick
+    along with the view's LOD counters, so the worker never writes to the room itself.
+    Decision steps run one at a time, so every view shares the worker's NN input buffer.
+    ## Attributes
+    ```
+    self.executor: ThreadPoolExecutor # Single background thread
+    self.pending: dict[RoomManager, tuple[list[Agent], DecisionView, Future]] # Agents, view and decision step in flight for each room
+    self.feature_schema: FeatureSchema | None # NN input buffer of every decision step, created on the first submit
+    ```
+    ## Methods
+    ```
+    get_feature_schema(self) -> FeatureSchema # Return the NN input buffer, grown by the schema when a batch needs more rows
+    submit(self, room, agents: list[Agent]) -> None # Decide moves for `agents` on a read-only view of the room
+    is_busy(self, room) -> bool # Return True while a decision step for the room is running
+    collect(self, room) -> tuple[list[Agent], list[int]] | None # Return the agents and their vector keys once decided, counting the view's LOD decisions in the room
+    discard(self, room) -> None # Forget the decision step and the queued moves of a room the player has left
+    shutdown(self) -> None # Stop the background thread
+    ```
+    """
+
+    def __init__(self) -> None:
+        """Initialise AI worker."""
+        self.executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="ai-worker"
+        )  # Single background thread
+        self.pending: dict = {}  # Decision step in flight for each room
+        self.feature_schema = None  # NN input buffer, created on the first submit
+
+    def get_feature_schema(self):
+        """Return the NN input buffer of every decision step, it grows itself when a batch has more agents than rows."""
+        if self.feature_schema is None:  # Created here so numpy is not imported at startup
+            self.feature_schema = nn_package.FeatureSchema()
+        return self.feature_schema
+
+    def submit(self, room, agents: list[Agent]) -> None:
+        """Decide moves for `agents` on a read-only view of the room."""
+        view, agent_copies = room.snapshot(agents, self.get_feature_schema())  # Taken on the main thread
+        future = self.executor.submit(view.get_lod_decisions, agent_copies)
+        self.pending[room] = (agents, view, future)
+
+    def is_busy(self, room) -> bool:
+        """Return True while a decision step for the room is running."""
+        return room in self.pending
+
+    def collect(self, room) -> tuple[list[Agent], list[int]] | None:
+        """Return the agents and their vector keys once decided, otherwise None, and add the view's LOD counters to the room's."""
+        pending = self.pending.get(room)
+        if pending is None or not pending[2].done():
+            return None
+        del self.pending[room]
+        agents, view, future = pending
+        vector_keys = future.result()  # Re-raises any error from the worker
+        for tier, count in view.lod_counters.items():  # Only the main thread writes the room's counters
+            room.lod_counters[tier] += count
+        return agents, vector_keys
+
+    def discard(self, room) -> None:
+        """Forget the decision step and the queued moves of a room the player has left."""
+        self.pending.pop(room, None)
+        room.queued_moves = []
+
+    def shutdown(self) -> None:
+        """Stop the background thread."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.pending.clear()
+
+
+shared_ai_worker: AIWorker | None = None  # Shared by every dungeon, created on first use
+
+
+def get_ai_worker() -> AIWorker:
+    """Return the shared AI worker, creating it on first use."""
+    global shared_ai_worker
+    if shared_ai_worker is None:
+        shared_ai_worker = AIWorker()
+    return shared_ai_worker
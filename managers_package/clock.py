@@ -0,0 +1,56 @@
+"""Game clock."""
+
+# -- Imports --
+
+import time
+
+
+class GameClock:
+    """Game clock.
+
+    ## Description
+    Source of the time used for movement delays, reads the wall clock.
+    ## Methods
+    ```
+    now(self) -> float # Return the current time in seconds
+    ```
+    """
+
+    def now(self) -> float:
+        """Return the current time in seconds."""
+        return time.time()
+
+
+class SimulatedClock(GameClock):
+    """Simulated clock.
+
+    ## Description
+    Game clock that only moves when it is advanced, so a headless run can play at full speed
+    while movement delays still pass in game time.
+    ## Attributes
+    ```
+    self.current: float # Current simulated time, starts at the wall time so existing entity timestamps stay valid
+    ```
+    ## Methods
+    ```
+    now(self) -> float # Return the current simulated time
+    advance(self, seconds: float) -> None # Move the clock forwards
+    ```
+    """
+
+    def __init__(self, start: float | None = None) -> None:
+        """Initialise simulated clock."""
+        self.current = time.time() if start is None else start  # Current simulated time
+
+    def now(self) -> float:
+        """Return the current simulated time."""
+        return self.current
+
+    def advance(self, seconds: float) -> None:
+        """Move the clock forwards."""
+        if seconds < 0:
+            raise ValueError("the clock can only move forwards")
+        self.current += seconds
+
+
+wall_clock = GameClock()  # Shared by every room that is not given a clock
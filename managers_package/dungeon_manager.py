@@ -4,7 +4,12 @@
 
 from typing import Any
 
-from managers_package.room_manager import Exit, RoomManager
+from managers_package.ai_budget import AIBudget, default_budget_ms
+from managers_package.ai_worker import get_ai_worker
+from managers_package.clock import GameClock, wall_clock
+from managers_package.room_manager import Exit, RoomManager, default_room_size
+from managers_package.room_prefetcher import get_room_prefetcher
+from managers_package.scheduler import TimerScheduler
 
 
 class DungeonManager:
@@ -17,8 +22,14 @@ class DungeonManager:
     self.player: Player # Player object
     self.debugger: Debugger # Debugger
     self.dungeon_size: int # How many rooms can stem from the original room
+    self.room_size: int # Side length of every room in the dungeon
     self.graph: Room_graph # Room graph
     self.current_room: Room_manager | Any # Inital room
+    self.ai_worker: AIWorker | None # Background worker deciding enemy moves, None decides them on the main thread
+    self.clock: GameClock # Time source shared by every room in the dungeon
+    self.scheduler: TimerScheduler # Footstep and hit timers of every room, run by the game loop
+    self.ai_budget: AIBudget | None # Per frame budget of the agent decisions made on the main thread or of the AI worker's moves applied there, None moves every ready agent at once
+    self.room_prefetcher: RoomPrefetcher | None # Generates the rooms behind unexplored doors in the background, None generates each room on entry
     ```
     ## Methods
     ```
@@ -27,25 +38,56 @@ class DungeonManager:
     ```
     """
 
-    def __init__(self, player, debugger, weapon_factory, item_factory, size=2) -> None:
-        """Initalise dungeon manager."""
+    def __init__(
+        self,
+        player,
+        debugger,
+        weapon_factory,
+        item_factory,
+        size=2,
+        background_ai: bool = True,
+        clock: GameClock | None = None,
+        ai_budget_ms: float | None = None,
+        room_size: int | None = None,
+        prefetch_rooms: bool = True,
+    ) -> None:
+        """Initalise dungeon manager, `ai_budget_ms` defaults to RETROGUE_AI_BUDGET_MS and 0 turns the budget off, `room_size` defaults to RETROGUE_ROOM_SIZE."""
+        self.clock = clock or wall_clock  # Time source shared by every room in the dungeon
+        self.scheduler = TimerScheduler(self.clock)  # Footstep and hit timers of every room
+        if ai_budget_ms is None:
+            ai_budget_ms = default_budget_ms()
+        self.ai_budget = (
+            AIBudget(ai_budget_ms) if ai_budget_ms > 0 else None
+        )  # Shared by every room, only the current room moves
+        self.room_prefetcher = (
+            get_room_prefetcher() if prefetch_rooms else None
+        )  # Rooms are generated before the player reaches their door
         self.player = player  # Player object
         self.debugger = debugger  # Debugger
         self.weapon_factory = weapon_factory  # Weapon factory
         self.item_factory = item_factory  # Item factory
         self.dungeon_size = size  # How many rooms can stem from the original room
+        self.room_size = room_size or default_room_size()  # Side length of every room
         self.graph = RoomGraph(
             dungeon_manager=self,
             weapon_factory=self.weapon_factory,
             item_factory=self.item_factory,
             max_level=self.dungeon_size,
+            room_size=self.room_size,
         )  # Room graph
         self.current_room: RoomManager | Any = self.graph.initial_room  # Inital room
         self.current_room.activate_room()  # Activates the inital room
+        self.ai_worker = (
+            get_ai_worker() if background_ai else None
+        )  # Enemy moves are decided a tick behind on a background thread
 
     def move_player(self, vector: tuple[int, int]):
         """Move the player and all the entities in the current room."""
-        self.current_room.move_agents()  # Moves all the agents in the current room
+        self.scheduler.run_due()  # Footsteps fade and hit flashes end before anything moves
+        if self.ai_worker is not None:
+            self.current_room.move_agents_async(self.ai_worker)  # Applies last tick's decisions
+        else:
+            self.current_room.move_agents()  # Moves all the agents in the current room
         result: dict[str, Any] = self.current_room.move_entity(self.player, vector)  # type: ignore
         match result.get("action"):  # Action to be returned to the director
             case "moved":
@@ -61,6 +103,8 @@ class DungeonManager:
                 "room_transition"
             ):  # Adds the next room to the graph and moves the player into said room
                 next_vec = result.get("vector")
+                if self.ai_worker is not None:  # Decisions for the old room are stale
+                    self.ai_worker.discard(self.current_room)
                 room_change = self.current_room.add_next_room(next_vec, result.get("player_pos"))  # type: ignore
                 self.current_room = room_change.get("obj")
                 self.debugger.write(room_change)
@@ -76,7 +120,7 @@ class DungeonManager:
 
     def start_dungeon(self):
         """Start the dungeon by returning a room ready action to the director."""
-        return {"action": "room_ready", "map": self.current_room.map}
+        return {"action": "room_ready", "map": self.current_room.get_glyphs()}
 
 
 class RoomGraph:
@@ -92,7 +136,12 @@ class RoomGraph:
     """
 
     def __init__(
-        self, dungeon_manager: DungeonManager, weapon_factory, item_factory, max_level=2
+        self,
+        dungeon_manager: DungeonManager,
+        weapon_factory,
+        item_factory,
+        max_level=2,
+        room_size: int = 11,
     ) -> None:
         """Initialise graph."""
         self.dungeon_manager = dungeon_manager  # Debugger
@@ -105,5 +154,6 @@ class RoomGraph:
             level=0,
             max_level=max_level,
             doors=4,
+            map_size=room_size,
         )  # Initilsies a room
         self.initial_room.down = Exit()  # Sets the bottom door to exit to the overworld
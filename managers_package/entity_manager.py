@@ -4,10 +4,16 @@
 
 import random
 
-import torch
-
 from generators_package.entity_generator import Agent, DudEntity, Entity, Player
-from nn_package import MovementNet
+from generators_package.tiles import Tile, TileGrid
+from nn_package.decision_cache import DecisionCache, get_decision_cache
+from nn_package.registry import (
+    archetype_path,
+    default_archetype_mix,
+    default_policy,
+    model_registry,
+    weight_path,
+)
 
 
 class EntityManager:
@@ -17,29 +23,48 @@ class EntityManager:
     Entity manager is the parent class controlling the each entity present in a gamestate
     ## Attributes
     ```
-    self.model: MovementNet # Nueral network that governs the AI movement
+    self.policy: str # Enemy policy of controller agents ('full' or distilled 'student')
+    self.model_path: str # Weights of the nueral network that governs controller agents
+    self.backend: str | None # Inference backend ('torch', 'numpy', 'int8' or 'heuristic'), None uses the registry default
+    self.model: MovementNet | NumpyMovementNet # Controller nueral network (shared between every room, loaded on first use)
+    self.decision_cache: DecisionCache # LRU cache of the controller's decisions (shared between every room using the model)
     self.enemy_count: int # The number of enemies in the current gamestate
     self.player: Player # Player object
     self.Agents: list[Agent] # List of enemy objects (length = self.enemy_count)
+    self.positions: dict[tuple[int, int], list[Entity]] # Position: entities on it, agents in list order then the player
+    self.indexed: dict[int, tuple[int, int]] # id(entity): position it is indexed at
+    self.changed: set[tuple[int, int]] # Positions whose entities changed since the last entity map update
+    self.dud_entity: DudEntity # Returned when nothing is at a position
     ```
     ## Methods
     ```
+    get_model(self, archetype: str) -> MovementNet | NumpyMovementNet # Returns the shared network of an agent archetype
+    get_decision_cache(self, archetype: str) -> DecisionCache # Returns the decision cache of an agent archetype
     get_pos(Entity: Entity) -> tuple[int, int] # Returns the position of a given entity
-    set_position(entity: Entity, x: int, y: int, map: list[list[str]]) -> None # Sets the position of an entity and updates the map with its character.
-    randomise_positions(map: list[list[str]]) -> None # Randomly places agents on the map in empty spaces
+    set_entity_pos(self, entity: Entity, pos: tuple[int, int]) -> None # Moves an entity and updates the position index
+    index_positions(self) -> None # Rebuilds the position index from every entity's position
+    add_to_index(self, entity: Entity) -> None # Indexes an entity at its position
+    is_occupied(self, pos: tuple[int, int]) -> bool # Returns True when the player or a living agent stands at a position
+    randomise_positions(tiles: TileGrid, player_position, rng=None) -> None # Randomly places agents on the map in empty spaces
     get_all_entity_chars() -> list[str] # Returns a list of the all of the entity placeholder characters
     get_all_agent_chars() -> list[str] # Returns a list of only the agent characters
     get_entity_at_pos(self, coordiantes, ignore=None) -> Agent | dud_entity | Player # Returns the entity at a provided position, ignore parameter allows for a certain type to be removed from the search
     ```
     """
 
-    def __init__(self, player: Player, enemy_count: int, enemy_level: int = 1) -> None:
-        """Initialise entity manager."""
-        self.model = MovementNet()  # Gets the neural network
-        self.model.load_state_dict(
-            torch.load("nn_package/enemy_controller.pth")
-        )  # Loads a nueral network
-        self.model.eval()
+    def __init__(
+        self,
+        player: Player,
+        enemy_count: int,
+        enemy_level: int = 1,
+        policy: str | None = None,
+        backend: str | None = None,
+        archetype_mix: dict[str, float] | None = None,
+    ) -> None:
+        """Initialise entity manager, `archetype_mix` weights the archetypes agents are drawn from (RETROGUE_AI_ARCHETYPES, otherwise all controllers)."""
+        self.policy = policy or default_policy()  # Enemy policy of controller agents
+        self.model_path = archetype_path("controller", self.policy)  # Weights of the neural network
+        self.backend = backend  # Inference backend, None uses the registry default
         self.enemy_count = enemy_count  # Enemy count
         self.player: Player = player  # Player object
         self.Agents: list[Agent] = [
@@ -51,25 +76,65 @@ class EntityManager:
             )
             for i in range(self.enemy_count)
         ]  # List of all the agents
+        archetype_mix = archetype_mix or default_archetype_mix()
+        if archetype_mix:  # Left unset every agent is a controller and no random numbers are drawn
+            for agent in self.Agents:
+                agent.archetype = random.choices(
+                    list(archetype_mix), weights=list(archetype_mix.values())
+                )[0]
+        self.dud_entity = DudEntity()  # Returned when nothing is at a position
+        self.positions: dict[tuple[int, int], list[Entity]] = {}  # Position: entities on it
+        self.indexed: dict[int, tuple[int, int]] = {}  # id(entity): position it is indexed at
+        self.changed: set[tuple[int, int]] = set()  # Positions changed since the last entity map update
+        self.index_positions()
+
+    @property
+    def model(self):
+        """Return the shared neural network (torch or numpy backend), only loaded from disk the first time an agent moves."""
+        return self.get_model("controller")
+
+    @property
+    def decision_cache(self) -> DecisionCache:
+        """Return the decision cache shared by every room that uses the same model."""
+        return self.get_decision_cache("controller")
+
+    def get_model(self, archetype: str):
+        """Return the shared neural network of an agent archetype, loaded on first use."""
+        return model_registry.get(archetype_path(archetype, self.policy), self.backend)
+
+    def get_decision_cache(self, archetype: str) -> DecisionCache:
+        """Return the decision cache shared by every room that uses the archetype's model."""
+        return get_decision_cache(
+            weight_path(
+                archetype_path(archetype, self.policy),
+                self.backend or model_registry.backend,
+            )
+        )
 
     def get_pos(self, entity: Entity) -> tuple[int, int]:
         """Return the position of a given entity."""
         return entity.pos
 
-    def randomise_positions(self, map, player_position) -> None:
-        """Randomly place agents on the map in empty spaces."""
-        agent_chars = [agent.char for agent in self.Agents]
+    def randomise_positions(self, tiles: TileGrid, player_position, rng: random.Random | None = None) -> None:
+        """Randomly place agents on the map in empty spaces, drawing from `rng` when given (the random module otherwise)."""
+        rng = rng or random
         for agent in self.Agents:
             while True:
-                y, x = random.randint(1, len(map) - 2), random.randint(1, len(map) - 2)
+                y, x = rng.randint(1, tiles.height - 2), rng.randint(1, tiles.height - 2)
                 if (
-                    map[y][x] not in [" / ", " # "]
+                    tiles.get(y, x) not in (Tile.DOOR, Tile.WALL)
                     and (y, x) != player_position
-                    and map[y][x] not in agent_chars
                 ):
-                    agent.pos = (y, x)
+                    self.set_entity_pos(agent, (y, x))
                     break
 
+    def is_occupied(self, pos: tuple[int, int]) -> bool:
+        """Return True when the player or a living agent stands at `pos`, dead agents do not block."""
+        for entity in self.positions.get(pos, ()):
+            if entity is self.player or entity.health > 0:
+                return True
+        return False
+
     def get_all_entity_chars(self) -> list[str]:
         """Return a list of the all of the entity placeholder characters."""
         return (
@@ -84,13 +149,41 @@ class EntityManager:
 
     def get_entity_at_pos(self, coordiantes, ignore=None) -> Agent | DudEntity | Player:
         """Return the entity at a provided position, ignore parameter allows for a certain type to be removed from the search."""
-        all_entities = self.Agents + [self.player]
-        if ignore == "player":
-            all_entities.remove(self.player)
-        elif ignore == "agent":
-            for agent in self.Agents:
-                all_entities.remove(agent)
-        for entity in all_entities:
-            if self.get_pos(entity) == coordiantes:
-                return entity
-        return DudEntity()
+        for entity in self.positions.get(coordiantes, ()):
+            if ignore == "player" and entity is self.player:
+                continue
+            if ignore == "agent" and entity is not self.player:
+                continue
+            return entity
+        return self.dud_entity
+
+    def set_entity_pos(self, entity: Entity, pos: tuple[int, int]) -> None:
+        """Move an entity to `pos` and update the position index."""
+        old_pos = self.indexed.pop(id(entity), None)
+        if old_pos is not None:
+            occupants = self.positions[old_pos]
+            occupants.remove(entity)
+            if not occupants:
+                del self.positions[old_pos]
+            self.changed.add(old_pos)
+        entity.pos = pos
+        self.add_to_index(entity)
+
+    def index_positions(self) -> None:
+        """Rebuild the position index from every entity's position, for when positions were set directly."""
+        self.changed.update(self.positions)
+        self.positions = {}
+        self.indexed = {}
+        for entity in self.Agents + [self.player]:
+            self.add_to_index(entity)
+
+    def add_to_index(self, entity: Entity) -> None:
+        """Index an entity at its position, keeping each position's entities in lookup order."""
+        pos = tuple(entity.pos)
+        occupants = self.positions.setdefault(pos, [])
+        occupants.append(entity)
+        if len(occupants) > 1:  # Agents in list order then the player, like a scan of self.Agents + [self.player]
+            order = {id(agent): index for index, agent in enumerate(self.Agents)}
+            occupants.sort(key=lambda occupant: order.get(id(occupant), len(self.Agents)))
+        self.indexed[id(entity)] = pos
+        self.changed.add(pos)
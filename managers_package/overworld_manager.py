@@ -6,6 +6,7 @@ import random
 
 from generators_package.entity_generator import Player
 from generators_package.overworld_generation import OverworldGeneration
+from generators_package.tiles import GLYPH_TABLE, Tile, TileGrid
 from managers_package.building_manager import Inn, Shop
 from managers_package.dungeon_manager import DungeonManager
 
@@ -22,6 +23,8 @@ class OverworldManager:
     self.map_size: int
     self.coordinates: tuple[int, int] # Coordinates for the overworld, used for hashing to generate a seed for the overworld
     self.overworld_generator: Overworld_Generation # Generator for the overworld
+    self.tiles: TileGrid # Terrain and buildings of the overworld, the player is only drawn over it
+    self.player_pos: tuple[int, int] # Position of the player
     ```
     ## Methods
     ```
@@ -67,7 +70,7 @@ class OverworldManager:
         )  # Generator for the overworld
 
         self.dungeon_char = self.overworld_generator.dungeon_char  # Dungeon char
-        self.map: list[list[str]] = (
+        self.tiles = TileGrid.from_glyphs(
             self.overworld_generator.generate_map()
         )  # Generates map
 
@@ -94,16 +97,12 @@ class OverworldManager:
                 )  # Assings a new dungeon manager to a point
 
         while True:
-            if self.map[self.player_pos[0]][self.player_pos[1]] in [
-                self.dungeon_char,
-                " S ",
-                " I ",
-            ]:
-                self.map = self.overworld_generator.generate_map()  # Genrates the map
+            if self.tiles.get(*self.player_pos) in (Tile.DUNGEON, Tile.SHOP, Tile.INN):
+                self.tiles = TileGrid.from_glyphs(
+                    self.overworld_generator.generate_map()
+                )  # Genrates the map
             else:
                 break
-        self.player_pos_char = self.map[self.player_pos[0]][self.player_pos[1]]
-        self.map[self.player_pos[0]][self.player_pos[1]] = self.player.char
 
         self.buildings_dungeons = {}  # All buildings and dungeons
 
@@ -118,8 +117,8 @@ class OverworldManager:
     def randomise_player_pos(self):
         """Randomise player position."""
         self.player_pos = (
-                random.randint(0, len(self.map) - 1),
-                random.randint(0, len(self.map) - 1),
+                random.randint(0, self.tiles.height - 1),
+                random.randint(0, self.tiles.width - 1),
             )
     # -- Minimap --
 
@@ -182,8 +181,8 @@ class OverworldManager:
 
         start_y = max(0, start_y)
         start_x = max(0, start_x)
-        end_y = min(len(self.map), start_y + size)
-        end_x = min(len(self.map[0]), start_x + size)
+        end_y = min(self.tiles.height, start_y + size)
+        end_x = min(self.tiles.width, start_x + size)
 
         square = [(y, x) for y in range(start_y, end_y) for x in range(start_x, end_x)]
         return square
@@ -192,8 +191,9 @@ class OverworldManager:
 
     def get_visible_window(self):
         """Retruns a 5x5 view used to display what the player can see."""
-        height = len(self.map)
-        width = len(self.map[0]) if height > 0 else 0
+        height = self.tiles.height
+        width = self.tiles.width
+        cells = self.tiles.cells
         desired_view_size = 10
         if desired_view_size < 1:
             desired_view_size = 1
@@ -208,10 +208,10 @@ class OverworldManager:
                 win_y = dy + half
                 win_x = dx + half
                 if 0 <= map_y < height and 0 <= map_x < width:
-                    view_window[win_y][win_x] = self.map[map_y][map_x]
+                    view_window[win_y][win_x] = GLYPH_TABLE[cells[map_y * width + map_x]]
                 else:
                     view_window[win_y][win_x] = "   "
-        view_window[half][half] = " P "
+        view_window[half][half] = self.player.char  # The player is drawn over the tile it stands on
         return view_window
 
     def move_player(self, vector):
@@ -220,26 +220,15 @@ class OverworldManager:
             vector is None
         ):  # If there is no vector just set the vector to be stationary (0,0)
             vector = (0, 0)
-        if 0 <= self.player_pos[0] + vector[0] < len(self.map) and 0 <= self.player_pos[
-            1
-        ] + vector[1] < len(
-            self.map
+        if self.tiles.in_bounds(
+            self.player_pos[0] + vector[0], self.player_pos[1] + vector[1]
         ):  # Check that the player is moving within the bounds of the map
             self.generate_minimap()  # Genrates a minimap
             last_pos = self.player_pos  # Stores the current position of the player
-            self.map[self.player_pos[0]][
-                self.player_pos[1]
-            ] = self.player_pos_char  # Sets the old position to be the old character
             self.player_pos = (
                 self.player_pos[0] + vector[0],
                 self.player_pos[1] + vector[1],
             )  # Sets the player position to be the new position
-            self.player_pos_char = self.map[self.player_pos[0]][
-                self.player_pos[1]
-            ]  # Stores the character below the player character
-            self.map[self.player_pos[0]][
-                self.player_pos[1]
-            ] = self.player.char  # Sets the new position to be the player character
 
             if (
                 self.player_pos in self.buildings_dungeons.keys()
@@ -247,12 +236,7 @@ class OverworldManager:
                 building_char = self.buildings_dungeons[
                     self.player_pos
                 ]  # Gets the character of the building
-
-                self.map[self.player_pos[0]][
-                    self.player_pos[1]
-                ] = building_char  # To prevent the player from overwriting the building character rewrite it
                 self.player_pos = last_pos  # Gets the last position of the player before they entered the building
-                self.player_pos_char = self.map[self.player_pos[0]][self.player_pos[1]]
 
                 if building_char == " Δ ":  # Dungeon
                     return {
@@ -2,19 +2,35 @@
 
 # -- Imports --
 
+import copy
 import math
+import os
 import random
-import threading
 import time
-from collections import deque
-
-import torch
+from collections import OrderedDict, deque
 
 from generators_package.entity_generator import Agent, DudEntity, Entity, Player
 from generators_package.room_generator import RoomGenerator
+from generators_package.tiles import GLYPH_TABLE, Tile, TileGrid
+from managers_package.ai_budget import AIBudget
 from managers_package.chest_manager import Chest
+from managers_package.clock import GameClock, wall_clock
+from managers_package.scheduler import TimerScheduler
 from managers_package.entity_manager import EntityManager
-from nn_package import encode_inputs
+import nn_package
+
+MIN_ROOM_SIZE = 7  # Smallest room with space for doors on every wall
+MAX_ROOM_SIZE = 256  # Largest room kept interactive
+
+
+def default_room_size() -> int:
+    """Return the room size set with RETROGUE_ROOM_SIZE, otherwise 11."""
+    size = int(os.environ.get("RETROGUE_ROOM_SIZE", 11))
+    if not MIN_ROOM_SIZE <= size <= MAX_ROOM_SIZE:
+        raise ValueError(
+            f"RETROGUE_ROOM_SIZE must be in the range {MIN_ROOM_SIZE} to {MAX_ROOM_SIZE} inclusive"
+        )
+    return size
 
 
 class RoomManager:
@@ -27,19 +43,36 @@ class RoomManager:
     self.empty_char: str
     self.wall_char: str
     self.door_char: str
+    self.dead_char: str # Drawn where only dead agents stand
     self.coordinates: tuple[int, int] # For hashing in room generation
     self.map_size: int # nxn size of the map
-    self.map: list[list[str]] # Initilised map structure
-    self.heat_map: list[list[float]] # Initilised sound intentisty map
+    self.tiles: TileGrid | None # Terrain (floor, walls, doors and chests), the only copy of it, entities are drawn over it from the position index, None until generated
+    self.heat_map: list[list[float]] # Initilised sound intentisty map, shared with self.heat_maps so it is never edited in place
+    self.distance_fields: OrderedDict[tuple, dict[tuple[int, int], int]] # (source, max distance): steps to every cell within it, least recently used first
+    self.heat_maps: OrderedDict[tuple, list[list[float]]] # (player position, SOUND_DECAY_CONSTANT): heat map built from the distance field, least recently used first
+    self.silent_heat_map: list[list[float]] | None # Heat map once the footsteps fade, built once per map, heat maps share its rows the sound does not reach
     self.enemy_count: int # Number of enemies present
     self.entity_manager: Entity_manager # Entity manager
     self.activated: bool # Stops room from being re-generated if a player re-enters
     self.level: int # Depth of the room in tree
     self.max_level: int # Maximum depth in tree
     self.SOUND_DECAY_CONSTANT: float # Multiplier to stop decay the sound over a distance
+    self.SOUND_CACHE_SIZE: int # Distance fields and heat maps kept per room
     self.FOOTSTEP_DURATION: float  # Time that a footstep lasts for
     self.HIT_COLOUR_DURATION: float # Time that an entity turns red after being attacked
+    self.LOD_DISTANCE: int # Agents within this many tiles of the player (in any direction) are moved by the NN
+    self.LOD_HEARING: float # Agents hearing a sound louder than this are moved by the NN
+    self.LOD_POLICY: str # Policy of every other agent, 'heuristic' (score rules on the sound window) or 'idle' (stand still)
+    self.lod_counters: dict[str, int] # Tier: decisions made by it ('network', 'heuristic', 'idle')
     self.entity_map: list[list[entity]] # Stores all of the entity objects in their positions on the map
+    self.clock: GameClock # Time source for movement delays, the dungeon's clock when there is one
+    self.scheduler: TimerScheduler # Runs footstep and hit timers, the dungeon's scheduler when there is one
+    self.ai_budget: AIBudget | None # Per frame budget for agent decisions (or for applying the AI worker's moves), the dungeon's budget when there is one
+    self.room_prefetcher: RoomPrefetcher | None # Generates the rooms behind unexplored doors in the background, the dungeon's prefetcher when there is one
+    self.rng: random.Random # Random numbers of the room's generation, seeded when the room is created so it can be generated on any thread
+    self.agent_cursor: int # Index of the agent the budget serves first next frame
+    self.queued_moves: list[tuple[Agent, int]] # (agent, vector key) collected from the AI worker and waiting for the budget
+    self.feature_schema: FeatureSchema | None # Reusable NN input buffer, created on the first agent decision
     self.door_count: int # Number of doors
     self.up: None | Exit | RoomManager # Room above
     self.down: None | Exit | RoomManager # Room below
@@ -52,26 +85,45 @@ class RoomManager:
     activate_room(self, player_pos: tuple[int, int] | None = None) #  Starts the room
     door_pos(self, original_pos: tuple[int, int] | None) -> list[tuple[int, int]] # Gets the position of the door on the opposing side for where a player came through
     reset_episode(self, player_pos=None, set_player: bool = True) -> None # Regenerates map when not self.activated and selects new random positions
+    generate_map(self, door_pos: tuple[int, int], player_start: tuple[int, int]) -> None # Generates the map and places the agents, touches nothing outside the room
+    create_room(self) -> RoomManager # Creates an unlinked room one level deeper
+    get_neighbour(self, vector: tuple[int, int]) -> RoomManager | Exit # Returns the room through the door in a direction, creating and linking it the first time
+    get_unexplored_doors(self) -> list[tuple[tuple[int, int], tuple[int, int]]] # Returns the direction and position of every door with no room behind it yet
     add_next_room(self, vector: tuple[int, int], player_pos) # Creates the next room for where the player entered
 
     # -- Sound Generation and processing ---
-    generate_heat_map(self) -> None # Generates sound heat map
+    generate_heat_map(self) -> None # Generates sound heat map from the player's cached distance field
+    get_distance_field(self, source: tuple[int, int], max_distance: int) -> dict[tuple[int, int], int] # Returns the steps from source to every cell within max_distance, searched once per source
+    get_silent_heat_map(self) -> list[list[float]] # Returns the heat map with no sound, walls at -1
     zero_heat_map(self) -> None # Sets the heat_map to be all 0s, this is for after a player takes a step
     get_sound_window(self, Entity: Entity) -> list[float] # Returns a 3x3 grid (including center) around entity position of sound strengths
 
+    # --- Drawing ---
+    get_entity_glyphs(self) -> dict[tuple[int, int], str] # Returns the glyph drawn over the terrain at every position an entity stands on
+    get_glyphs(self, top: int = 0, left: int = 0, rows: int | None = None, cols: int | None = None) -> list[list[str]] # Returns rows of glyphs to draw, the terrain with the entities over it
+
     # --- FOV ---
     generate_fov_map(self, entity: Agent) -> None # Places ' x ' wherever the provided entity can see
     get_viewport(self, entity: Agent) -> list[str] # Sets entity.vision to a dictionary (pos: char) that the entity can 'see'
-    bresenham(self, x1: int, y1: int, x2: int, y2: int, entity: Agent) # Uses bresenham's line algorithm to draw convex vector between the edges of the fov
+    bresenham(self, x1: int, y1: int, x2: int, y2: int, entity: Agent, entity_glyphs: dict | None = None) # Uses bresenham's line algorithm to draw convex vector between the edges of the fov
 
     # --- Entity Movements ---
     start_hit_timer(self, entity: Player | Agent) # Begins a timer for an entity thats been damaged with time `self.HIT_COLOUR_DURATION` to colour the attacked entity red
     kill_footsteps(self) # Zeros the heatmap to kill sound
     start_footstep_timer(self, player: Player) #  Starts a timer that will zero the heat_map after FOOTSTEP_DURATION seconds. If the timer is already running, it will be reset.
     move_entity(self, entity: Agent | player, vector: tuple[int, int], force_move: bool = False) # Accepts either Agent or player class to move said entity in a given vector direction.
+    player -> Player # The room's player (property)
+    get_model(self, archetype: str) # Returns the shared neural network of an agent archetype
+    get_decision_cache(self, archetype: str) -> DecisionCache # Returns the decision cache of an agent archetype
     get_agent_movement(self) # Gets the movement from the AI model for each agent.
-    update_entity_map(self) # Refreshes the positions of the entities on the entity map
+    get_ready_agents(self, current_time: float) -> list[Agent] # Returns the living agents whose movement delay has elapsed
+    get_lod_decisions(self, agents: list[Agent]) -> list[int] # Returns the vector key for each agent, near or hearing agents from the NN and the rest from LOD_POLICY
+    get_agent_decisions(self, agents: list[Agent]) -> list[int] # Returns the vector key for each agent from one batched forward pass per archetype
+    apply_agent_moves(self, agents: list[Agent], vector_keys: list[int], current_time: float) # Moves each agent by its decided vector
+    snapshot(self, agents: list[Agent], feature_schema=None) -> tuple[DecisionView, list[Agent]] # Returns a read-only view of the room and agent copies for the AI worker
+    update_entity_map(self) # Refreshes the entity map cells whose entities changed since the last update
     move_agents(self) # Moves all of the agents then update the entity map
+    move_agents_async(self, ai_worker) # Applies the AI worker's decisions then sends the ready agents to the worker
     ```
     """
 
@@ -91,6 +143,9 @@ class RoomManager:
         ),
         enemy_count=1,
         map_size=11,
+        clock: GameClock | None = None,
+        scheduler: TimerScheduler | None = None,
+        ai_budget: AIBudget | None = None,
     ) -> None:
         """Initilise room object."""
         self.debugger = debugger  # Debugger
@@ -101,12 +156,20 @@ class RoomManager:
         self.wall_char = " # "
         self.door_char = " / "
         self.chest_char = ' C '
+        self.dead_char = " X "
         self.coordinates: tuple[int, int] = (
             coordinates  # For hashing in room generation
         )
+        if not MIN_ROOM_SIZE <= map_size <= MAX_ROOM_SIZE:
+            raise ValueError(
+                f"map_size must be in the range {MIN_ROOM_SIZE} to {MAX_ROOM_SIZE} inclusive"
+            )
         self.map_size = map_size  # nxn size of the map
-        self.map = []  # Initilised map structure
+        self.tiles: TileGrid | None = None  # Terrain, built with the map
         self.heat_map = []  # Initilised sound intentisty map
+        self.distance_fields: OrderedDict[tuple, dict[tuple[int, int], int]] = OrderedDict()  # (source, max distance): steps to cells
+        self.heat_maps: OrderedDict[tuple, list[list[float]]] = OrderedDict()  # (player position, decay): heat map
+        self.silent_heat_map: list[list[float]] | None = None  # Heat map with no sound
         self.enemy_count: int = enemy_count  # Number of enemies present
         self.entity_manager: EntityManager = EntityManager(
             player=player, enemy_count=enemy_count, enemy_level=random.randint(0, 100)
@@ -119,13 +182,40 @@ class RoomManager:
         self.SOUND_DECAY_CONSTANT: float = (
             0.65  # Multiplier to stop decay the sound over a distance
         )
+        self.SOUND_CACHE_SIZE: int = 256  # Distance fields and heat maps kept, every position of a small room fits
         self.FOOTSTEP_DURATION: float = 1.5  # Time that a footstep lasts for
         self.HIT_COLOUR_DURATION: float = (
             1  # Time that an entity turns red after being attacked
         )
+        self.LOD_DISTANCE: int = 5  # Agents within this many tiles of the player use the NN
+        self.LOD_HEARING: float = 0.0  # Agents hearing a louder sound than this use the NN
+        self.LOD_POLICY: str = "heuristic"  # Policy of far and silent agents ('heuristic' or 'idle')
+        self.lod_counters: dict[str, int] = {
+            "network": 0,
+            "heuristic": 0,
+            "idle": 0,
+        }  # Tier: decisions made by it
+        self.feature_schema = None  # Reusable NN input buffer, created on the first agent decision
+        self.clock: GameClock = (
+            clock or getattr(dungeon_manager, "clock", None) or wall_clock
+        )  # Time source for movement delays
+        self.scheduler: TimerScheduler = (
+            scheduler
+            or getattr(dungeon_manager, "scheduler", None)
+            or TimerScheduler(self.clock)
+        )  # Runs footstep and hit timers
+        self.ai_budget: AIBudget | None = (
+            ai_budget or getattr(dungeon_manager, "ai_budget", None)
+        )  # Spreads agent decisions over frames, None decides every ready agent at once
+        self.agent_cursor = 0  # Index of the agent the budget serves first
+        self.queued_moves: list[tuple[Agent, int]] = []  # (agent, vector key) collected from the AI worker but not applied yet
+        self.room_prefetcher = getattr(
+            dungeon_manager, "room_prefetcher", None
+        )  # Generates neighbouring rooms in the background, None generates them on entry
+        self.rng = random.Random(random.getrandbits(64))  # Seeded here, on the main thread, so runs repeat
         self.dud_entity=DudEntity()
         self.entity_map = [
-            [self.dud_entity for i in range(11)] for i in range(11)
+            [self.dud_entity for i in range(self.map_size)] for i in range(self.map_size)
         ]  # Stores all of the entity objects in their positions on the map
         if 1 <= doors <= 4:  # Prevents too many or too little doors from being created
             self.door_count = doors
@@ -140,10 +230,16 @@ class RoomManager:
     # --- Misc ---
 
     def activate_room(self, player_pos: tuple[int, int] | None = None):
-        """Start the room."""
+        """Start the room, then have the rooms behind its unexplored doors generated in the background."""
+        start = time.perf_counter()
+        entered = not self.activated and player_pos is not None  # Walked in through a door
         self.reset_episode(player_pos)
         self.zero_heat_map()
         self.update_entity_map()
+        if self.room_prefetcher is not None:
+            if entered:
+                self.room_prefetcher.add_latency(time.perf_counter() - start)
+            self.room_prefetcher.prefetch(self)
         return {"action": "room_ready"}
 
     def door_pos(self, original_pos: tuple[int, int] | None) -> list[tuple[int, int]]:
@@ -180,35 +276,43 @@ class RoomManager:
         if (
             self.activated == False
         ):  # If the room has not been previously initilised, initilise the map and enemy positions
-            self.map = RoomGenerator(
-                doors=self.door_count, start_door=door_pos
-            ).generate_dungeon()
-            self.entity_manager.randomise_positions(self.map, player_start)
+            if self.room_prefetcher is None or not self.room_prefetcher.claim(self, player_pos):
+                self.generate_map(door_pos, player_start)  # Not generated in the background
+            for agent in self.entity_manager.Agents:  # Movement delays start on the room's clock
+                agent.last_move_time = self.clock.now()
             self.activated = True
             if self.door_count == 1:
                 self.entity_map[self.map_size // 2][self.map_size // 2] = Chest(debugger=self.debugger, weapon_factory=self.weapon_factory, item_factory=self.item_factory)  # type: ignore
-                self.map[self.map_size // 2][self.map_size // 2] = self.chest_char
         if (
             set_player
         ):  # If set player then place the player with a pre-defined position
-            self.entity_manager.player.pos = player_start
-            self.map[player_start[0]][player_start[1]] = self.entity_manager.player.char
+            self.entity_manager.set_entity_pos(self.entity_manager.player, player_start)
         else:  # Randomly place the player
             while True:
-                y, x = random.randint(1, len(self.map) - 2), random.randint(
-                    1, len(self.map) - 2
+                y, x = random.randint(1, self.tiles.height - 2), random.randint(
+                    1, self.tiles.height - 2
                 )
-                if self.map[y][x] not in [self.door_char, self.wall_char]:
-                    self.map[y][x] = self.entity_manager.player.char
-                    self.entity_manager.player.pos = (y, x)
+                if self.tiles.cells[y * self.tiles.width + x] not in (Tile.DOOR, Tile.WALL):
+                    self.entity_manager.set_entity_pos(self.entity_manager.player, (y, x))
                     break
-        for entity in self.entity_manager.Agents:
-            pos = entity.pos
-            self.map[pos[0]][pos[1]] = entity.char
         self.generate_heat_map()  # Generates the sound intensity map
 
-    def add_next_room(self, vector: tuple[int, int], player_pos):
-        """Create the next room for where the player entered."""
+    def generate_map(self, door_pos: tuple[int, int], player_start: tuple[int, int]) -> None:
+        """Generate the map and place the agents, only the room's own state and random numbers are used so it can run on a background thread."""
+        self.tiles = TileGrid.from_glyphs(
+            RoomGenerator(
+                grid_size=self.map_size, doors=self.door_count, start_door=door_pos, rng=self.rng
+            ).generate_dungeon()
+        )  # The generator's glyphs are only read once
+        self.distance_fields.clear()  # The walls have changed
+        self.heat_maps.clear()
+        self.silent_heat_map = None
+        self.entity_manager.randomise_positions(self.tiles, player_start, self.rng)
+        if self.door_count == 1:
+            self.tiles.set(self.map_size // 2, self.map_size // 2, Tile.CHEST)
+
+    def create_room(self) -> "RoomManager":
+        """Create an unlinked room one level deeper."""
         door_num = random.randint(2, 4)  # Random door number
         enemy_count = random.randint(0, 4)  # Random enemy count
         if (
@@ -216,7 +320,7 @@ class RoomManager:
         ):  # If the new room is on the max level then set the room to be empty
             door_num = 1
             enemy_count = 0
-        room = RoomManager(
+        return RoomManager(
             player=self.entity_manager.player,
             dungeon_manager=self.dungeon_manager,
             debugger=self.debugger,
@@ -227,33 +331,68 @@ class RoomManager:
             max_level=self.max_level,
             coordinates=(random.randint(1000, 9999), random.randint(1000, 9999)),
             enemy_count=enemy_count,
+            map_size=self.map_size,
         )  # Create the room manager
+
+    def get_neighbour(self, vector: tuple[int, int]) -> "RoomManager | Exit":
+        """Return the room through the door in a direction, creating and linking it the first time."""
         direction = None  # Initlise direction that is returned the new room objected returned to the director
         match str(
             vector
         ):  # Sets the corresponding room direction to the new room and the opposing direction of the new room to the current room
             case "(-1, 0)":
                 if self.up == None:
-                    self.up = room
+                    self.up = self.create_room()
                     self.up.down = self
                 direction = self.up
             case "(1, 0)":
                 if self.down == None:
-                    self.down = room
+                    self.down = self.create_room()
                     self.down.up = self
                 direction = self.down
             case "(0, 1)":
                 if self.right == None:
-                    self.right = room
+                    self.right = self.create_room()
                     self.right.left = self
                 direction = self.right
             case "(0, -1)":
                 if self.left == None:
-                    self.left = room
+                    self.left = self.create_room()
                     self.left.right = self
                 direction = self.left
             case _:
                 direction = Exit()  # Catch case will return the player to the overworld
+        return direction
+
+    def get_unexplored_doors(self) -> list[tuple[tuple[int, int], tuple[int, int]]]:
+        """Return the direction and position of every door with no room behind it yet."""
+        last = self.map_size - 1
+        border = (
+            [(0, x) for x in range(self.map_size)]
+            + [(last, x) for x in range(self.map_size)]
+            + [(y, 0) for y in range(1, last)]
+            + [(y, last) for y in range(1, last)]
+        )  # Doors are only ever on the outer wall
+        doors = []
+        cells, width, door = self.tiles.cells, self.tiles.width, Tile.DOOR  # Locals for the scan
+        for y, x in border:
+            if cells[y * width + x] != door:
+                continue
+            if y == 0:
+                vector, neighbour = (-1, 0), self.up
+            elif y == last:
+                vector, neighbour = (1, 0), self.down
+            elif x == last:
+                vector, neighbour = (0, 1), self.right
+            else:
+                vector, neighbour = (0, -1), self.left
+            if neighbour is None:
+                doors.append((vector, (y, x)))
+        return doors
+
+    def add_next_room(self, vector: tuple[int, int], player_pos):
+        """Create the next room for where the player entered."""
+        direction = self.get_neighbour(vector)
         return {
             "action": "room_transition",
             "obj": direction,
@@ -263,63 +402,85 @@ class RoomManager:
     # -- Sound Generation and processing ---
 
     def generate_heat_map(self) -> None:
-        """Generate sound heat map."""
-        grid_height = len(self.map) - 1
-        grid_width = len(self.map[0]) - 1
-        heat_map = [
-            [0.0 for _ in range(grid_width)] for _ in range(grid_height)
-        ]  # Initilises the heat map
-
-        for y in range(grid_height):
-            for x in range(grid_width):
-                if self.map[y][x] == (self.wall_char or self.door_char):
-                    heat_map[y][x] = -1.0
-        visited = {}
-
-        def in_bounds(
-            y, x
-        ) -> (
-            bool
-        ):  # Checks whether a point (y, x) is within the bounds of the map to prevent an index error
-            return 0 <= y < grid_height and 0 <= x < grid_width
-
-        def is_wall(y, x) -> bool:  # Checks if this point (y, x) is a wall
-            return self.map[y][x] == self.wall_char
-
-        py, px = self.entity_manager.player.pos
-        queue = deque([(py, px, 1.0)])
-
-        while (
-            queue
-        ):  # Goes through the entirety of the heat map and assiging sound intentsity values to each point
-            y, x, strength = queue.popleft()
-            if strength < 0.05 or ((y, x) in visited and strength <= visited[(y, x)]):
-                continue
-            visited[(y, x)] = strength
-            heat_map[y][x] = max(heat_map[y][x], strength)
+        """Generate sound heat map.
 
+        Each floor cell gets SOUND_DECAY_CONSTANT ** (steps from the player) down to 0.05, quieter and unreachable cells are 0 and walls -1.
+        The heat map of each player position is built from its distance field once and reused every time the player stands there,
+        only the rows the sound reaches are copied from the silent heat map.
+        """
+        key = (self.entity_manager.player.pos, self.SOUND_DECAY_CONSTANT)
+        heat_map = self.heat_maps.get(key)
+        if heat_map is None:
+            powers = [1.0]  # Strength after each step, multiplied out like the sound travels
+            while (
+                powers[-1] * self.SOUND_DECAY_CONSTANT >= 0.05
+                and len(powers) < self.tiles.height * self.tiles.width
+            ):
+                powers.append(powers[-1] * self.SOUND_DECAY_CONSTANT)
+            silent_heat_map = self.get_silent_heat_map()
+            heat_map = list(silent_heat_map)  # Rows the sound does not reach are shared with the silent heat map
+            for (y, x), distance in self.get_distance_field(
+                self.entity_manager.player.pos, len(powers) - 1
+            ).items():
+                if silent_heat_map[y][x] == -1.0:  # Walls stay at -1, even under the source
+                    continue
+                if heat_map[y] is silent_heat_map[y]:
+                    heat_map[y] = list(silent_heat_map[y])
+                heat_map[y][x] = powers[distance]
+            self.heat_maps[key] = heat_map
+            if len(self.heat_maps) > self.SOUND_CACHE_SIZE:
+                self.heat_maps.popitem(last=False)
+        else:
+            self.heat_maps.move_to_end(key)
+        self.heat_map = heat_map
+
+    def get_distance_field(
+        self, source: tuple[int, int], max_distance: int
+    ) -> dict[tuple[int, int], int]:
+        """Return the steps from `source` to every cell within `max_distance` around walls, searched once per source."""
+        key = (source, max_distance)
+        distance_field = self.distance_fields.get(key)
+        if distance_field is not None:
+            self.distance_fields.move_to_end(key)
+            return distance_field
+        grid_height = self.tiles.height - 1
+        grid_width = self.tiles.width - 1
+        cells, width, wall = self.tiles.cells, self.tiles.width, Tile.WALL  # Locals for the search
+        distance_field = {source: 0}
+        queue = deque([source])
+        while queue:  # Breadth first search over every cell the sound reaches
+            y, x = queue.popleft()
+            distance = distance_field[(y, x)] + 1
+            if distance > max_distance:
+                continue
             for dy, dx in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
                 ny, nx = y + dy, x + dx
-                if not in_bounds(ny, nx) or is_wall(ny, nx):
-                    continue
-                new_strength = strength * self.SOUND_DECAY_CONSTANT
-                if (ny, nx) not in visited or new_strength > visited[(ny, nx)]:
-                    queue.append((ny, nx, new_strength))
+                if (
+                    0 <= ny < grid_height
+                    and 0 <= nx < grid_width
+                    and (ny, nx) not in distance_field
+                    and cells[ny * width + nx] != wall
+                ):
+                    distance_field[(ny, nx)] = distance
+                    queue.append((ny, nx))
+        self.distance_fields[key] = distance_field
+        if len(self.distance_fields) > self.SOUND_CACHE_SIZE:
+            self.distance_fields.popitem(last=False)
+        return distance_field
 
-        self.heat_map = heat_map
+    def get_silent_heat_map(self) -> list[list[float]]:
+        """Return the heat map with no sound, walls at -1, built once per map."""
+        if self.silent_heat_map is None:  # Walls never move
+            cells, width, wall = self.tiles.cells, self.tiles.width, Tile.WALL  # Locals for the loop
+            self.silent_heat_map = [
+                [-1.0 if cells[y * width + x] == wall else 0.0 for x in range(self.tiles.width - 1)]
+                for y in range(self.tiles.height - 1)
+            ]  # Sets any places in the wall to have an intensity of -1
+        return self.silent_heat_map
 
     def zero_heat_map(self) -> None:
         """Set the heat_map to be all 0s, this is for after a player takes a step, the sound only lasts for (self.FOOTSTEP_DURATION)s."""
-        empty_heat_map = [
-            [0.0 for _ in range(len(self.map))] for _ in range(len(self.map))
-        ]
-        for col in range(len(self.map)):
-            for ele in range(len(self.map)):
-                if self.map[col][ele] == (self.wall_char or self.door_char):
-                    empty_heat_map[col][
-                        ele
-                    ] = -1.0  # Sets any places in the wall to have an intensity of -1
-        self.heat_map = empty_heat_map
+        self.heat_map = self.get_silent_heat_map()
 
     def get_sound_window(self, entity: Entity) -> list[float]:
         """Get the sound window.
@@ -346,17 +507,47 @@ class RoomManager:
         neighbors = []
         for dy, dx in directions:  # Checks a 3x3 zone around the player
             ny, nx = entity.pos[0] + dy, entity.pos[1] + dx
-            if 0 <= ny < len(self.map) - 1 and 0 <= nx < len(self.map[0]) - 1:
+            if 0 <= ny < self.tiles.height - 1 and 0 <= nx < self.tiles.width - 1:
                 neighbors.append(self.heat_map[ny][nx])
             else:
                 neighbors.append(-1)
         return neighbors
 
+    # --- Drawing ---
+
+    def get_entity_glyphs(self) -> dict[tuple[int, int], str]:
+        """Return the glyph drawn over the terrain at every position an entity stands on, the player over agents and living agents over dead ones."""
+        player = self.entity_manager.player
+        entity_glyphs = {}
+        for pos, occupants in self.entity_manager.positions.items():
+            glyph = self.dead_char  # Only dead agents stand here unless a living entity is found
+            for occupant in occupants:  # Agents in list order then the player, the last living one is drawn
+                if occupant is player or occupant.health > 0:
+                    glyph = occupant.get_char()
+            entity_glyphs[pos] = glyph
+        return entity_glyphs
+
+    def get_glyphs(
+        self, top: int = 0, left: int = 0, rows: int | None = None, cols: int | None = None
+    ) -> list[list[str]]:
+        """Return `rows` by `cols` glyphs from (`top`, `left`) to draw, the terrain of the tile grid with the entities over it (the whole room by default)."""
+        cells, width = self.tiles.cells, self.tiles.width
+        rows = self.tiles.height - top if rows is None else rows
+        cols = width - left if cols is None else cols
+        glyphs = [
+            [GLYPH_TABLE[tile] for tile in cells[y * width + left : y * width + left + cols]]
+            for y in range(top, top + rows)
+        ]
+        for (y, x), glyph in self.get_entity_glyphs().items():
+            if top <= y < top + rows and left <= x < left + cols:
+                glyphs[y - top][x - left] = glyph
+        return glyphs
+
     # --- FOV ---
 
     def generate_fov_map(self, entity: Agent) -> None:
         """Place ' x ' wherever the provided entity can see."""
-        self.fov_map = [[cell for cell in row] for row in self.map]
+        self.fov_map = self.get_glyphs()
         self.get_viewport(entity)
         for visible in entity.vision:
             self.fov_map[visible[0]][visible[1]] = " x "
@@ -369,7 +560,7 @@ class RoomManager:
     def get_viewport(self, entity: Agent) -> list[str]:
         """Set entity.vision to a dictionary (pos: char) that the entity can 'see'."""
         entity.vision.clear()
-        ox, oy = self.entity_manager.get_pos(entity)
+        ox, oy = entity.pos
         directions = [
             (-1, -1),
             (-1, 0),
@@ -387,6 +578,7 @@ class RoomManager:
         vision_half_angle = (
             math.radians(entity.vision_angle) / 2
         )  # Divides the vision angle by 2
+        entity_glyphs = self.get_entity_glyphs()  # Built once for every ray
         for dx, dy in directions:
             if dx == 0 and dy == 0:
                 continue
@@ -401,23 +593,31 @@ class RoomManager:
             if diff <= vision_half_angle:
                 x2 = ox + dx * entity.vision_radius
                 y2 = oy + dy * entity.vision_radius
-                self.bresenham(ox, oy, x2, y2, entity)
+                self.bresenham(ox, oy, x2, y2, entity, entity_glyphs)
         return list(entity.vision.values())
 
-    def bresenham(self, x1: int, y1: int, x2: int, y2: int, entity: Agent):
-        """Use bresenham's line algorithm to draw convex vector between the edges of the fov."""
+    def bresenham(
+        self, x1: int, y1: int, x2: int, y2: int, entity: Agent, entity_glyphs: dict | None = None
+    ):
+        """Use bresenham's line algorithm to draw convex vector between the edges of the fov, `entity_glyphs` is `get_entity_glyphs()` when the caller already has it."""
+        if entity_glyphs is None:
+            entity_glyphs = self.get_entity_glyphs()
         dx = abs(x2 - x1)
         dy = abs(y2 - y1)
         sx = 1 if x1 < x2 else -1
         sy = 1 if y1 < y2 else -1
         err = dx - dy
+        cells, height, width, wall = self.tiles.cells, self.tiles.height, self.tiles.width, Tile.WALL  # Locals for the walk
+        vision, own_pos = entity.vision, tuple(entity.pos)
         while True:
-            if 0 <= x1 < len(self.map) and 0 <= y1 < len(self.map[0]):
-                if self.map[x1][y1] == self.wall_char:
+            if 0 <= x1 < height and 0 <= y1 < width:
+                tile = cells[x1 * width + y1]
+                if tile == wall:
                     break
-                if (x1, y1) not in entity.vision:
-                    if self.map[x1][y1] != entity.char:
-                        entity.vision[(x1, y1)] = self.map[x1][y1]  # type: ignore
+                pos = (x1, y1)
+                if pos not in vision and pos != own_pos:  # An entity does not see itself
+                    glyph = entity_glyphs.get(pos)
+                    vision[pos] = GLYPH_TABLE[tile] if glyph is None else glyph  # type: ignore
             if (x1, y1) == (x2, y2):
                 break
             e2 = 2 * err
@@ -439,8 +639,7 @@ class RoomManager:
         def hit_falisy():
             entity.is_hit = False
 
-        entity.hit_timer = threading.Timer(self.HIT_COLOUR_DURATION, hit_falisy) # type: ignore
-        entity.hit_timer.start()
+        entity.hit_timer = self.scheduler.schedule(self.HIT_COLOUR_DURATION, hit_falisy) # type: ignore
 
     def kill_footsteps(self):
         """Zero the heatmap to kill sound."""
@@ -460,16 +659,15 @@ class RoomManager:
             self.zero_heat_map()
             player.is_making_noise = False
 
-        player.step_timer = threading.Timer(  # type: ignore
+        player.step_timer = self.scheduler.schedule(  # type: ignore
             self.FOOTSTEP_DURATION, reset_heat
-        )  # Starts a hit timer # type: ignore
-        player.step_timer.start()  # type: ignore
+        )  # Starts a footstep timer
 
     def move_entity(
         self, entity: Agent | Player, vector: tuple[int, int], force_move: bool = False
     ):
         """Accept either Agent or player class to move said entity in a given vector direction. Force_move=True requires a non-zero vector."""
-        current_time = time.time()  # Gets the current time
+        current_time = self.clock.now()  # Gets the current time
         if type(entity) == Player:
             if not hasattr(entity, "last_move_time"):
                 entity.last_move_time = 0
@@ -485,37 +683,26 @@ class RoomManager:
         target_y = entity.pos[0] + vector[0]  # Target y position
         target_x = entity.pos[1] + vector[1]  # Target x position
 
-        dissallowed_chars = self.entity_manager.get_all_entity_chars() + [
-            self.wall_char,
-            self.door_char,
-            self.chest_char
-        ]  # All characters the current entity is not allowed to move to
-        if not isinstance(entity, Player):
-            dissallowed_chars.append(
-                self.entity_manager.player.char
-            )  # If the entity is not a player then dont allow the entities to enter the same time as the player
-
-        if 0 <= target_y < len(self.map) and 0 <= target_x < len(
-            self.map[0]
+        tiles = self.tiles
+
+        if (
+            0 <= target_y < tiles.height and 0 <= target_x < tiles.width
         ):  # Checks if the target position is within the bounds of the map
+            tile = tiles.cells[target_y * tiles.width + target_x]  # Indexed directly, a method call per move costs more than the glyph lookup it replaced
+            occupied = self.entity_manager.is_occupied((target_y, target_x))
             if (
-                self.map[target_y][target_x] not in dissallowed_chars
+                tile == Tile.EMPTY and not occupied
             ):  # Checks if the entity is attempting to move to an occupied position
-                self.map[entity.pos[0]][
-                    entity.pos[1]
-                ] = self.empty_char  # Sets the old poisition to an empty character
-                entity.pos = (target_y, target_x)  # Changes the entity position
-                self.map[target_y][
-                    target_x
-                ] = entity.get_char()  # Sets the new position to the entity character
+                self.entity_manager.set_entity_pos(
+                    entity, (target_y, target_x)
+                )  # Changes the entity position
                 entity.last_move_time = current_time  # Gets the current time
                 if isinstance(entity, Player):
                     self.start_footstep_timer(
                         entity
                     )  # If the entity is a player then start a footstep timer
             elif (
-                self.map[target_y][target_x]
-                in self.entity_manager.get_all_entity_chars()
+                occupied
             ):  # If an entity is attmempting to move into an occupied position to attacck
                 ignore = (
                     "player" if isinstance(entity, Player) else "agent"
@@ -553,12 +740,12 @@ class RoomManager:
                         "victim": attacked_entity,
                     }  # Returns the action to dungeon manager
             elif (
-                self.map[target_y][target_x] == self.door_char
+                tile == Tile.DOOR
             ):  # If an entity attempts to move into a door
                 if isinstance(
                     entity, Player
                 ):  # Disallow enemies to walk into other rooms
-                    entity.pos = (target_y, target_x)
+                    self.entity_manager.set_entity_pos(entity, (target_y, target_x))
                     return {
                         "action": "room_transition",
                         "vector": vector,
@@ -566,7 +753,7 @@ class RoomManager:
                         "player_pos": entity.pos,
                     }  # Returns the action to dungeon manager
             elif (
-                self.map[target_y][target_x] == self.chest_char
+                tile == Tile.CHEST
             ):
                 return {
                     "action": 'open_chest',
@@ -578,8 +765,51 @@ class RoomManager:
             "noise": entity.is_making_noise,
         }  # Action returned to dungeon manager
 
+    @property
+    def player(self) -> Player:
+        """Return the room's player."""
+        return self.entity_manager.player
+
+    def get_model(self, archetype: str):
+        """Return the shared neural network of an agent archetype."""
+        return self.entity_manager.get_model(archetype)
+
+    def get_decision_cache(self, archetype: str):
+        """Return the decision cache of an agent archetype."""
+        return self.entity_manager.get_decision_cache(archetype)
+
     def get_agent_movement(self):
-        """Get the movement from the AI model for each agent."""
+        """Get the movement from the AI model for each agent, every agent that is ready to move is decided in one forward pass."""
+        current_time = self.clock.now()  # Gets current time
+        ready_agents = self.get_ready_agents(current_time)
+        if not ready_agents:
+            return
+        if self.ai_budget is not None:  # Agents that do not fit in the frame move next frame
+            self.ai_budget.run(self, ready_agents, current_time)
+            return
+        vector_keys = self.get_lod_decisions(ready_agents)  # Decides every move at once
+        self.apply_agent_moves(ready_agents, vector_keys, current_time)
+
+    def get_ready_agents(self, current_time: float) -> list[Agent]:
+        """Return the living agents whose movement delay has elapsed."""
+        ready_agents: list[Agent] = []  # Agents whose movement delay has elapsed
+        for agent in self.entity_manager.Agents:
+            if not hasattr(
+                agent, "last_move_time"
+            ):  # Checks if the entity is attempting to move before it is allowed
+                agent.last_move_time = 0
+            if agent.health <= 0:  # Dead agents are drawn as an X and no longer move
+                continue
+            if (
+                current_time - agent.last_move_time >= agent.movement_delay
+            ):  # If the entity is allowed to move and not dead allow movement
+                ready_agents.append(agent)
+        return ready_agents
+
+    def apply_agent_moves(
+        self, agents: list[Agent], vector_keys: list[int], current_time: float
+    ):
+        """Move each agent by the vector its decision picked."""
         directions = [
             (-1, -1),
             (-1, 0),
@@ -591,50 +821,149 @@ class RoomManager:
             (1, 0),
             (1, 1),
         ]
-        for agent in self.entity_manager.Agents:  # Gets movement for every agent
-            current_time = time.time()  # Gets current time
-            if not hasattr(
-                agent, "last_move_time"
-            ):  # Checks if the entity is attempting to move before it is allowed
-                agent.last_move_time = 0
-            if agent.health <= 0:  # If dead replace the entity with an X
-                self.map[agent.pos[0]][agent.pos[1]] = " X "
+        for agent, vector_key in zip(agents, vector_keys):
+            if agent.health <= 0:  # The agent may have died since its move was decided
                 continue
+            vector = directions[vector_key]  # Movement vector
+            agent.direction = (
+                vector  # Sets the direction to the direction of the vector
+            )
+
+            self.move_entity(
+                agent, vector, force_move=False
+            )  # Moves the entity to target position
+            agent.last_move_time = current_time  # Sets time to movement time
+
+    def get_lod_decisions(self, agents: list[Agent]) -> list[int]:
+        """Return the vector key for each agent, choosing how much work each decision gets.
+
+        Agents within LOD_DISTANCE of the player or hearing a sound louder than LOD_HEARING are decided by the NN.
+        The rest skip the viewport, encoding and forward pass and are moved by LOD_POLICY instead,
+        'heuristic' applies the score rules to their sound window (the player counts as unseen) and 'idle' keeps them still.
+        """
+        player_y, player_x = self.player.pos
+        decisions: list[int] = [4] * len(agents)  # Vector key 4 is (0, 0)
+        near: list[int] = []  # Indexes of the agents the NN decides
+        far: list[tuple[int, list[float]]] = []  # (agent index, sound window) of every other agent
+        for index, agent in enumerate(agents):
+            sound_grid = self.get_sound_window(agent)
             if (
-                current_time - agent.last_move_time >= agent.movement_delay
-                and agent.health > 0
-            ):  # If the entity is allowed to move and not dead allow movement
-                self.get_viewport(agent)  # Gets what the agent can see
-                input_tensor = encode_inputs(
-                    sound_grid=self.get_sound_window(agent),
-                    fov_dict=agent.vision,
-                    level_diff=self.entity_manager.player.level - agent.level,
+                max(abs(agent.pos[0] - player_y), abs(agent.pos[1] - player_x)) <= self.LOD_DISTANCE
+                or max(sound_grid) > self.LOD_HEARING
+            ):
+                near.append(index)
+            else:
+                far.append((index, sound_grid))
+        if near:
+            outputs = self.get_agent_decisions([agents[index] for index in near])
+            for index, decision in zip(near, outputs):
+                decisions[index] = decision
+            self.lod_counters["network"] += len(near)
+        if self.LOD_POLICY == "heuristic":
+            player_level = self.player.level
+            for index, sound_grid in far:  # A few agents, plain Python beats building arrays
+                agent = agents[index]
+                decisions[index] = nn_package.score_features(
                     agent_health=agent.health,
-                    allied_agent_count=self.enemy_count,
-                )  # Encodes all the information of the room
-                output = self.entity_manager.model(input_tensor)  # Output of NN
-                vector_key = int(
-                    torch.argmax(output, dim=1).item()
-                )  # Gets the vector ket from the output of the NN
-                vector = directions[vector_key]  # Movement vector
-                agent.direction = (
-                    vector  # Sets the direction to the direction of the vector
+                    enemy_count=self.enemy_count,
+                    level_diff=player_level - agent.level,
+                    player_visible=False,
+                    sound_grid=sound_grid,
+                )[0]
+        if far:
+            self.lod_counters[self.LOD_POLICY] += len(far)  # Idle agents keep vector key 4
+        return decisions
+
+    def get_agent_decisions(self, agents: list[Agent]) -> list[int]:
+        """Return the vector key chosen by the AI model for each agent.
+
+        Agents are grouped by archetype, each group is looked up in its model's decision cache first,
+        then every miss of the group is decided in a single batched forward pass.
+        """
+        if self.feature_schema is None:  # Created here so numpy is not imported at startup
+            self.feature_schema = nn_package.FeatureSchema(capacity=self.enemy_count)
+        groups: dict[str, list[int]] = {}  # Archetype: indexes of its agents
+        for index, agent in enumerate(agents):
+            groups.setdefault(agent.archetype, []).append(index)
+        decisions: list[int | None] = [None] * len(agents)
+        for archetype, indexes in groups.items():
+            self.feature_schema.reset()
+            decision_cache = self.get_decision_cache(archetype)
+            missed: list[tuple[int, tuple]] = []  # (agent index, cache key) of every cache miss
+            for index in indexes:
+                agent = agents[index]
+                self.get_viewport(agent)  # Gets what the agent can see
+                sound_grid = self.get_sound_window(agent)
+                level_diff = self.player.level - agent.level
+                key = decision_cache.make_key(
+                    sound_grid,
+                    " P " in agent.vision.values(),
+                    level_diff,
+                    agent.health,
+                    self.enemy_count,
                 )
+                decision = decision_cache.get(key)
+                decisions[index] = decision
+                if decision is None:
+                    self.feature_schema.write(
+                        sound_grid=sound_grid,
+                        fov_dict=agent.vision,
+                        level_diff=level_diff,
+                        agent_health=agent.health,
+                        allied_agent_count=self.enemy_count,
+                    )  # Encodes all the information of the room
+                    missed.append((index, key))
+            if missed:
+                outputs = self.get_model(archetype).decide(
+                    self.feature_schema.get_batch()
+                )  # Gets the vector keys of the whole group from one pass of its NN
+                for (index, key), decision in zip(missed, outputs):
+                    decisions[index] = decision
+                    decision_cache.put(key, decision)
+        return decisions  # type: ignore
 
-                self.move_entity(
-                    agent, vector, force_move=False
-                )  # Moves the entity to target position
-                agent.last_move_time = current_time  # Sets time to movement time
+    def snapshot(
+        self, agents: list[Agent], feature_schema=None
+    ) -> tuple["DecisionView", list[Agent]]:
+        """Return a read-only view of the room and copies of `agents` that the AI worker can decide moves on, `feature_schema` is the worker's NN input buffer."""
+        view = DecisionView(self, agents, feature_schema)  # Taken on the main thread
+        return view, view.agents
+    def move_agents_async(self, ai_worker):
+        """Apply the moves the AI worker decided since the last tick then send the agents that are ready to the worker.
 
-    def update_entity_map(self):
-        """Refresh the positions of the entities on the entity map."""
-        for row in range(len(self.entity_map) - 1):
-            for col in range(len(self.entity_map[0]) - 1):
-                existing = self.entity_map[row][col]
-                new = self.entity_manager.get_entity_at_pos((row, col)) # Gets the entity at the current position
+        With an AI budget only the moves that fit in the frame are applied, the rest stay queued for the next frame.
+        """
+        self.entity_moved = False
+        current_time = self.clock.now()
+        decided = ai_worker.collect(self)
+        if decided is not None:
+            self.queued_moves.extend(zip(*decided))
+        if self.ai_budget is not None:
+            self.ai_budget.run_async(self, ai_worker, current_time)
+        else:
+            if self.queued_moves:
+                agents, vector_keys = zip(*self.queued_moves)
+                self.queued_moves = []
+                self.apply_agent_moves(agents, vector_keys, current_time)
+            if not ai_worker.is_busy(self):  # One decision step in flight per room
+                ready_agents = self.get_ready_agents(current_time)
+                if ready_agents:
+                    ai_worker.submit(self, ready_agents)
+        self.update_entity_map()
 
-                if not isinstance(existing, Chest):
-                    self.entity_map[row][col] = new # type: ignore
+    def update_entity_map(self):
+        """Refresh the entity map cells whose entities changed since the last update."""
+        changed = self.entity_manager.changed
+        self.entity_manager.changed = set()
+        for row, col in changed:
+            if not (
+                0 <= row < len(self.entity_map) - 1 and 0 <= col < len(self.entity_map[0]) - 1
+            ):
+                continue
+            if not isinstance(self.entity_map[row][col], Chest):
+                self.entity_map[row][col] = self.entity_manager.get_entity_at_pos(
+                    (row, col)
+                )  # Gets the entity at the current position
 
     def move_agents(self):
         """Move all of the agents then update the entity map."""
@@ -643,6 +972,72 @@ class RoomManager:
         self.update_entity_map()
 
 
+class DecisionView:
+    """Decision view.
+
+    ## Description
+    Read-only view of a room holding only what the enemy decision step reads, taken on the main thread for the AI worker.
+    The tile grid and heat map are shared since the room replaces them instead of editing them,
+    the entity glyphs are copied and the player and agents are copies, so the game can keep changing the room while the worker decides.
+    The decision methods are the room's own, they only read the attributes below.
+    ## Attributes
+    ```
+    self.tiles: TileGrid # Terrain of the room
+    self.heat_map: list[list[float]] # Sound heat map when the view was taken
+    self.entity_glyphs: dict[tuple[int, int], str] # Glyph drawn at every position an entity stood on when the view was taken
+    self.player: Player # Copy of the player
+    self.agents: list[Agent] # Copies of the agents to decide, their vision is filled in by the worker
+    self.enemy_count: int # Number of enemies in the room
+    self.LOD_DISTANCE: int # Agents within this many tiles of the player are moved by the NN
+    self.LOD_HEARING: float # Agents hearing a sound louder than this are moved by the NN
+    self.LOD_POLICY: str # Policy of every other agent
+    self.lod_counters: dict[str, int] # Tier: decisions made on the worker, merged into the room's when collected
+    self.feature_schema: FeatureSchema | None # NN input buffer of the AI worker, created on the first decision when None
+    self.get_model: Callable # Returns the shared neural network of an agent archetype
+    self.get_decision_cache: Callable # Returns the decision cache of an agent archetype
+    ```
+    ## Methods
+    ```
+    get_entity_glyphs(self) -> dict[tuple[int, int], str] # Returns the entity glyphs copied when the view was taken
+    get_lod_decisions(self, agents: list[Agent]) -> list[int] # RoomManager.get_lod_decisions
+    get_agent_decisions(self, agents: list[Agent]) -> list[int] # RoomManager.get_agent_decisions
+    get_viewport(self, entity: Agent) -> list[str] # RoomManager.get_viewport
+    bresenham(self, x1: int, y1: int, x2: int, y2: int, entity: Agent, entity_glyphs: dict | None = None) # RoomManager.bresenham
+    get_sound_window(self, entity: Entity) -> list[float] # RoomManager.get_sound_window
+    ```
+    """
+
+    def __init__(self, room: RoomManager, agents: list[Agent], feature_schema=None) -> None:
+        """Initialise decision view."""
+        self.tiles = room.tiles  # Replaced, never edited, once the room is generated
+        self.heat_map = room.heat_map  # Heat maps are replaced, never edited
+        self.entity_glyphs = room.get_entity_glyphs()
+        self.player = copy.copy(room.player)
+        self.agents: list[Agent] = []
+        for agent in agents:
+            agent_copy = copy.copy(agent)
+            agent_copy.vision = {}  # Filled in by the worker
+            self.agents.append(agent_copy)
+        self.enemy_count = room.enemy_count
+        self.LOD_DISTANCE = room.LOD_DISTANCE
+        self.LOD_HEARING = room.LOD_HEARING
+        self.LOD_POLICY = room.LOD_POLICY
+        self.lod_counters = dict.fromkeys(room.lod_counters, 0)  # Counted on the worker, merged on the main thread
+        self.feature_schema = feature_schema
+        self.get_model = room.entity_manager.get_model  # Only reads the policy and backend
+        self.get_decision_cache = room.entity_manager.get_decision_cache
+
+    def get_entity_glyphs(self) -> dict[tuple[int, int], str]:
+        """Return the entity glyphs copied when the view was taken."""
+        return self.entity_glyphs
+
+    get_lod_decisions = RoomManager.get_lod_decisions
+    get_agent_decisions = RoomManager.get_agent_decisions
+    get_viewport = RoomManager.get_viewport
+    bresenham = RoomManager.bresenham
+    get_sound_window = RoomManager.get_sound_window
+
+
 class Exit:
     """Exit class used for exit doors to return the player back to overworld when exiting the dungeon."""
 
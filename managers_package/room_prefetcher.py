@@ -0,0 +1,125 @@
+"""Room prefetcher."""
+
+# -- Imports --
+
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+
+class RoomPrefetcher:
+    """Room prefetcher.
+
+    ## Description
+    Generates the rooms behind the unexplored doors of the room the player is in on a background thread,
+    so walking through a door only has to place the player instead of generating the map.
+    The neighbouring rooms are created and linked on the main thread (their random numbers are drawn there),
+    only `generate_map`, which touches nothing outside its own room, and loading the agents' models run on the worker.
+    A room entered before its generation has finished waits for it, a room entered through a door it was not generated for is generated again.
+    ## Attributes
+    ```
+    self.executor: ThreadPoolExecutor # Single background thread
+    self.pending: WeakKeyDictionary[RoomManager, tuple[tuple[int, int], Future]] # Room: (door it is entered through, generation), dropped with its dungeon
+    self.submitted: int # Rooms sent to the worker
+    self.hits: int # Rooms entered after their generation finished
+    self.late: int # Rooms entered while their generation was still running
+    self.misses: int # Rooms generated on entry through a door
+    self.latencies: deque[float] # Seconds taken by each of the last 1000 room activations
+    ```
+    ## Methods
+    ```
+    prefetch(self, room: RoomManager) -> None # Create the rooms behind the room's unexplored doors and generate them in the background
+    submit(self, room: RoomManager, player_pos: tuple[int, int]) -> None # Generate a room for a player entering through player_pos
+    generate(self, room: RoomManager, door_pos: tuple[int, int], player_start: tuple[int, int]) -> None # Generate a room's map and load its agents' models, run on the worker
+    claim(self, room: RoomManager, player_pos: tuple[int, int] | None) -> bool # Wait for a room's generation, return False when it still has to be generated
+    add_latency(self, seconds: float) -> None # Record how long a room took to activate
+    get_stats(self) -> dict[str, float] # Return the hit rate and activation latencies
+    shutdown(self) -> None # Stop the background thread
+    ```
+    """
+
+    def __init__(self) -> None:
+        """Initialise room prefetcher."""
+        self.executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="room-prefetch"
+        )  # Single background thread
+        self.pending = weakref.WeakKeyDictionary()  # Room: (entry door, generation)
+        self.submitted = 0
+        self.hits = 0
+        self.late = 0
+        self.misses = 0
+        self.latencies: deque[float] = deque(maxlen=1000)  # Seconds per room activation
+
+    def prefetch(self, room) -> None:
+        """Create the rooms behind the room's unexplored doors and generate them in the background."""
+        for vector, door in room.get_unexplored_doors():
+            neighbour = room.get_neighbour(vector)
+            if not neighbour.activated and neighbour not in self.pending:
+                self.submit(neighbour, door)
+
+    def submit(self, room, player_pos: tuple[int, int]) -> None:
+        """Generate a room for a player entering it through the door at `player_pos` of the room before."""
+        door_pos, player_start = room.door_pos(player_pos)
+        future = self.executor.submit(self.generate, room, door_pos, player_start)
+        self.pending[room] = (player_pos, future)
+        self.submitted += 1
+
+    def generate(self, room, door_pos: tuple[int, int], player_start: tuple[int, int]) -> None:
+        """Generate a room's map and load its agents' models, run on the worker."""
+        room.generate_map(door_pos, player_start)
+        for archetype in {agent.archetype for agent in room.entity_manager.Agents}:
+            room.entity_manager.get_model(archetype)  # Loaded once per process, shared by every room
+
+    def claim(self, room, player_pos: tuple[int, int] | None) -> bool:
+        """Wait for a room's generation, return False when it still has to be generated (never submitted or for another door)."""
+        pending = self.pending.pop(room, None)
+        if pending is None:
+            if player_pos is not None:  # The first room of a dungeon is never behind a door
+                self.misses += 1
+            return False
+        entry, future = pending
+        if entry != player_pos:
+            future.result()  # The worker must be done with the room before it is generated again
+            self.misses += 1
+            return False
+        if future.done():
+            self.hits += 1
+        else:
+            self.late += 1
+        future.result()  # Waits and re-raises any error from the worker
+        return True
+
+    def add_latency(self, seconds: float) -> None:
+        """Record how long a room took to activate."""
+        self.latencies.append(seconds)
+
+    def get_stats(self) -> dict[str, float]:
+        """Return the hit rate and the room activation latencies in milliseconds."""
+        entered = self.hits + self.late + self.misses
+        latencies = sorted(self.latencies)
+        return {
+            "submitted": self.submitted,
+            "hits": self.hits,
+            "late": self.late,
+            "misses": self.misses,
+            "hit_rate": self.hits / entered if entered else 0.0,
+            "latency_p50_ms": latencies[len(latencies) // 2] * 1000 if latencies else 0.0,
+            "latency_p95_ms": latencies[int(len(latencies) * 0.95)] * 1000 if latencies else 0.0,
+            "latency_max_ms": latencies[-1] * 1000 if latencies else 0.0,
+        }
+
+    def shutdown(self) -> None:
+        """Stop the background thread."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.pending.clear()
+
+
+shared_room_prefetcher: RoomPrefetcher | None = None  # Shared by every dungeon, created on first use
+
+
+def get_room_prefetcher() -> RoomPrefetcher:
+    """Return the shared room prefetcher, creating it on first use."""
+    global shared_room_prefetcher
+    if shared_room_prefetcher is None:
+        shared_room_prefetcher = RoomPrefetcher()
+    return shared_room_prefetcher
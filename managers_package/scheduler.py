@@ -0,0 +1,96 @@
+"""Timer scheduler."""
+
+# -- Imports --
+
+import heapq
+import itertools
+
+from managers_package.clock import GameClock
+
+
+class TimerHandle:
+    """Timer handle.
+
+    ## Description
+    Cancellable handle of a scheduled callback, a drop in for the `threading.Timer` calls the rooms made.
+    ## Attributes
+    ```
+    self.due: float # Clock time the callback runs at
+    self.callback: Callable[[], None] # Function to run
+    self.cancelled: bool # True once cancelled
+    self.finished: bool # True once the callback has run
+    ```
+    ## Methods
+    ```
+    cancel(self) -> None # Stop the callback from running
+    is_alive(self) -> bool # Return True while the callback is still waiting to run
+    ```
+    """
+
+    __slots__ = ["due", "callback", "cancelled", "finished"]
+
+    def __init__(self, due: float, callback) -> None:
+        """Initialise timer handle."""
+        self.due = due
+        self.callback = callback
+        self.cancelled = False
+        self.finished = False
+
+    def cancel(self) -> None:
+        """Stop the callback from running."""
+        self.cancelled = True
+
+    def is_alive(self) -> bool:
+        """Return True while the callback is still waiting to run."""
+        return not (self.cancelled or self.finished)
+
+
+class TimerScheduler:
+    """Timer scheduler.
+
+    ## Description
+    Single heap of timed callbacks driven by the game loop, replaces a `threading.Timer` thread per footstep and hit.
+    Callbacks run on the thread that calls `run_due`, when the clock has passed their due time.
+    Cancelled timers are dropped lazily when they reach the top of the heap.
+    ## Attributes
+    ```
+    self.clock: GameClock # Clock the delays are measured on
+    self.heap: list[tuple[float, int, TimerHandle]] # (due, order, handle) of every waiting timer
+    self.order: itertools.count # Tie breaker so timers due together run in the order they were scheduled
+    ```
+    ## Methods
+    ```
+    schedule(self, delay: float, callback) -> TimerHandle # Run `callback` once `delay` seconds have passed on the clock
+    run_due(self) -> int # Run every callback that is due and return how many ran
+    get_pending(self) -> int # Return the number of timers waiting to run
+    ```
+    """
+
+    def __init__(self, clock: GameClock) -> None:
+        """Initialise timer scheduler."""
+        self.clock = clock  # Clock the delays are measured on
+        self.heap: list[tuple[float, int, TimerHandle]] = []
+        self.order = itertools.count()
+
+    def schedule(self, delay: float, callback) -> TimerHandle:
+        """Run `callback` once `delay` seconds have passed on the clock."""
+        handle = TimerHandle(self.clock.now() + delay, callback)
+        heapq.heappush(self.heap, (handle.due, next(self.order), handle))
+        return handle
+
+    def run_due(self) -> int:
+        """Run every callback that is due and return how many ran."""
+        now = self.clock.now()
+        ran = 0
+        while self.heap and self.heap[0][0] <= now:
+            handle = heapq.heappop(self.heap)[2]
+            if handle.cancelled:
+                continue
+            handle.finished = True
+            handle.callback()
+            ran += 1
+        return ran
+
+    def get_pending(self) -> int:
+        """Return the number of timers waiting to run."""
+        return sum(1 for _, _, handle in self.heap if not handle.cancelled)
@@ -0,0 +1,303 @@
+"""Simulation manager."""
+
+# -- Imports --
+
+import functools
+import random
+import time
+from collections import deque
+
+from generators_package.tiles import Tile
+from managers_package.clock import SimulatedClock
+from managers_package.dungeon_manager import DungeonManager
+from managers_package.entity_manager import EntityManager
+from managers_package.room_manager import RoomManager
+
+PROFILED_METHODS = {
+    DungeonManager: ["move_player"],
+    RoomManager: [
+        "activate_room",
+        "add_next_room",
+        "generate_heat_map",
+        "move_agents",
+        "get_lod_decisions",
+        "get_agent_decisions",
+        "get_viewport",
+        "get_sound_window",
+        "apply_agent_moves",
+        "move_entity",
+        "update_entity_map",
+    ],
+    EntityManager: ["get_entity_at_pos"],
+}  # Class: methods timed during a run (times include nested calls)
+VECTORS = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # Player moves
+
+
+class RandomBot:
+    """Random bot.
+
+    ## Description
+    Player bot that walks in a random direction every tick.
+    ## Methods
+    ```
+    choose(self, room: RoomManager) -> tuple[int, int] # Return the next move
+    ```
+    """
+
+    def __init__(self, rng: random.Random) -> None:
+        """Initialise random bot."""
+        self.rng = rng
+
+    def choose(self, room: RoomManager) -> tuple[int, int]:
+        """Return the next move."""
+        return self.rng.choice(VECTORS)
+
+
+class DoorBot(RandomBot):
+    """Door bot.
+
+    ## Description
+    Scripted player bot that walks the shortest path to a randomly chosen door every time it enters a room
+    (never the one it came in by unless it is the only one), so it explores whole dungeons and eventually leaves through the exit.
+    Attacks anything in its way. The path is searched once and followed, it is only searched again when the bot is off it.
+    ## Attributes
+    ```
+    self.room: RoomManager | None # Room the bot is in
+    self.target: tuple[int, int] | None # Door it is walking to
+    self.steps: dict[tuple[int, int], tuple[int, int]] # Position on the path: move to the next position
+    ```
+    ## Methods
+    ```
+    choose(self, room: RoomManager) -> tuple[int, int] # Return the next move along the path to the room's door
+    ```
+    """
+
+    def __init__(self, rng: random.Random) -> None:
+        """Initialise door bot."""
+        super().__init__(rng)
+        self.room = None  # Room the bot is in
+        self.target = None  # Door it is walking to
+        self.steps = {}  # Position on the path: next move
+
+    def choose(self, room: RoomManager) -> tuple[int, int]:
+        """Return the next move along the path to the room's door."""
+        start = room.entity_manager.player.pos
+        if room is not self.room:  # Entered a room, pick a door
+            doors = [
+                (y, x)
+                for y in range(room.tiles.height)
+                for x in range(room.tiles.width)
+                if room.tiles.get(y, x) == Tile.DOOR
+            ]
+            exits = [
+                door for door in doors if abs(door[0] - start[0]) + abs(door[1] - start[1]) > 1
+            ]  # Doors other than the one just come through
+            self.room = room
+            self.target = self.rng.choice(exits or doors) if doors else start
+            self.steps = {}
+        target = self.target
+        if target == start:  # Nowhere to go, wander
+            return super().choose(room)
+        if start in self.steps:  # Still on the path
+            return self.steps[start]
+        cells, height, width, empty = room.tiles.cells, room.tiles.height, room.tiles.width, Tile.EMPTY
+        previous = {start: None}
+        queue = deque([start])
+        while queue:  # Breadth first search back from the door
+            pos = queue.popleft()
+            if pos == target:
+                self.steps = {}
+                while pos != start:  # Walk the path back, remembering the move out of each position
+                    self.steps[previous[pos]] = (pos[0] - previous[pos][0], pos[1] - previous[pos][1])
+                    pos = previous[pos]
+                return self.steps[start]
+            for dy, dx in VECTORS:
+                next_pos = (pos[0] + dy, pos[1] + dx)
+                if (
+                    0 <= next_pos[0] < height
+                    and 0 <= next_pos[1] < width
+                    and next_pos not in previous
+                    and (
+                        next_pos == target
+                        or cells[next_pos[0] * width + next_pos[1]] == empty
+                    )  # Only the chosen door is walked through
+                ):
+                    previous[next_pos] = pos
+                    queue.append(next_pos)
+        return super().choose(room)  # No path, wander
+
+
+class SimulationManager:
+    """Simulation manager.
+
+    ## Description
+    Headless runner that plays whole dungeons with a player bot as fast as possible on a simulated clock,
+    no curses and no wall clock delays. Each tick advances the clock by `tick` seconds and moves the player once.
+    A dungeon ends when the bot leaves through the exit, dies or runs out of ticks, then a new one is started.
+    ## Attributes
+    ```
+    self.bot: str # 'door' (scripted) or 'random'
+    self.tick: float # Simulated seconds per tick
+    self.max_ticks: int # Ticks before a dungeon is abandoned
+    self.dungeon_size: int # Depth of each dungeon
+    self.room_size: int # Side length of every room
+    self.seed: int # Seed of the rooms and the bot
+    self.clock: SimulatedClock # Clock shared by every dungeon
+    self.timings: dict[str, list] # Method: [calls, seconds]
+    ```
+    ## Methods
+    ```
+    run(self, dungeons: int) -> dict # Play `dungeons` dungeons and return the throughput report
+    play_dungeon(self, bot, context) -> tuple[int, int, str] # Play one dungeon and return its ticks, room transitions and outcome
+    ```
+    """
+
+    def __init__(
+        self,
+        bot: str = "door",
+        tick: float = 0.1,
+        max_ticks: int = 5000,
+        dungeon_size: int = 2,
+        seed: int = 0,
+        room_size: int = 11,
+    ) -> None:
+        """Initialise simulation manager."""
+        if bot not in ["door", "random"]:
+            raise ValueError("bot must be 'door' or 'random'")
+        self.bot = bot
+        self.tick = tick  # Simulated seconds per tick
+        self.max_ticks = max_ticks  # Ticks before a dungeon is abandoned
+        self.dungeon_size = dungeon_size
+        self.room_size = room_size  # Side length of every room
+        self.seed = seed
+        self.clock = SimulatedClock()
+        self.timings: dict[str, list] = {}  # Method: [calls, seconds]
+
+    def run(self, dungeons: int) -> dict:
+        """Play `dungeons` dungeons and return the throughput report."""
+        from factory_package.item_factory import ItemFactory, WeaponFactory
+        from managers_package.debug_manager import Debugger
+
+        debug = Debugger("Simulation")
+        debug.on = False
+        weapon_factory = WeaponFactory()
+        item_factory = ItemFactory()
+        weapon_factory.initilise_registry()
+        item_factory.initilise_registry()
+        random.seed(self.seed)  # Rooms are generated with the global random module
+        rng = random.Random(self.seed)
+        bot = DoorBot(rng) if self.bot == "door" else RandomBot(rng)
+        outcomes = {"exit": 0, "death": 0, "timeout": 0}
+        ticks = 0
+        transitions = 0
+        self.timings = {}
+        originals = self.profile()
+        start = time.perf_counter()
+        try:
+            for _ in range(dungeons):
+                dungeon_ticks, dungeon_transitions, outcome = self.play_dungeon(
+                    bot, (debug, weapon_factory, item_factory)
+                )
+                ticks += dungeon_ticks
+                transitions += dungeon_transitions
+                outcomes[outcome] += 1
+        finally:
+            elapsed = time.perf_counter() - start
+            for cls, name, method in originals:  # Remove the timing wrappers
+                setattr(cls, name, method)
+        return {
+            "dungeons": dungeons,
+            "outcomes": outcomes,
+            "ticks": ticks,
+            "room_transitions": transitions,
+            "wall_time": elapsed,
+            "simulated_time": ticks * self.tick,
+            "ticks_per_second": ticks / elapsed,
+            "room_transitions_per_second": transitions / elapsed,
+            "methods": {
+                name: {"calls": calls, "seconds": seconds, "share": seconds / elapsed}
+                for name, (calls, seconds) in sorted(
+                    self.timings.items(), key=lambda item: -item[1][1]
+                )
+            },
+        }
+
+    def play_dungeon(self, bot, context) -> tuple[int, int, str]:
+        """Play one dungeon and return its ticks, room transitions and outcome."""
+        from generators_package.entity_generator import Player
+
+        debug, weapon_factory, item_factory = context
+        player = Player(
+            debugger=debug,
+            weapon=weapon_factory.create("fists"),
+            inventory=[item_factory.create("None") for _ in range(2)],
+        )
+        dungeon = DungeonManager(
+            player,
+            debug,
+            weapon_factory,
+            item_factory,
+            size=self.dungeon_size,
+            background_ai=False,  # Decisions must land on the tick they were made for a repeatable run
+            clock=self.clock,
+            ai_budget_ms=0,  # A wall time budget would make runs differ
+            room_size=self.room_size,
+            prefetch_rooms=False,  # Nothing to overlap with, rooms behind doors never taken would be generated for nothing
+        )
+        transitions = 0
+        for tick in range(1, self.max_ticks + 1):
+            self.clock.advance(self.tick)
+            result = dungeon.move_player(bot.choose(dungeon.current_room)) or {}
+            match result.get("action"):
+                case "room_transition":
+                    dungeon.current_room.activate_room(result.get("player_pos"))
+                    transitions += 1
+                case "exit":
+                    return tick, transitions, "exit"
+                case "death":
+                    return tick, transitions, "death"
+        return self.max_ticks, transitions, "timeout"
+
+    def profile(self) -> list[tuple[type, str, object]]:
+        """Wrap every method in PROFILED_METHODS with a timer and return the originals."""
+        originals = []
+        for cls, names in PROFILED_METHODS.items():
+            for name in names:
+                method = getattr(cls, name)
+                originals.append((cls, name, method))
+                setattr(cls, name, self.timed(f"{cls.__name__}.{name}", method))
+        return originals
+
+    def timed(self, label: str, method):
+        """Return `method` wrapped so its calls and time are added to self.timings."""
+        timing = self.timings.setdefault(label, [0, 0.0])
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                timing[0] += 1
+                timing[1] += time.perf_counter() - start
+
+        return wrapper
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Play dungeons headless at full speed")
+    parser.add_argument("--dungeons", type=int, default=20)
+    parser.add_argument("--bot", choices=["door", "random"], default="door")
+    parser.add_argument("--tick", type=float, default=0.1, help="Simulated seconds per tick")
+    parser.add_argument("--max-ticks", type=int, default=5000, help="Ticks before a dungeon is abandoned")
+    parser.add_argument("--size", type=int, default=2, help="Dungeon depth")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--room-size", type=int, default=11, help="Side length of every room")
+    args = parser.parse_args()
+    report = SimulationManager(
+        args.bot, args.tick, args.max_ticks, args.size, args.seed, args.room_size
+    ).run(args.dungeons)
+    print(json.dumps(report, indent=4))
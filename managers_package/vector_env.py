@@ -0,0 +1,198 @@
+"""Vectorized room environment."""
+
+# -- Imports --
+
+import random
+
+import numpy as np
+
+from managers_package.clock import SimulatedClock
+from managers_package.room_manager import RoomManager
+from managers_package.scheduler import TimerScheduler
+
+DIRECTIONS = [
+    (-1, -1),
+    (-1, 0),
+    (-1, 1),
+    (0, -1),
+    (0, 0),
+    (0, 1),
+    (1, -1),
+    (1, 0),
+    (1, 1),
+]  # Vector key: movement vector, the same order the rooms use
+
+
+class RoomVectorEnv:
+    """Vectorized room environment.
+
+    ## Description
+    Gym style environment that steps `num_rooms` independent rooms in lockstep.
+    Every room has `agents_per_room` agents, observations are stacked into one (rooms, agents, 13) feature array
+    laid out like `FeatureSchema` so a single policy forward pass decides every agent of every room.
+    Each room's reward is the fraction of its living agents whose action matches the `score` heuristic for their observation,
+    dead agents never move so they are left out.
+    Rooms that finish (the player dead or gone, every agent dead or `max_steps` reached) are reset automatically, the observation returned
+    for them is the first one of the new episode.
+    ## Attributes
+    ```
+    self.num_rooms: int # Rooms stepped together
+    self.agents_per_room: int # Agents in every room
+    self.max_steps: int # Steps before a room is reset
+    self.player_policy: str # 'random' walks the player every step, 'idle' leaves it still
+    self.tick: float # Simulated seconds per step
+    self.clock: SimulatedClock # Clock shared by every room
+    self.scheduler: TimerScheduler # Footstep and hit timers of every room
+    self.rng: random.Random # Player moves
+    self.rooms: list[RoomManager] # Current room of each slot
+    self.steps: np.ndarray # Steps taken in each room's episode
+    self.features: np.ndarray # (rooms, agents, 13) observation buffer reused between steps, observations are copies of it
+    ```
+    ## Methods
+    ```
+    reset(self, seed: int | None = None) -> dict[str, np.ndarray] # Start a new episode in every room and return the observations
+    step(self, actions) -> tuple[dict, np.ndarray, np.ndarray, dict] # Apply one action per agent and return observations, rewards, dones and info
+    get_observations(self) -> dict[str, np.ndarray] # Encode every agent into the observation buffer and return a copy
+    ```
+    """
+
+    def __init__(
+        self,
+        num_rooms: int = 64,
+        agents_per_room: int = 1,
+        max_steps: int = 100,
+        player_policy: str = "random",
+        tick: float = 0.1,
+    ) -> None:
+        """Initialise vectorized room environment."""
+        from factory_package.item_factory import ItemFactory, WeaponFactory
+        from managers_package.debug_manager import Debugger
+
+        if num_rooms <= 0 or agents_per_room <= 0:
+            raise ValueError("num_rooms and agents_per_room must be positive")
+        if player_policy not in ["random", "idle"]:
+            raise ValueError("player_policy must be 'random' or 'idle'")
+        self.num_rooms = num_rooms
+        self.agents_per_room = agents_per_room
+        self.max_steps = max_steps  # Steps before a room is reset
+        self.player_policy = player_policy
+        self.tick = tick  # Simulated seconds per step
+        self.clock = SimulatedClock()
+        self.scheduler = TimerScheduler(self.clock)
+        self.rng = random.Random()
+        self.debug = Debugger("Environment")
+        self.debug.on = False
+        self.weapon_factory = WeaponFactory()
+        self.item_factory = ItemFactory()
+        self.weapon_factory.initilise_registry()
+        self.item_factory.initilise_registry()
+        self.rooms: list[RoomManager] = []
+        self.steps = np.zeros(num_rooms, dtype=np.int64)
+        self.features = np.zeros(
+            (num_rooms, agents_per_room, 13), dtype=np.float32
+        )  # Observation buffer reused between steps
+
+    def create_room(self) -> RoomManager:
+        """Return a freshly generated room with a random player level and weakened agents."""
+        from generators_package.entity_generator import Player
+
+        room = RoomManager(
+            player=Player(
+                debugger=self.debug,
+                weapon=self.weapon_factory.create("fists"),
+                inventory=[self.item_factory.create("None") for _ in range(2)],
+                level=random.randint(0, 10),
+            ),
+            dungeon_manager=None,
+            debugger=self.debug,
+            weapon_factory=self.weapon_factory,
+            item_factory=self.item_factory,
+            level=0,
+            max_level=5,
+            doors=4,
+            coordinates=(random.randint(0, 1000), random.randint(0, 1000)),
+            enemy_count=self.agents_per_room,
+            clock=self.clock,
+            scheduler=self.scheduler,
+        )
+        for agent in room.entity_manager.Agents:
+            agent.deal_damage(random.randint(0, 99))
+        room.reset_episode(set_player=False)
+        return room
+
+    def reset(self, seed: int | None = None) -> dict[str, np.ndarray]:
+        """Start a new episode in every room and return the observations."""
+        if seed is not None:
+            random.seed(seed)  # Rooms are generated with the global random module
+            self.rng.seed(seed)
+        self.rooms = [self.create_room() for _ in range(self.num_rooms)]
+        self.steps[:] = 0
+        return self.get_observations()
+
+    def step(self, actions) -> tuple[dict[str, np.ndarray], np.ndarray, np.ndarray, dict]:
+        """Apply one action (vector key) per agent and return observations, rewards, dones and info.
+
+        `actions` has shape (rooms, agents). Rewards are scored against the observations the actions were chosen from.
+        """
+        from nn_package.heuristic import score_batch
+
+        actions = np.asarray(actions).reshape(self.num_rooms, self.agents_per_room)
+        rows = self.features.reshape(-1, 13).astype(np.float64)  # One row per agent
+        labels, _ = score_batch(
+            agent_health=rows[:, 11],
+            enemy_count=rows[:, 12],
+            level_diff=rows[:, 10],
+            player_visible=rows[:, 9] > 0,
+            sound_grid=rows[:, :9],
+        )
+        labels = labels.reshape(self.num_rooms, self.agents_per_room)
+        alive = np.array(
+            [[agent.health > 0 for agent in room.entity_manager.Agents] for room in self.rooms]
+        )  # Agents that act this step
+        rewards = ((actions == labels) & alive).sum(axis=1) / np.maximum(alive.sum(axis=1), 1)
+        rewards = rewards.astype(np.float32)
+        self.clock.advance(self.tick)
+        self.scheduler.run_due()
+        dones = np.zeros(self.num_rooms, dtype=bool)
+        for index, room in enumerate(self.rooms):
+            for agent, action in zip(room.entity_manager.Agents, actions[index].tolist()):
+                if agent.health > 0:
+                    agent.direction = DIRECTIONS[action]
+                    room.move_entity(agent, DIRECTIONS[action])
+            if self.player_policy == "random":
+                vector = self.rng.choice([(-1, 0), (1, 0), (0, -1), (0, 1)])
+                result = room.move_entity(room.entity_manager.player, vector)
+                if isinstance(result, dict) and result.get("action") == "moved":
+                    room.generate_heat_map()
+                elif isinstance(result, dict) and result.get("action") == "room_transition":
+                    dones[index] = True  # The player left, the episode is over
+            self.steps[index] += 1
+            if (
+                self.steps[index] >= self.max_steps
+                or room.entity_manager.player.health <= 0
+                or all(agent.health <= 0 for agent in room.entity_manager.Agents)
+            ):
+                dones[index] = True
+        for index in np.flatnonzero(dones).tolist():  # Automatic reset
+            self.rooms[index] = self.create_room()
+            self.steps[index] = 0
+        return self.get_observations(), rewards, dones, {"labels": labels, "alive": alive}
+
+    def get_observations(self) -> dict[str, np.ndarray]:
+        """Encode every agent into the observation buffer and return a copy of it, the buffer is overwritten by the next step."""
+        for index, room in enumerate(self.rooms):
+            player_level = room.entity_manager.player.level
+            for slot, agent in enumerate(room.entity_manager.Agents):
+                room.get_viewport(agent)
+                row = self.features[index, slot]
+                row[:9] = room.get_sound_window(agent)
+                row[9] = 1.0 if " P " in agent.vision.values() else 0.0
+                row[10] = player_level - agent.level
+                row[11] = agent.health
+                row[12] = room.enemy_count
+        features = self.features.copy()  # Callers may keep observations across steps
+        return {
+            "features": features,
+            "sound": features[..., :9],
+            "visible": features[..., 9] > 0,
+        }
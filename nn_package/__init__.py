@@ -1,6 +1,68 @@
 """NN package."""
 
-from .model import MovementNet
-from .encoder import encode_inputs
+import importlib
 
-__all__ = ['MovementNet', 'encode_inputs']
+MODULES = {
+    "MovementNet": ".model",
+    "encode_inputs": ".encoder",
+    "encode_features": ".features",
+    "FeatureSchema": ".features",
+    "NumpyMovementNet": ".numpy_model",
+    "export_npz": ".numpy_model",
+    "QuantizedNumpyMovementNet": ".numpy_model",
+    "export_int8_npz": ".numpy_model",
+    "distil_student": ".distillation",
+    "DecisionCache": ".decision_cache",
+    "get_decision_cache": ".decision_cache",
+    "ModelRegistry": ".registry",
+    "model_registry": ".registry",
+    "score": ".scenarios",
+    "generate_example": ".scenarios",
+    "score_batch": ".heuristic",
+    "score_features": ".heuristic",
+    "HeuristicPolicy": ".heuristic",
+    "generate_dataset": ".dataset",
+    "ShardedDataset": ".dataset",
+    "ScenarioStream": ".trainer",
+    "train_policy": ".trainer",
+    "RunManager": ".run_manager",
+    "MetricRing": ".run_manager",
+    "build_suite": ".evaluation",
+    "evaluate_policy": ".evaluation",
+}  # Name: module that defines it, torch and numpy are only imported when a model is used
+
+__all__ = [
+    'MovementNet',
+    'encode_inputs',
+    'encode_features',
+    'FeatureSchema',
+    'NumpyMovementNet',
+    'export_npz',
+    'QuantizedNumpyMovementNet',
+    'export_int8_npz',
+    'distil_student',
+    'DecisionCache',
+    'get_decision_cache',
+    'ModelRegistry',
+    'model_registry',
+    'score',
+    'generate_example',
+    'score_batch',
+    'score_features',
+    'HeuristicPolicy',
+    'generate_dataset',
+    'ShardedDataset',
+    'ScenarioStream',
+    'train_policy',
+    'RunManager',
+    'MetricRing',
+    'build_suite',
+    'evaluate_policy',
+]
+
+
+def __getattr__(name):
+    """Import the module that defines `name` on first use so the game starts without loading torch or numpy."""
+    if name in MODULES:
+        return getattr(importlib.import_module(MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,199 @@
+"""Training dataset."""
+
+# -- Imports --
+
+import bisect
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .features import FeatureSchema
+
+MANIFEST = "manifest.json"  # Name of the manifest inside a dataset directory
+COLUMNS = {
+    "features": (np.float32, (FeatureSchema.WIDTH,)),
+    "labels": (np.int8, ()),
+    "points": (np.int16, ()),
+}  # Shard column: (dtype, shape of one row)
+
+worker_context = None  # (debugger, weapon factory, item factory) of a generator process
+
+
+def init_worker() -> None:
+    """Create the silent debugger and factories a generator process reuses for every room."""
+    global worker_context
+    from factory_package.item_factory import ItemFactory, WeaponFactory
+    from managers_package.debug_manager import Debugger
+
+    debug = Debugger("Dataset")
+    debug.on = False
+    weapon_factory = WeaponFactory()
+    item_factory = ItemFactory()
+    weapon_factory.initilise_registry()
+    item_factory.initilise_registry()
+    worker_context = (debug, weapon_factory, item_factory)
+
+
+def generate_shard(directory: str, index: int, rows: int, seed: int) -> dict:
+    """Write `rows` randomized (features, label, points) rows into .npy shard files and return the shard's manifest entry."""
+    from .scenarios import generate_example
+
+    if worker_context is None:
+        init_worker()
+    random.seed(seed)  # Rooms are generated with the global random module
+    shard = {"rows": rows, "seed": seed}
+    columns = {}
+    for name, (dtype, shape) in COLUMNS.items():
+        shard[name] = f"shard_{index:05d}_{name}.npy"
+        columns[name] = np.lib.format.open_memmap(
+            os.path.join(directory, shard[name]),
+            mode="w+",
+            dtype=dtype,
+            shape=(rows, *shape),
+        )  # Written in place, never held in memory
+    for row in range(rows):
+        features, label, points = generate_example(*worker_context)  # type: ignore
+        columns["features"][row] = features
+        columns["labels"][row] = label
+        columns["points"][row] = points
+    for column in columns.values():
+        column.flush()
+    return shard
+
+
+def generate_dataset(
+    directory: str,
+    rows: int,
+    shard_rows: int = 100_000,
+    workers: int | None = None,
+    seed: int = 0,
+) -> dict:
+    """Generate `rows` training rows across a process pool, write them as shards with a manifest and return the manifest.
+
+    Shard `i` is seeded with `seed + i` so a dataset is reproducible whatever the number of workers.
+    """
+    if rows <= 0 or shard_rows <= 0:
+        raise ValueError("rows and shard_rows must be positive")
+    os.makedirs(directory, exist_ok=True)
+    shard_sizes = [
+        min(shard_rows, rows - start) for start in range(0, rows, shard_rows)
+    ]
+    workers = min(workers or os.cpu_count() or 1, len(shard_sizes))
+    start = time.perf_counter()
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=init_worker
+    ) as executor:
+        shards = list(
+            executor.map(
+                generate_shard,
+                [directory] * len(shard_sizes),
+                range(len(shard_sizes)),
+                shard_sizes,
+                [seed + index for index in range(len(shard_sizes))],
+            )
+        )
+    elapsed = time.perf_counter() - start
+    manifest = {
+        "rows": rows,
+        "seed": seed,
+        "columns": {
+            name: {"dtype": np.dtype(dtype).name, "shape": list(shape)}
+            for name, (dtype, shape) in COLUMNS.items()
+        },
+        "shards": shards,
+        "workers": workers,
+        "generation_time": elapsed,
+        "rows_per_second": rows / elapsed,
+    }
+    with open(os.path.join(directory, MANIFEST), "w") as file:
+        json.dump(manifest, file, indent=4)
+    return manifest
+
+
+class ShardedDataset:
+    """Sharded dataset.
+
+    ## Description
+    Read-only view of a dataset written by `generate_dataset`.
+    Every shard is memory mapped so rows are read from disk on demand without copying the dataset into memory.
+    Supports `len()` and indexing, so it can be handed straight to a torch `DataLoader`.
+    ## Attributes
+    ```
+    self.directory: str # Dataset directory
+    self.manifest: dict # Parsed manifest
+    self.shards: list[dict[str, np.memmap]] # Column name: memory mapped array for each shard
+    self.offsets: list[int] # Index of the first row of each shard
+    ```
+    ## Methods
+    ```
+    __len__(self) -> int # Return the number of rows
+    __getitem__(self, index: int) -> tuple[np.ndarray, int, int] # Return the features, label and points of a row
+    get_column(self, name: str) -> np.ndarray # Return a whole column as one array (copied)
+    ```
+    """
+
+    def __init__(self, directory: str) -> None:
+        """Initialise sharded dataset."""
+        self.directory = directory  # Dataset directory
+        with open(os.path.join(directory, MANIFEST)) as file:
+            self.manifest = json.load(file)  # Parsed manifest
+        self.shards = [
+            {
+                name: np.load(os.path.join(directory, shard[name]), mmap_mode="r")
+                for name in COLUMNS
+            }
+            for shard in self.manifest["shards"]
+        ]  # Memory mapped columns of each shard
+        self.offsets = []  # Index of the first row of each shard
+        total = 0
+        for shard in self.manifest["shards"]:
+            self.offsets.append(total)
+            total += shard["rows"]
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return self.manifest["rows"]
+
+    def __getitem__(self, index: int) -> tuple[np.ndarray, int, int]:
+        """Return the features, label and points of a row."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("dataset index out of range")
+        shard_index = bisect.bisect_right(self.offsets, index) - 1
+        shard = self.shards[shard_index]
+        row = index - self.offsets[shard_index]
+        return (
+            np.array(shard["features"][row]),  # Copied out of the read-only map
+            int(shard["labels"][row]),
+            int(shard["points"][row]),
+        )
+
+    def get_column(self, name: str) -> np.ndarray:
+        """Return a whole column as one array (copied)."""
+        if name not in COLUMNS:
+            raise ValueError(f"column must be one of {list(COLUMNS)}")
+        return np.concatenate([shard[name] for shard in self.shards])
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate a sharded training dataset")
+    parser.add_argument("directory", help="Directory the shards and manifest are written to")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Total rows to generate")
+    parser.add_argument("--shard-rows", type=int, default=100_000, help="Rows per shard")
+    parser.add_argument("--workers", type=int, default=None, help="Generator processes (default: every core)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the first shard")
+    args = parser.parse_args()
+    manifest = generate_dataset(
+        args.directory, args.rows, args.shard_rows, args.workers, args.seed
+    )
+    print(
+        f"Wrote {manifest['rows']} rows in {len(manifest['shards'])} shards to {args.directory} "
+        f"({manifest['rows_per_second']:.0f} rows/s with {manifest['workers']} workers)"
+    )
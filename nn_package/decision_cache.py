@@ -0,0 +1,134 @@
+"""Decision cache."""
+
+# -- Imports --
+
+import os
+import threading
+from collections import OrderedDict
+
+
+class DecisionCache:
+    """Decision cache.
+
+    ## Description
+    Bounded LRU cache of policy decisions keyed on quantized perception features.
+    Agents often see the same sound window, visibility, health bucket, level difference and enemy count,
+    a hit skips encoding and the forward pass entirely.
+    The keys are lossy, an agent can reuse the decision of another whose sound or health differs slightly,
+    so the cache is off unless a size is set (`python benchmark.py decision_cache` reports its agreement with the uncached policy).
+    ## Attributes
+    ```
+    self.size: int # Maximum number of decisions kept, 0 disables the cache
+    self.sound_step: float # Sound intensities are rounded to a multiple of this
+    self.health_step: float # Agent health is bucketed into steps of this size
+    self.level_step: int # Level difference is bucketed into steps of this size
+    self.entries: OrderedDict[tuple, int] # Quantized features: vector key, least recently used first
+    self.hits: int # Decisions served from the cache
+    self.misses: int # Decisions that needed the policy
+    self.evictions: int # Decisions dropped to stay within self.size
+    self.lock: threading.Lock # Guards the entries and counters
+    ```
+    ## Methods
+    ```
+    make_key(self, sound_grid, player_visible, level_diff, agent_health, allied_agent_count) -> tuple # Return the quantized feature tuple
+    get(self, key: tuple) -> int | None # Return the cached vector key or None on a miss
+    put(self, key: tuple, decision: int) -> None # Store a decision, evicting the least recently used one when full
+    get_stats(self) -> dict[str, float] # Return hit, miss and eviction counters
+    clear(self) -> None # Drop every decision and reset the counters
+    ```
+    """
+
+    def __init__(
+        self,
+        size: int = 0,
+        sound_step: float = 0.05,
+        health_step: float = 5,
+        level_step: int = 1,
+    ) -> None:
+        """Initialise decision cache."""
+        self.size = size  # Maximum number of decisions kept
+        self.sound_step = sound_step  # Sound quantization
+        self.health_step = health_step  # Health bucket size
+        self.level_step = level_step  # Level difference bucket size
+        self.entries: OrderedDict[tuple, int] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    def make_key(
+        self,
+        sound_grid: list[float],
+        player_visible: bool,
+        level_diff: int,
+        agent_health: float,
+        allied_agent_count: int,
+    ) -> tuple:
+        """Return the quantized feature tuple used as a cache key."""
+        return (
+            tuple(round(sound / self.sound_step) for sound in sound_grid),
+            player_visible,
+            int(level_diff // self.level_step),
+            int(agent_health // self.health_step),
+            allied_agent_count,
+        )
+
+    def get(self, key: tuple) -> int | None:
+        """Return the cached vector key or None on a miss."""
+        with self.lock:
+            decision = self.entries.get(key)
+            if decision is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)  # Most recently used
+            self.hits += 1
+            return decision
+
+    def put(self, key: tuple, decision: int) -> None:
+        """Store a decision, evicting the least recently used one when full."""
+        if self.size <= 0:
+            return
+        with self.lock:
+            self.entries[key] = decision
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_stats(self) -> dict[str, float]:
+        """Return hit, miss and eviction counters."""
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self.entries),
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def clear(self) -> None:
+        """Drop every decision and reset the counters."""
+        with self.lock:
+            self.entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+
+decision_caches: dict[str, DecisionCache] = {}  # Shared caches, one per model weights file
+decision_caches_lock = threading.Lock()
+
+
+def get_decision_cache(name: str, **settings) -> DecisionCache:
+    """Return the shared decision cache for a model, created with `settings` on first use.
+
+    The default size can be set with RETROGUE_DECISION_CACHE_SIZE, 0 (the default) turns caching off.
+    """
+    with decision_caches_lock:
+        if name not in decision_caches:
+            settings.setdefault(
+                "size", int(os.environ.get("RETROGUE_DECISION_CACHE_SIZE", 0))
+            )
+            decision_caches[name] = DecisionCache(**settings)
+        return decision_caches[name]
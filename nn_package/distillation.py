@@ -0,0 +1,71 @@
+"""Distillation."""
+
+# -- Imports --
+
+import torch
+import torch.nn.functional
+
+from .model import MovementNet
+
+
+def distil_student(
+    teacher: MovementNet,
+    features,
+    fc1_size: int = 32,
+    fc2_size: int = 16,
+    epochs: int = 200,
+    batch_size: int = 256,
+    learning_rate: float = 3e-3,
+    temperature: float = 2.0,
+) -> MovementNet:
+    """Train a smaller MovementNet to copy the teacher's softened move distribution over the rows of `features`."""
+    inputs = torch.as_tensor(features, dtype=torch.float32)
+    with torch.no_grad():
+        targets = torch.nn.functional.softmax(teacher(inputs) / temperature, dim=1)  # Soft labels
+    student = MovementNet(fc1_size=fc1_size, fc2_size=fc2_size)
+    optimizer = torch.optim.Adam(student.parameters(), lr=learning_rate)
+    for _ in range(epochs):
+        order = torch.randperm(len(inputs))
+        for start in range(0, len(inputs), batch_size):
+            batch = order[start : start + batch_size]
+            log_probs = torch.nn.functional.log_softmax(
+                student(inputs[batch]) / temperature, dim=1
+            )
+            loss = torch.nn.functional.kl_div(
+                log_probs, targets[batch], reduction="batchmean"
+            ) * (temperature**2)
+            optimizer.zero_grad()
+            loss.backward()
+            optimizer.step()
+    student.eval()
+    return student
+
+
+if __name__ == "__main__":
+    import random
+
+    from factory_package.item_factory import ItemFactory, WeaponFactory
+    from managers_package.debug_manager import Debugger
+    from nn_package.numpy_model import export_int8_npz, export_npz
+    from nn_package.registry import model_registry
+    from nn_package.scenarios import generate_example
+
+    debug = Debugger("Distillation")
+    debug.on = False
+    weapon_factory = WeaponFactory()
+    item_factory = ItemFactory()
+    weapon_factory.initilise_registry()
+    item_factory.initilise_registry()
+    random.seed(0)
+    torch.manual_seed(0)
+
+    examples = [generate_example(debug, weapon_factory, item_factory)[0] for _ in range(20000)]
+    teacher = model_registry.get("nn_package/enemy_controller.pth", backend="torch")
+    student = distil_student(teacher, examples)
+    inputs = torch.as_tensor(examples, dtype=torch.float32)
+    with torch.no_grad():
+        agreement = (student(inputs).argmax(dim=1) == teacher(inputs).argmax(dim=1)).float().mean()
+    print(f"Student agrees with the teacher on {float(agreement) * 100:.2f}% of training rooms")
+    torch.save(student.state_dict(), "nn_package/enemy_student.pth")
+    npz_path = export_npz("nn_package/enemy_student.pth")
+    print(f"Saved nn_package/enemy_student.pth, {npz_path} and {export_int8_npz(npz_path)}")
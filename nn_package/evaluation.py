@@ -0,0 +1,76 @@
+"""Policy evaluation."""
+
+# -- Imports --
+
+import random
+import time
+
+import numpy as np
+
+from generators_package.tiles import Tile
+
+from . import dataset
+from .features import FeatureSchema
+
+MOVES = 9  # Size of the move grid, vector key k moves by ((k // 3) - 1, (k % 3) - 1)
+
+
+def backend_for(path: str) -> str:
+    """Return the backend that reads a weight file from its name."""
+    if path.endswith("_int8.npz"):
+        return "int8"
+    if path.endswith(".npz"):
+        return "numpy"
+    if path.endswith(".pth"):
+        return "torch"
+    raise ValueError("model files must be .pth, .npz or _int8.npz")
+
+
+def build_suite(rooms: int = 1000, seed: int = 0) -> dict[str, np.ndarray]:
+    """Return a fixed suite of `rooms` seeded rooms: features, heuristic labels and which moves are blocked by a wall or door."""
+    from .scenarios import generate_room, get_example
+
+    if dataset.worker_context is None:
+        dataset.init_worker()
+    state = random.getstate()  # Do not disturb the caller's random stream
+    random.seed(seed)
+    features = np.empty((rooms, FeatureSchema.WIDTH), dtype=np.float32)
+    labels = np.empty(rooms, dtype=np.int64)
+    blocked = np.zeros((rooms, MOVES), dtype=bool)
+    for index in range(rooms):
+        game = generate_room(*dataset.worker_context)  # type: ignore
+        features[index], labels[index], _ = get_example(game)
+        y, x = game.entity_manager.Agents[0].pos
+        for key in range(MOVES):
+            tile = game.tiles.get(y + key // 3 - 1, x + key % 3 - 1)
+            blocked[index, key] = tile in (Tile.WALL, Tile.DOOR)
+    random.setstate(state)
+    return {"features": features, "labels": labels, "blocked": blocked}
+
+
+def evaluate_policy(model, suite: dict[str, np.ndarray], min_time: float = 0.2) -> dict:
+    """Run a model over a suite and return its agreement with the heuristic, confusion matrix, wall collision rate and speed."""
+    features, labels, blocked = suite["features"], suite["labels"], suite["blocked"]
+    predictions = np.asarray(model.decide(features), dtype=np.int64)
+    confusion = np.zeros((MOVES, MOVES), dtype=np.int64)  # Rows are heuristic moves, columns are model moves
+    np.add.at(confusion, (labels, predictions), 1)
+    calls = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < min_time:  # Repeat the batch until the timing is stable
+        model.decide(features)
+        calls += 1
+    elapsed = time.perf_counter() - start
+    single_calls = min(len(features), 500)
+    single_start = time.perf_counter()
+    for row in features[:single_calls]:  # One agent per call like a quiet room
+        model.decide(row[None])
+    single_elapsed = time.perf_counter() - single_start
+    return {
+        "rooms": len(labels),
+        "agreement": float((predictions == labels).mean()),
+        "wall_collision_rate": float(blocked[np.arange(len(labels)), predictions].mean()),
+        "heuristic_wall_collision_rate": float(blocked[np.arange(len(labels)), labels].mean()),
+        "decisions_per_second": calls * len(features) / elapsed,
+        "single_decisions_per_second": single_calls / single_elapsed,
+        "confusion_matrix": confusion.tolist(),
+    }
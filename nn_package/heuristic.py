@@ -0,0 +1,126 @@
+"""Movement heuristic."""
+
+# -- Imports --
+
+import numpy as np
+
+from nn_package.features import FeatureSchema
+
+
+def score_features(
+    agent_health: float,
+    enemy_count: int,
+    level_diff: float,
+    player_visible: bool,
+    sound_grid: list[float],
+) -> list[int]:
+    """Apply the `score` rules (nn_package.scenarios) to one agent's features and return [move, score points]."""
+    score_value = 0
+    if (
+        agent_health >= 80
+    ):  # When an entity has a high amount of health it will be more confident
+        score_value += 50
+    elif 50 <= agent_health < 80:
+        score_value += 40
+    else:
+        score_value -= 60  # If weak then the enemy will be more scared
+    if (
+        enemy_count == 1
+    ):  # If there is lots of allies for the entity it will be more confident
+        score_value -= 30
+    elif 2 <= enemy_count < 4:
+        score_value += 30
+    elif enemy_count >= 4:
+        score_value += 50
+
+    if level_diff <= 5:
+        score_value += 40
+    else:
+        score_value -= 40
+
+    if (
+        player_visible
+    ):  # If the entity can see the player and is confident it will attack more otherwise it will run away
+        if score_value > 60:
+            score_value += 100
+        else:
+            score_value -= 150
+
+    s = sound_grid
+    if score_value >= 50:  # If confident then go to the largest sound intentisty
+        i = s.index(max(s))
+        return [i, score_value]  #
+    else:  # Otherwise go to the minimum sound intensity
+        abs_s = []
+        for sound in s:
+            abs_s.append(abs(sound))
+        i = s.index(min(abs_s))
+        return [i, score_value]
+
+
+def score_batch(
+    agent_health,
+    enemy_count,
+    level_diff,
+    player_visible,
+    sound_grid,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized `score` over many agents, returns the move labels and score points.
+
+    Takes arrays of agent health, enemy count, level difference, player visible flags and (n, 9) sound windows
+    and gives exactly the labels and points `score` gives for each agent.
+    """
+    agent_health = np.asarray(agent_health)
+    enemy_count = np.asarray(enemy_count)
+    level_diff = np.asarray(level_diff)
+    player_visible = np.asarray(player_visible, dtype=bool)
+    sound_grid = np.asarray(sound_grid)
+    score_value = np.select(
+        [agent_health >= 80, agent_health >= 50], [50, 40], -60
+    ).astype(np.int64)  # Health confidence
+    score_value += np.select(
+        [enemy_count == 1, (enemy_count >= 2) & (enemy_count < 4), enemy_count >= 4],
+        [-30, 30, 50],
+        0,
+    )  # Ally confidence
+    score_value += np.where(level_diff <= 5, 40, -40)
+    score_value += np.where(
+        player_visible, np.where(score_value > 60, 100, -150), 0
+    )  # Attack a visible player when confident, otherwise flee
+    loudest = sound_grid.argmax(axis=1)  # First index of the maximum, like list.index
+    quietest_match = sound_grid == np.abs(sound_grid).min(axis=1, keepdims=True)
+    confident = score_value >= 50
+    if not quietest_match[~confident].any(axis=1).all():
+        raise ValueError("quietest sound is not in the sound window")  # list.index raises the same way
+    labels = np.where(confident, loudest, quietest_match.argmax(axis=1))
+    return labels, score_value
+
+
+class HeuristicPolicy:
+    """Heuristic policy.
+
+    ## Description
+    Zero-model policy that moves agents with `score_batch` straight from their encoded features.
+    Used when the AI backend is 'heuristic' and as the fallback when a model's weight file is missing.
+    ## Methods
+    ```
+    decide(self, rows) -> list[int] # Return the heuristic move for each row of encoded features
+    get_memory(self) -> int # Return the bytes held by the weights (none)
+    ```
+    """
+
+    def decide(self, rows) -> list[int]:
+        """Return the heuristic move for each row of encoded features."""
+        rows = np.asarray(rows, dtype=np.float64)
+        labels, _ = score_batch(
+            agent_health=rows[:, FeatureSchema.HEALTH],
+            enemy_count=rows[:, FeatureSchema.ALLIED_COUNT],
+            level_diff=rows[:, FeatureSchema.LEVEL_DIFF],
+            player_visible=rows[:, FeatureSchema.VISIBLE] > 0,
+            sound_grid=rows[:, FeatureSchema.SOUND],
+        )
+        return labels.tolist()
+
+    def get_memory(self) -> int:
+        """Return the bytes held by the weights (none)."""
+        return 0
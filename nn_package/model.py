@@ -16,18 +16,28 @@ class MovementNet(torch.nn.Module):
     `self.fc1 = torch.nn.Linear(13, 64)`: Hidden Layer
     `self.fc2 = torch.nn.Linear(64, 32)`: Hidden Layer
     `self.move = torch.nn.Linear(32, 9)`: Output Layer
+    The hidden layer sizes can be shrunk for distilled student networks e.g `MovementNet(16, 16)`
+    ## Methods
+    `forward(self, encoded_object)`: Move logits forwards
+    `decide(self, rows) -> list[int]`: Return the argmax move for each row of encoded features
     """
 
-    def __init__(self):
+    def __init__(self, fc1_size: int = 64, fc2_size: int = 32):
         """Initilise the neural netwwork's nodes."""
         super().__init__()
-        self.fc1 = torch.nn.Linear(13, 64)
-        self.fc2 = torch.nn.Linear(64, 32)
-        self.move = torch.nn.Linear(32, 9)
+        self.fc1 = torch.nn.Linear(13, fc1_size)
+        self.fc2 = torch.nn.Linear(fc1_size, fc2_size)
+        self.move = torch.nn.Linear(fc2_size, 9)
 
     def forward(self, encoded_object):
         """Move logits forwards."""
         encoded_object = torch.nn.functional.relu(self.fc1(encoded_object))
         encoded_object = torch.nn.functional.relu(self.fc2(encoded_object))
         move_logits = self.move(encoded_object)
-        return move_logits
\ No newline at end of file
+        return move_logits
+
+    def decide(self, rows) -> list[int]:
+        """Return the argmax move for each row of encoded features using a single forward pass."""
+        with torch.inference_mode():  # No autograd bookkeeping for gameplay decisions
+            output = self(torch.as_tensor(rows, dtype=torch.float32))
+        return torch.argmax(output, dim=1).tolist()
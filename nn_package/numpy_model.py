@@ -0,0 +1,177 @@
+"""NumPy movement network."""
+
+# -- Imports --
+
+import os
+
+import numpy as np
+
+
+def export_npz(pth_path: str, npz_path: str | None = None) -> str:
+    """Export a MovementNet state dict (.pth) into a compact .npz archive and return its path."""
+    import torch  # Only exporting needs torch
+
+    state_dict = torch.load(pth_path, map_location="cpu")
+    if npz_path is None:
+        npz_path = os.path.splitext(pth_path)[0] + ".npz"
+    np.savez_compressed(
+        npz_path,
+        **{
+            name: tensor.numpy().astype(np.float32)
+            for name, tensor in state_dict.items()
+        },
+    )
+    return npz_path
+
+
+def export_int8_npz(
+    npz_path: str, int8_path: str | None = None, float_layers: tuple[str, ...] = ("fc1",)
+) -> str:
+    """Quantize the weights of an .npz export to int8 with one scale per output node and return the new archive's path.
+
+    Layers in `float_layers` stay float32, fc1 sees the raw health and level features (up to 100) so int8 error there flips moves.
+    """
+    if int8_path is None:
+        int8_path = os.path.splitext(npz_path)[0] + "_int8.npz"
+    quantized = {}
+    with np.load(npz_path) as archive:
+        for name in NumpyMovementNet.LAYER_NAMES:
+            weight = archive[f"{name}.weight"]  # (out, in)
+            if name in float_layers:
+                quantized[f"{name}.weight"] = weight
+                quantized[f"{name}.bias"] = archive[f"{name}.bias"]
+                continue
+            scale = np.abs(weight).max(axis=1) / 127
+            scale[scale == 0] = 1  # Rows of zeros stay zero
+            quantized[f"{name}.weight"] = np.clip(
+                np.round(weight / scale[:, None]), -127, 127
+            ).astype(np.int8)
+            quantized[f"{name}.scale"] = scale.astype(np.float32)
+            quantized[f"{name}.bias"] = archive[f"{name}.bias"]
+    np.savez_compressed(int8_path, **quantized)
+    return int8_path
+
+
+class NumpyMovementNet:
+    """NumPy movement network.
+
+    ## Description
+    Torch free runtime copy of `MovementNet` (13 -> 64 -> 32 -> 9 Linear/ReLU layers) that gives the same argmax move.
+    Weights are read from an .npz archive made by `export_npz`.
+    ## Attributes
+    ```
+    self.layers: list[tuple[np.ndarray, np.ndarray]] # (transposed weight, bias) of each layer in order
+    ```
+    ## Methods
+    ```
+    load(cls, path: str) -> NumpyMovementNet # Load the network from an .npz archive
+    forward(self, encoded_object) -> np.ndarray # Move logits forwards
+    decide(self, rows) -> list[int] # Return the argmax move for each row of encoded features
+    get_memory(self) -> int # Return the bytes held by the weights
+    ```
+    """
+
+    LAYER_NAMES = ["fc1", "fc2", "move"]  # Layer names in the MovementNet state dict
+
+    def __init__(self, weights: dict[str, np.ndarray]) -> None:
+        """Initilise the network from a MovementNet state dict."""
+        self.layers: list[tuple[np.ndarray, np.ndarray]] = [
+            (
+                np.ascontiguousarray(weights[f"{name}.weight"].T, dtype=np.float32),
+                np.asarray(weights[f"{name}.bias"], dtype=np.float32),
+            )
+            for name in self.LAYER_NAMES
+        ]  # Weights are stored transposed so rows can be multiplied directly
+
+    @classmethod
+    def load(cls, path: str) -> "NumpyMovementNet":
+        """Load the network from an .npz archive."""
+        with np.load(path) as archive:
+            return cls({name: archive[name] for name in archive.files})
+
+    def forward(self, encoded_object) -> np.ndarray:
+        """Move logits forwards."""
+        hidden = np.asarray(encoded_object, dtype=np.float32)
+        for index, (weight, bias) in enumerate(self.layers):
+            hidden = hidden @ weight + bias
+            if index < len(self.layers) - 1:  # ReLU on every hidden layer
+                np.maximum(hidden, 0, out=hidden)
+        return hidden
+
+    __call__ = forward
+
+    def decide(self, rows) -> list[int]:
+        """Return the argmax move for each row of encoded features."""
+        return np.argmax(self.forward(rows), axis=1).tolist()
+
+    def get_memory(self) -> int:
+        """Return the bytes held by the weights."""
+        return sum(weight.nbytes + bias.nbytes for weight, bias in self.layers)
+
+
+class QuantizedNumpyMovementNet(NumpyMovementNet):
+    """Quantized NumPy movement network.
+
+    ## Description
+    int8 copy of `NumpyMovementNet`, weights are stored as int8 with one float32 scale per output node (a quarter of the memory).
+    Layers saved without a scale (fc1 by default) stay float32.
+    Weights are read from an archive made by `export_int8_npz`.
+    ## Attributes
+    ```
+    self.layers: list[tuple[np.ndarray, np.ndarray]] # (transposed int8 or float32 weight, bias) of each layer in order
+    self.scales: list[np.ndarray | None] # Scale of each output node for each layer, None for float32 layers
+    ```
+    ## Methods
+    ```
+    load(cls, path: str) -> QuantizedNumpyMovementNet # Load the network from an int8 .npz archive
+    forward(self, encoded_object) -> np.ndarray # Move logits forwards
+    decide(self, rows) -> list[int] # Return the argmax move for each row of encoded features
+    get_memory(self) -> int # Return the bytes held by the weights
+    ```
+    """
+
+    def __init__(self, weights: dict[str, np.ndarray]) -> None:
+        """Initilise the network from an int8 archive."""
+        self.layers = [
+            (
+                np.ascontiguousarray(weights[f"{name}.weight"].T),
+                np.asarray(weights[f"{name}.bias"], dtype=np.float32),
+            )
+            for name in self.LAYER_NAMES
+        ]  # int8 weights keep their dtype
+        self.scales: list[np.ndarray | None] = [
+            (
+                np.asarray(weights[f"{name}.scale"], dtype=np.float32)
+                if f"{name}.scale" in weights
+                else None
+            )
+            for name in self.LAYER_NAMES
+        ]
+
+    def forward(self, encoded_object) -> np.ndarray:
+        """Move logits forwards."""
+        hidden = np.asarray(encoded_object, dtype=np.float32)
+        for index, ((weight, bias), scale) in enumerate(zip(self.layers, self.scales)):
+            if scale is None:  # float32 layer
+                hidden = hidden @ weight + bias
+            else:
+                hidden = (hidden @ weight) * scale + bias  # Scales are applied after the product
+            if index < len(self.layers) - 1:  # ReLU on every hidden layer
+                np.maximum(hidden, 0, out=hidden)
+        return hidden
+
+    __call__ = forward
+
+    def get_memory(self) -> int:
+        """Return the bytes held by the weights."""
+        return super().get_memory() + sum(
+            scale.nbytes for scale in self.scales if scale is not None
+        )
+
+
+if __name__ == "__main__":
+    for model_name in ["enemy_controller", "coward", "enemy_student"]:
+        if not os.path.exists(f"nn_package/{model_name}.pth"):
+            continue
+        npz_path = export_npz(f"nn_package/{model_name}.pth")
+        print(f"Exported {npz_path} and {export_int8_npz(npz_path)}")
@@ -0,0 +1,178 @@
+"""Model registry."""
+
+# -- Imports --
+
+import importlib.util
+import os
+import threading
+import time
+
+BACKENDS = ["torch", "numpy", "int8", "heuristic"]  # Supported inference backends (int8 is the quantized numpy runtime, heuristic needs no model)
+POLICIES = {
+    "full": "nn_package/enemy_controller.pth",
+    "student": "nn_package/enemy_student.pth",
+}  # Enemy policy variants: weights (the student is distilled from the full model)
+ARCHETYPES = {
+    "controller": None,
+    "coward": "nn_package/coward.pth",
+}  # Agent archetype: weights, None uses the selected enemy policy
+
+
+def default_policy() -> str:
+    """Return the policy chosen with RETROGUE_AI_POLICY, otherwise the full model."""
+    policy = os.environ.get("RETROGUE_AI_POLICY", "full")
+    if policy not in POLICIES:
+        raise ValueError(f"RETROGUE_AI_POLICY must be one of {list(POLICIES)}")
+    return policy
+
+
+def archetype_path(archetype: str, policy: str | None = None) -> str:
+    """Return the weights an agent archetype is moved by."""
+    if archetype not in ARCHETYPES:
+        raise ValueError(f"archetype must be one of {list(ARCHETYPES)}")
+    return ARCHETYPES[archetype] or POLICIES[policy or default_policy()]
+
+
+def default_archetype_mix() -> dict[str, float] | None:
+    """Return the archetype weights chosen with RETROGUE_AI_ARCHETYPES (e.g. 'controller=3,coward=1'), otherwise None."""
+    value = os.environ.get("RETROGUE_AI_ARCHETYPES")
+    if not value:
+        return None
+    mix = {}
+    for part in value.split(","):
+        archetype, _, weight = part.partition("=")
+        archetype = archetype.strip()
+        if archetype not in ARCHETYPES:
+            raise ValueError(f"RETROGUE_AI_ARCHETYPES archetypes must be in {list(ARCHETYPES)}")
+        mix[archetype] = float(weight or 1)
+    return mix
+
+
+def default_backend() -> str:
+    """Return the backend chosen with RETROGUE_AI_BACKEND, otherwise torch when it is installed and numpy when it is not."""
+    backend = os.environ.get("RETROGUE_AI_BACKEND")
+    if backend:
+        if backend not in BACKENDS:
+            raise ValueError(f"RETROGUE_AI_BACKEND must be one of {BACKENDS}")
+        return backend
+    return "torch" if importlib.util.find_spec("torch") is not None else "numpy"
+
+
+def weight_path(path: str, backend: str) -> str:
+    """Return the weight file a backend reads for a model path (.pth for torch, .npz for numpy, _int8.npz for int8)."""
+    root = os.path.splitext(path)[0]
+    match backend:
+        case "heuristic":  # Shared by every policy, there are no weights
+            return "heuristic"
+        case "torch":
+            return root + ".pth"
+        case "int8":
+            return root + "_int8.npz"
+        case _:
+            return root + ".npz"
+
+
+class ModelRegistry:
+    """Model registry.
+
+    ## Description
+    Process-wide cache of policy networks keyed by weight path.
+    Each model is loaded and put into eval mode once, then the same read-only instance is handed to every caller,
+    so creating a room no longer pays for a `torch.load`.
+    Models are served by the torch `MovementNet`, the torch free `NumpyMovementNet` or its int8 quantized
+    `QuantizedNumpyMovementNet`, all of which expose `decide(rows)`.
+    The weightless `HeuristicPolicy` is served for the heuristic backend and in place of a model whose weight file is missing.
+    ## Attributes
+    ```
+    self.backend: str # Backend used when one is not requested ('torch' or 'numpy')
+    self.models: dict[str, MovementNet | NumpyMovementNet] # Loaded models keyed by weight path
+    self.stats: dict[str, dict[str, float]] # Load time (s), parameter memory (bytes) and whether each model fell back to the heuristic
+    self.lock: threading.Lock # Stops two threads loading the same model at once
+    ```
+    ## Methods
+    ```
+    get(self, path: str, backend: str | None = None) -> MovementNet | NumpyMovementNet # Return the shared model for a weight path, loading it on first use
+    load(self, path: str, backend: str) -> MovementNet | NumpyMovementNet # Load a model from disk and freeze it
+    get_stats(self) -> dict[str, dict[str, float]] # Return the load time and memory of every loaded model
+    clear(self) -> None # Drop every cached model
+    ```
+    """
+
+    def __init__(self, backend: str | None = None) -> None:
+        """Initialise model registry."""
+        self.backend = backend or default_backend()  # Backend used when one is not requested
+        self.models = {}  # Loaded models keyed by weight path
+        self.stats: dict[str, dict[str, float]] = {}  # Load time and memory per model
+        self.lock = threading.Lock()  # Stops two threads loading the same model at once
+
+    def get(self, path: str, backend: str | None = None):
+        """Return the shared model for a weight path, loading it on first use."""
+        backend = backend or self.backend
+        path = weight_path(path, backend)
+        model = self.models.get(path)
+        if model is not None:  # Fast path once the model has been loaded
+            return model
+        with self.lock:
+            if path not in self.models:  # Another thread may have loaded it while waiting
+                try:
+                    self.models[path] = self.load(path, backend)
+                except FileNotFoundError:  # Agents still move without weights
+                    self.models[path] = self.load(path, "heuristic")
+                    self.stats[path]["fallback"] = True
+            return self.models[path]
+
+    def load(self, path: str, backend: str):
+        """Load a model from disk and freeze it."""
+        start = time.perf_counter()
+        if backend == "heuristic":
+            from .heuristic import HeuristicPolicy
+
+            model = HeuristicPolicy()
+            memory = 0
+        elif backend == "numpy":
+            from .numpy_model import NumpyMovementNet
+
+            model = NumpyMovementNet.load(path)
+            memory = model.get_memory()
+        elif backend == "int8":
+            from .numpy_model import QuantizedNumpyMovementNet
+
+            model = QuantizedNumpyMovementNet.load(path)
+            memory = model.get_memory()
+        else:
+            import torch
+
+            from .model import MovementNet
+
+            state_dict = torch.load(path, map_location="cpu")
+            model = MovementNet(
+                fc1_size=state_dict["fc1.weight"].shape[0],
+                fc2_size=state_dict["fc2.weight"].shape[0],
+            )  # Student networks have smaller hidden layers
+            model.load_state_dict(state_dict)  # Loads a nueral network
+            model.eval()
+            for parameter in model.parameters():  # Shared instances must never be trained
+                parameter.requires_grad_(False)
+            memory = sum(
+                tensor.numel() * tensor.element_size()
+                for tensor in list(model.parameters()) + list(model.buffers())
+            )  # Bytes held by the weights
+        self.stats[path] = {
+            "load_time": time.perf_counter() - start,
+            "memory": memory,
+            "fallback": False,
+        }
+        return model
+
+    def get_stats(self) -> dict[str, dict[str, float]]:
+        """Return the load time and memory of every loaded model."""
+        return {path: dict(stats) for path, stats in self.stats.items()}
+
+    def clear(self) -> None:
+        """Drop every cached model."""
+        with self.lock:
+            self.models.clear()
+            self.stats.clear()
+
+
+model_registry = ModelRegistry()  # Process-wide registry shared by every entity manager
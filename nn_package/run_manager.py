@@ -0,0 +1,195 @@
+"""Training run manager."""
+
+# -- Imports --
+
+import json
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import numpy as np
+import torch
+
+CHECKPOINT = "checkpoint.pth"  # Latest checkpoint inside a run directory
+METRICS = "metrics.jsonl"  # Summary log inside a run directory
+
+
+class MetricRing:
+    """Metric ring.
+
+    ## Description
+    Fixed size ring buffer of the latest step losses and accuracies.
+    Recording a step writes into preallocated arrays, nothing is formatted until a summary is asked for.
+    ## Attributes
+    ```
+    self.losses: np.ndarray # Loss of the latest steps
+    self.correct: np.ndarray # Correct predictions of the latest steps
+    self.examples: np.ndarray # Examples of the latest steps
+    self.index: int # Slot the next step is written to
+    self.count: int # Number of filled slots
+    ```
+    ## Methods
+    ```
+    add(self, loss: float, correct: int, examples: int) -> None # Record one step, overwriting the oldest when full
+    get_summary(self) -> dict[str, float] # Return the mean loss and accuracy over the buffered steps
+    ```
+    """
+
+    def __init__(self, size: int = 1000) -> None:
+        """Initialise metric ring."""
+        if size <= 0:
+            raise ValueError("size must be positive")
+        self.losses = np.zeros(size, dtype=np.float64)
+        self.correct = np.zeros(size, dtype=np.int64)
+        self.examples = np.zeros(size, dtype=np.int64)
+        self.index = 0
+        self.count = 0
+
+    def add(self, loss: float, correct: int, examples: int) -> None:
+        """Record one step, overwriting the oldest when full."""
+        self.losses[self.index] = loss
+        self.correct[self.index] = correct
+        self.examples[self.index] = examples
+        self.index = (self.index + 1) % len(self.losses)
+        self.count = min(self.count + 1, len(self.losses))
+
+    def get_summary(self) -> dict[str, float]:
+        """Return the mean loss and accuracy over the buffered steps."""
+        if self.count == 0:
+            return {"loss": 0.0, "accuracy": 0.0}
+        examples = self.examples[: self.count].sum()
+        return {
+            "loss": float(self.losses[: self.count].mean()),
+            "accuracy": float(self.correct[: self.count].sum() / examples) if examples else 0.0,
+        }
+
+
+class RunManager:
+    """Run manager.
+
+    ## Description
+    Looks after a training run kept in one directory: rolling step metrics, summaries flushed to `metrics.jsonl`,
+    model and optimizer checkpoints saved on a background thread, resuming and early stopping on a plateau.
+    ## Attributes
+    ```
+    self.directory: str # Run directory
+    self.checkpoint_every: int # Steps between checkpoints, 0 only checkpoints at the end of an epoch
+    self.summary_every: int # Steps between summaries
+    self.patience: int # Evaluations without improvement before stopping, 0 never stops early
+    self.min_delta: float # Smallest accuracy gain that counts as an improvement
+    self.metrics: MetricRing # Latest step metrics
+    self.best_accuracy: float # Best held-out accuracy so far
+    self.stale_evaluations: int # Evaluations since the best accuracy
+    self.executor: ThreadPoolExecutor # Background checkpoint writer
+    self.pending: Future | None # Checkpoint being written
+    ```
+    ## Methods
+    ```
+    record(self, step: int, loss: float, correct: int, examples: int) -> dict | None # Record a step and return a summary when one is due
+    checkpoint(self, step, epoch, model, optimizer, history) -> None # Save the run state in the background
+    resume(self, model, optimizer) -> dict | None # Load the latest checkpoint into the model and optimizer and return its run state
+    should_stop(self, accuracy: float) -> bool # Track the held-out accuracy and return True once it has plateaued
+    close(self) -> None # Wait for the last checkpoint to be written
+    ```
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        checkpoint_every: int = 1000,
+        summary_every: int = 100,
+        patience: int = 5,
+        min_delta: float = 0.001,
+        ring_size: int = 1000,
+    ) -> None:
+        """Initialise run manager."""
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory  # Run directory
+        self.checkpoint_every = checkpoint_every  # Steps between checkpoints
+        self.summary_every = summary_every  # Steps between summaries
+        self.patience = patience  # Evaluations without improvement before stopping
+        self.min_delta = min_delta  # Smallest accuracy gain that counts
+        self.metrics = MetricRing(ring_size)  # Latest step metrics
+        self.best_accuracy = 0.0
+        self.stale_evaluations = 0
+        self.executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="checkpoint"
+        )  # Background checkpoint writer
+        self.pending: Future | None = None
+        self.start = time.perf_counter()
+
+    def record(self, step: int, loss: float, correct: int, examples: int) -> dict | None:
+        """Record a step and return a summary when one is due, summaries are also appended to metrics.jsonl."""
+        self.metrics.add(loss, correct, examples)
+        if self.summary_every <= 0 or step % self.summary_every:
+            return None
+        summary = {
+            "step": step,
+            "elapsed": time.perf_counter() - self.start,
+            **self.metrics.get_summary(),
+        }
+        with open(os.path.join(self.directory, METRICS), "a") as file:
+            file.write(json.dumps(summary) + "\n")
+        return summary
+
+    def checkpoint(self, step: int, epoch: int, model, optimizer, history: list) -> None:
+        """Save the run state in the background, waiting for the previous checkpoint first."""
+        state = {
+            "model": {
+                name: tensor.detach().clone() for name, tensor in model.state_dict().items()
+            },  # Copied so training can carry on while it is written
+            "optimizer": clone_state(optimizer.state_dict()),
+            "step": step,
+            "epoch": epoch,
+            "best_accuracy": self.best_accuracy,
+            "stale_evaluations": self.stale_evaluations,
+            "history": list(history),
+        }
+        if self.pending is not None:
+            self.pending.result()  # At most one checkpoint in flight
+        self.pending = self.executor.submit(self.write_checkpoint, state)
+
+    def write_checkpoint(self, state: dict) -> None:
+        """Write a checkpoint to a temporary file then swap it in so a crash never leaves half a checkpoint."""
+        path = os.path.join(self.directory, CHECKPOINT)
+        torch.save(state, path + ".tmp")
+        os.replace(path + ".tmp", path)
+
+    def resume(self, model, optimizer) -> dict | None:
+        """Load the latest checkpoint into the model and optimizer and return its run state, None when there is none."""
+        path = os.path.join(self.directory, CHECKPOINT)
+        if not os.path.exists(path):
+            return None
+        state = torch.load(path, map_location="cpu")
+        model.load_state_dict(state["model"])
+        optimizer.load_state_dict(state["optimizer"])
+        self.best_accuracy = state["best_accuracy"]
+        self.stale_evaluations = state["stale_evaluations"]
+        return state
+
+    def should_stop(self, accuracy: float) -> bool:
+        """Track the held-out accuracy and return True once it has not improved for `patience` evaluations."""
+        if accuracy >= self.best_accuracy + self.min_delta:
+            self.best_accuracy = accuracy
+            self.stale_evaluations = 0
+        else:
+            self.stale_evaluations += 1
+        return 0 < self.patience <= self.stale_evaluations
+
+    def close(self) -> None:
+        """Wait for the last checkpoint to be written."""
+        if self.pending is not None:
+            self.pending.result()
+            self.pending = None
+        self.executor.shutdown()
+
+
+def clone_state(value):
+    """Return a copy of a nested state dict with every tensor cloned."""
+    if isinstance(value, torch.Tensor):
+        return value.detach().clone()
+    if isinstance(value, dict):
+        return {key: clone_state(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [clone_state(item) for item in value]
+    return value
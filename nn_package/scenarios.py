@@ -0,0 +1,63 @@
+"""Training scenarios."""
+
+# -- Imports --
+
+import random
+
+from generators_package.entity_generator import Player
+from managers_package.room_manager import RoomManager
+from nn_package.features import encode_features
+from nn_package.heuristic import score_features
+
+
+def score(game: RoomManager) -> list[int]:
+    """Algorthim that decides the best move using the provided rules based on agent health, enemy count in the current gamestate and the difference in levels between the player and agent."""
+    agent = game.entity_manager.Agents[0]
+    player = game.entity_manager.player
+    return score_features(
+        agent_health=agent.health,
+        enemy_count=game.enemy_count,
+        level_diff=player.level - agent.level,
+        player_visible=" P " in game.get_viewport(agent),
+        sound_grid=game.get_sound_window(agent),  # Gets the sound window
+    )
+
+
+def generate_room(debug, weapon_factory, item_factory) -> RoomManager:
+    """Build a random room with a weakened agent ready to be scored."""
+    game = RoomManager(
+        debugger=debug,
+        player=Player(debugger=debug, weapon=weapon_factory.create('fists'), inventory=[item_factory.create('None') for i in range(2)],level=random.randint(0, 10)),
+        dungeon_manager=None,
+        coordinates=(random.randint(0, 1000), random.randint(0, 1000)),
+        enemy_count=random.randint(1, 5),
+        level=0,
+        max_level=5,
+        doors=4,
+        weapon_factory=weapon_factory,
+        item_factory=item_factory
+    )
+    game.entity_manager.Agents[0].deal_damage(random.randint(0, 99))
+    game.reset_episode(set_player=False)
+    return game
+
+
+def get_example(game: RoomManager) -> tuple[list[float], int, int]:
+    """Return the NN input features, the score label and the score points of the first agent in a room."""
+    agent = game.entity_manager.Agents[0]
+    player = game.entity_manager.player
+    game.get_viewport(agent)
+    features = encode_features(
+        sound_grid=game.get_sound_window(agent),
+        fov_dict=agent.vision,
+        level_diff=player.level - agent.level,
+        agent_health=agent.health,
+        allied_agent_count=game.enemy_count,
+    )
+    label, points = score(game)
+    return features, label, points
+
+
+def generate_example(debug, weapon_factory, item_factory) -> tuple[list[float], int, int]:
+    """Build a random room around one agent and return its NN input features, the score label and the score points."""
+    return get_example(generate_room(debug, weapon_factory, item_factory))
@@ -0,0 +1,195 @@
+"""Trainer."""
+
+# -- Imports --
+
+import random
+import time
+
+import numpy as np
+import torch
+import torch.nn.functional
+from torch.utils.data import DataLoader, IterableDataset, get_worker_info
+
+from . import dataset
+from .features import FeatureSchema
+from .model import MovementNet
+
+
+def generate_holdout(rows: int, seed: int = 1_000_000) -> tuple[np.ndarray, np.ndarray]:
+    """Return the features and labels of `rows` freshly generated rooms, seeded so every run evaluates on the same set."""
+    from .scenarios import generate_example
+
+    if dataset.worker_context is None:
+        dataset.init_worker()
+    state = random.getstate()  # Do not disturb the caller's random stream
+    random.seed(seed)
+    features = np.empty((rows, FeatureSchema.WIDTH), dtype=np.float32)
+    labels = np.empty(rows, dtype=np.int64)
+    for row in range(rows):
+        features[row], labels[row], _ = generate_example(*dataset.worker_context)  # type: ignore
+    random.setstate(state)
+    return features, labels
+
+
+class ScenarioStream(IterableDataset):
+    """Scenario stream.
+
+    ## Description
+    Endless source of training rows generated on the fly from randomized rooms, used when no dataset has been pre-generated.
+    Each `DataLoader` worker generates its own share of an epoch with its own seed.
+    ## Attributes
+    ```
+    self.rows: int # Rows per epoch
+    self.seed: int # Base seed
+    self.epoch: int # Current epoch, changes the rooms generated
+    ```
+    ## Methods
+    ```
+    set_epoch(self, epoch: int) -> None # Generate a different set of rooms for the next epoch
+    __len__(self) -> int # Return the rows per epoch
+    __iter__(self) # Yield (features, label, points) rows
+    ```
+    """
+
+    def __init__(self, rows: int, seed: int = 0) -> None:
+        """Initialise scenario stream."""
+        self.rows = rows  # Rows per epoch
+        self.seed = seed  # Base seed
+        self.epoch = 0  # Current epoch
+
+    def set_epoch(self, epoch: int) -> None:
+        """Generate a different set of rooms for the next epoch."""
+        self.epoch = epoch
+
+    def __len__(self) -> int:
+        """Return the rows per epoch."""
+        return self.rows
+
+    def __iter__(self):
+        """Yield (features, label, points) rows."""
+        from .scenarios import generate_example
+
+        worker = get_worker_info()
+        worker_id, worker_count = (worker.id, worker.num_workers) if worker else (0, 1)
+        if dataset.worker_context is None:
+            dataset.init_worker()
+        caller_state = random.getstate()  # Do not disturb the caller's random stream
+        random.seed(self.seed * 1_000_003 + self.epoch * 1009 + worker_id)
+        state = random.getstate()
+        random.setstate(caller_state)
+        for _ in range(worker_id, self.rows, worker_count):  # This worker's share of the epoch
+            caller_state = random.getstate()  # The caller runs between rows when there are no workers
+            random.setstate(state)
+            features, label, points = generate_example(*dataset.worker_context)  # type: ignore
+            state = random.getstate()
+            random.setstate(caller_state)
+            yield np.asarray(features, dtype=np.float32), label, points
+
+
+def get_accuracy(model: MovementNet, features: np.ndarray, labels: np.ndarray) -> float:
+    """Return the fraction of rows where the model picks the labelled move."""
+    with torch.inference_mode():
+        predictions = model(torch.from_numpy(features)).argmax(dim=1).numpy()
+    return float((predictions == labels).mean())
+
+
+def train_policy(
+    model: MovementNet,
+    train_data,
+    holdout: tuple[np.ndarray, np.ndarray],
+    batch_size: int = 256,
+    learning_rate: float = 1e-3,
+    epochs: int = 20,
+    workers: int = 0,
+    target_accuracy: float | None = None,
+    log=print,
+    run=None,
+) -> dict:
+    """Train `model` on mini-batches of `train_data` (a ShardedDataset or ScenarioStream) and return the run's report.
+
+    Accuracy on `holdout` is measured after every epoch, training stops early once it reaches `target_accuracy` (0-1).
+    With a `RunManager` as `run` the run resumes from its latest checkpoint (restarting the epoch it was saved in),
+    checkpoints in the background and stops early once the held-out accuracy plateaus.
+    """
+    if batch_size <= 0 or learning_rate <= 0:
+        raise ValueError("batch_size and learning_rate must be positive")
+    streamed = isinstance(train_data, IterableDataset)
+    loader = DataLoader(
+        train_data,
+        batch_size=batch_size,
+        shuffle=not streamed,  # Streams are already random
+        num_workers=workers,
+    )
+    optimizer = torch.optim.Adam(model.parameters(), lr=learning_rate)
+    history = []
+    step = 0
+    first_epoch = 0
+    if run is not None and (state := run.resume(model, optimizer)) is not None:
+        step, first_epoch, history = state["step"], state["epoch"], state["history"]
+        log(f"Resumed from step {step} (epoch {first_epoch + 1})")
+    examples = 0
+    train_time = 0.0
+    time_to_target = None
+    start = time.perf_counter()
+    for epoch in range(first_epoch, epochs):
+        if streamed:
+            train_data.set_epoch(epoch)
+        model.train()
+        epoch_start = time.perf_counter()
+        total_loss = 0.0
+        batches = 0
+        for features, labels, _ in loader:
+            logits = model(features)
+            loss = torch.nn.functional.cross_entropy(logits, labels.long())
+            optimizer.zero_grad()
+            loss.backward()
+            optimizer.step()
+            total_loss += loss.item()
+            batches += 1
+            step += 1
+            examples += len(labels)
+            if run is not None:
+                summary = run.record(
+                    step, loss.item(), int((logits.argmax(dim=1) == labels).sum()), len(labels)
+                )
+                if summary is not None:
+                    log(
+                        f"Step {step} loss {summary['loss']:.4f} "
+                        f"training accuracy {summary['accuracy'] * 100:.2f}%"
+                    )
+                if run.checkpoint_every and step % run.checkpoint_every == 0:
+                    run.checkpoint(step, epoch, model, optimizer, history)
+        train_time += time.perf_counter() - epoch_start
+        model.eval()
+        accuracy = get_accuracy(model, *holdout)
+        history.append(
+            {
+                "epoch": epoch + 1,
+                "loss": total_loss / max(batches, 1),
+                "accuracy": accuracy,
+                "elapsed": time.perf_counter() - start,
+            }
+        )
+        log(
+            f"Epoch {epoch + 1}/{epochs} loss {history[-1]['loss']:.4f} "
+            f"held-out accuracy {accuracy * 100:.2f}%"
+        )
+        stop = run is not None and run.should_stop(accuracy)
+        if run is not None:
+            run.checkpoint(step, epoch + 1, model, optimizer, history)
+        if target_accuracy is not None and accuracy >= target_accuracy:
+            time_to_target = time.perf_counter() - start
+            break
+        if stop:
+            log(f"Held-out accuracy has not improved for {run.patience} epochs, stopping")
+            break
+    if run is not None:
+        run.close()  # Waits for the last checkpoint
+    model.eval()
+    return {
+        "history": history,
+        "examples": examples,
+        "examples_per_second": examples / train_time if train_time else 0.0,
+        "wall_time": time.perf_counter() - start,
+        "time_to_target": time_to_target,
+    }
@@ -2,6 +2,8 @@
 
 # -- Imports --
 
+import argparse
+import json
 import os
 import random
 import time
@@ -15,59 +17,12 @@ from colorama import Fore
 from generators_package.entity_generator import Player
 from managers_package.debug_manager import Debugger
 from managers_package.room_manager import RoomManager
-from nn_package.encoder import encode_inputs
+from nn_package.features import FeatureSchema
+from nn_package.scenarios import score
 from nn_package.model import MovementNet
 
 from factory_package.item_factory import WeaponFactory, ItemFactory
 
-def score(game: RoomManager) -> list[int]:
-    """Algorthim that decides the best move using the provided rules based on agent health, enemy count in the current gamestate and the difference in levels between the player and agent."""
-    score_value = 0
-    agent = game.entity_manager.Agents[0]
-    player = game.entity_manager.player
-
-    if (
-        agent.health >= 80
-    ):  # When an entity has a high amount of health it will be more confident
-        score_value += 50
-    elif 50 <= agent.health < 80:
-        score_value += 40
-    else:
-        score_value -= 60  # If weak then the enemy will be more scared
-    if (
-        game.enemy_count == 1
-    ):  # If there is lots of allies for the entity it will be more confident
-        score_value -= 30
-    elif 2 <= game.enemy_count < 4:
-        score_value += 30
-    elif game.enemy_count >= 4:
-        score_value += 50
-
-    level_diff = player.level - agent.level
-    if level_diff <= 5:
-        score_value += 40
-    else:
-        score_value -= 40
-
-    if " P " in game.get_viewport(
-        agent
-    ):  # If the entity can see the player and is confident it will attack more otherwise it will run away
-        if score_value > 60:
-            score_value += 100
-        else:
-            score_value -= 150
-
-    s = game.get_sound_window(agent)  # Gets the sound window
-    if score_value >= 50:  # If confident then go to the largest sound intentisty
-        i = s.index(max(s))
-        return [i, score_value]  #
-    else:  # Otherwise go to the minimum sound intensity
-        abs_s = []
-        for sound in s:
-            abs_s.append(abs(sound))
-        i = s.index(min(abs_s))
-        return [i, score_value]
-
 
 # --- TESTING ---
 
@@ -106,7 +61,7 @@ def test_model(weapon_factory, item_factory):
 
         game.reset_episode(set_player=False)  # Sets up the game state
         game.get_viewport(agent)  # Gets what the entity can see
-        input_tensor = encode_inputs(
+        input_tensor = feature_schema.encode(
             sound_grid=game.get_sound_window(agent),
             fov_dict=agent.vision,
             level_diff=player.level - agent.level,
@@ -119,7 +74,8 @@ def test_model(weapon_factory, item_factory):
         m = int(torch.argmax(output, dim=1).item())  # Model result
         move_label = directions[label]
         move_model = directions[m]
-        while game.map[agent.pos[0] + move_model[1]][agent.pos[1] + move_model[0]] in [
+        room_map = game.get_glyphs()  # Drawn once, the moves are marked on it
+        while room_map[agent.pos[0] + move_model[1]][agent.pos[1] + move_model[0]] in [
             " # ",
             " / ",
         ]:
@@ -128,13 +84,13 @@ def test_model(weapon_factory, item_factory):
             m = int(torch.argmax(output, dim=1).item())
             move_label = directions[label]
             move_model = directions[m]
-        game.map[agent.pos[0] + move_label[1]][
+        room_map[agent.pos[0] + move_label[1]][
             agent.pos[1] + move_label[0]
         ] = " A "  # Algorithm label (ideal move)
-        game.map[agent.pos[0] + move_model[1]][
+        room_map[agent.pos[0] + move_model[1]][
             agent.pos[1] + move_model[0]
         ] = " M "  # Model label (attempts to replicated ideal move)
-        for row in game.map:
+        for row in room_map:
             print(row)  # Shows the output of the model vs the ideal movement
         print(points, directions[m], directions[label])  # Debug info
         print(game.get_sound_window(agent))  # Debug info
@@ -172,13 +128,13 @@ def train_model(desired_accuracy, min_step, log, max_train, name, debug, weapon_
         game.reset_episode(set_player=False)
         game.get_viewport(agent)
 
-        input_tensor = encode_inputs(
+        input_tensor = feature_schema.encode(
             sound_grid=game.get_sound_window(agent),
             fov_dict=agent.vision,
             level_diff=player.level - agent.level,
             agent_health=agent.health,
             allied_agent_count=game.enemy_count,
-        )
+        )  # Reuses the same buffer every step
         label, points = score(game)
         label_tensor = torch.tensor([label], dtype=torch.long)
         output = model(input_tensor)
@@ -232,7 +188,113 @@ def train_model(desired_accuracy, min_step, log, max_train, name, debug, weapon_
             print(f"Saved model under nn_package/{name}.pth!")
 
 
+def run_training(args):
+    """Train a policy on mini-batches without any prompts and save it."""
+    from nn_package.dataset import ShardedDataset
+    from nn_package.run_manager import RunManager
+    from nn_package.trainer import ScenarioStream, generate_holdout, train_policy
+
+    random.seed(args.seed)
+    torch.manual_seed(args.seed)
+    model = MovementNet()
+    if args.load:
+        model.load_state_dict(torch.load(f"nn_package/{args.load}.pth"))
+    train_data = (
+        ShardedDataset(args.data) if args.data else ScenarioStream(args.rows, seed=args.seed)
+    )  # Pre-generated shards or rooms generated by the loader workers
+    holdout = generate_holdout(args.holdout)
+    run = (
+        RunManager(
+            args.run_dir,
+            checkpoint_every=args.checkpoint_every,
+            summary_every=args.summary_every,
+            patience=args.patience,
+        )
+        if args.run_dir
+        else None
+    )  # Checkpoints, resuming and early stopping
+    report = train_policy(
+        model,
+        train_data,
+        holdout,
+        batch_size=args.batch_size,
+        learning_rate=args.lr,
+        epochs=args.epochs,
+        workers=args.workers,
+        target_accuracy=args.target_accuracy / 100 if args.target_accuracy else None,
+        run=run,
+    )
+    if report["time_to_target"] is not None:
+        print(f"Time taken to train to {args.target_accuracy}%: {report['time_to_target']:.3f}s")
+    print(f"{report['examples_per_second']:.0f} examples/s, {report['wall_time']:.3f}s in total")
+    if args.save:
+        torch.save(model.state_dict(), f"nn_package/{args.save}.pth")
+        print(f"Saved model under nn_package/{args.save}.pth!")
+    if args.report:
+        with open(args.report, "w") as file:
+            json.dump(report, file, indent=4)
+
+
+def run_evaluation(args):
+    """Evaluate model files on the same seeded suite of rooms and print the results as JSON."""
+    from nn_package.evaluation import backend_for, build_suite, evaluate_policy
+    from nn_package.registry import model_registry
+
+    suite = build_suite(args.rooms, args.seed)
+    results = {
+        "rooms": args.rooms,
+        "seed": args.seed,
+        "models": {
+            path: evaluate_policy(model_registry.load(path, backend_for(path)), suite)
+            for path in args.models
+        },
+    }
+    output = json.dumps(results, indent=4)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(output)
+    print(output)
+
+
+def parse_args():
+    """Parse the command line, no mode runs the interactive prompts."""
+    parser = argparse.ArgumentParser(description="Train or test the enemy movement network")
+    modes = parser.add_subparsers(dest="mode")
+    train = modes.add_parser("train", help="Train with mini-batches without any prompts")
+    train.add_argument("--data", help="Dataset directory made by nn_package.dataset (default: generate rooms on the fly)")
+    train.add_argument("--rows", type=int, default=50_000, help="Rooms generated per epoch without --data")
+    train.add_argument("--batch-size", type=int, default=256)
+    train.add_argument("--lr", type=float, default=1e-3, help="Learning rate")
+    train.add_argument("--epochs", type=int, default=20)
+    train.add_argument("--workers", type=int, default=2, help="DataLoader worker processes")
+    train.add_argument("--holdout", type=int, default=2000, help="Held-out rooms evaluated after every epoch")
+    train.add_argument("--target-accuracy", type=float, default=None, help="Stop once the held-out accuracy reaches this percentage")
+    train.add_argument("--load", help="Model in nn_package to continue training")
+    train.add_argument("--save", help="Name to save the model under in nn_package")
+    train.add_argument("--report", help="Write the per-epoch report to this JSON file")
+    train.add_argument("--seed", type=int, default=0)
+    train.add_argument("--run-dir", help="Keep checkpoints and metrics here and resume from the latest checkpoint")
+    train.add_argument("--checkpoint-every", type=int, default=1000, help="Steps between background checkpoints")
+    train.add_argument("--summary-every", type=int, default=100, help="Steps between metric summaries")
+    train.add_argument("--patience", type=int, default=5, help="Epochs without improvement before stopping (0 never stops)")
+    evaluate = modes.add_parser("evaluate", help="Score model files against the heuristic on seeded rooms and print JSON")
+    evaluate.add_argument("models", nargs="+", help="Model files (.pth, .npz or _int8.npz)")
+    evaluate.add_argument("--rooms", type=int, default=1000, help="Rooms in the suite")
+    evaluate.add_argument("--seed", type=int, default=0, help="Seed of the suite")
+    evaluate.add_argument("--output", help="Also write the JSON to this file")
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
+    args = parse_args()
+    match args.mode:
+        case "train":
+            run_training(args)
+            quit()
+        case "evaluate":
+            run_evaluation(args)
+            quit()
+
     model = MovementNet()
     load_choice = input("Load existing model? (y/n) \n-> ").lower()
     debug = Debugger("Trainer")
@@ -248,6 +310,7 @@ if __name__ == "__main__":
         model.eval()
         print(f"Model loaded from nn_oackage/{model_path}")
 
+    feature_schema = FeatureSchema(capacity=1, backend="torch")  # Shared NN input buffer
     criterion = nn.CrossEntropyLoss()
     optimizer = optim.Adam(model.parameters(), lr=1e-3)
 